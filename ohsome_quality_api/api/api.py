@@ -1,7 +1,11 @@
+import asyncio
 import json
+import logging
 import os
-from collections.abc import AsyncIterator
+import signal
+from collections.abc import AsyncIterator, Iterable
 from typing import Any, Union
+from uuid import UUID
 
 from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.concurrency import asynccontextmanager
@@ -13,7 +17,7 @@ from fastapi.openapi.docs import (
     get_swagger_ui_html,
     get_swagger_ui_oauth2_redirect_html,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi_i18n import i18n
 from geojson import FeatureCollection
 from pydantic import ValidationError
@@ -27,39 +31,55 @@ from ohsome_quality_api import (
     __version__,
     main,
 )
+from ohsome_quality_api.api.coverage_cache import (
+    SimplifyLevel,
+    etag_matches,
+    get_coverage_response,
+)
+from ohsome_quality_api.api.jobs import (
+    Job,
+    create_job_queue_for_lifespan,
+    get_job_queue,
+)
 from ohsome_quality_api.api.request_context import set_request_context
 from ohsome_quality_api.api.request_models import (
     AttributeCompletenessFilterRequest,
     AttributeCompletenessKeyRequest,
     IndicatorDataRequest,
     IndicatorRequest,
+    IndicatorsRequest,
     LandCoverThematicAccuracyRequest,
     RoadsThematicAccuracyRequest,
 )
 from ohsome_quality_api.api.response_models import (
     AttributeMetadataResponse,
+    CompIndicator,
+    IndicatorFeature,
     IndicatorGeoJSONResponse,
     IndicatorJSONResponse,
     IndicatorMetadataCoverageResponse,
     IndicatorMetadataResponse,
+    JobResponse,
     MetadataResponse,
     ProjectMetadataResponse,
     QualityDimensionMetadataResponse,
     TopicMetadataResponse,
 )
 from ohsome_quality_api.attributes.definitions import get_attributes, load_attributes
+from ohsome_quality_api.config import reload_config
 from ohsome_quality_api.definitions import ATTRIBUTION_URL
 from ohsome_quality_api.geodatabase.client import (
     create_pool_for_lifespan,
     set_pool_for_request,
 )
+from ohsome_quality_api.indicators.base import BaseIndicator as Indicator
 from ohsome_quality_api.indicators.definitions import (
     IndicatorEnum,
     IndicatorEnumRequest,
-    get_coverage,
     get_indicator,
     get_indicator_metadata,
 )
+from ohsome_quality_api.ohsome_api import client as ohsome_api_client
 from ohsome_quality_api.projects.definitions import (
     ProjectEnum,
     get_project,
@@ -75,6 +95,7 @@ from ohsome_quality_api.topics.definitions import (
     get_topic_preset,
     get_topic_presets,
 )
+from ohsome_quality_api.topics.models import Topic
 from ohsome_quality_api.utils.exceptions import (
     OhsomeApiError,
     SizeRestrictionError,
@@ -85,14 +106,34 @@ from ohsome_quality_api.utils.helper import (
     get_project_root,
     json_serialize,
 )
+from ohsome_quality_api.utils.helper_asyncio import (
+    get_coalescing,
+    get_occupancy,
+    share_calls,
+)
+from ohsome_quality_api.utils.helper_executor import create_executor_for_lifespan
+from ohsome_quality_api.utils.helper_http import create_client_for_lifespan
+
+logger = logging.getLogger(__name__)
 
 MEDIA_TYPE_GEOJSON = "application/geo+json"
 MEDIA_TYPE_JSON = "application/json"
+MEDIA_TYPE_NDJSON = "application/x-ndjson"
+MEDIA_TYPE_GEOJSON_SEQ = "application/geo+json-seq"
+MEDIA_TYPES = (
+    MEDIA_TYPE_JSON,
+    MEDIA_TYPE_GEOJSON,
+    MEDIA_TYPE_NDJSON,
+    MEDIA_TYPE_GEOJSON_SEQ,
+)
+# Record separator of GeoJSON Text Sequences (RFC 8142)
+RECORD_SEPARATOR = "\x1e"
 STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
 
 TAGS_METADATA = [
     {"name": "indicator", "description": "Request an Indicator"},
     {"name": "metadata", "description": "Request Metadata"},
+    {"name": "job", "description": "Compute an Indicator asynchronously"},
 ]
 
 DEFAULT_PROJECT = ProjectEnum.core
@@ -112,7 +153,16 @@ if "FASTAPI_I18N__LOCALE_DIR" not in os.environ:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    async with create_pool_for_lifespan(app):
+    # Reload configuration on SIGHUP (not available on Windows)
+    if hasattr(signal, "SIGHUP"):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_config)
+    async with (
+        create_executor_for_lifespan(app),
+        create_pool_for_lifespan(app),
+        create_job_queue_for_lifespan(app),
+        # TODO: remove `unverified` to verify SSL certificate
+        create_client_for_lifespan(app, unverified=(ohsome_api_client.BASE_URL,)),
+    ):
         yield
 
 
@@ -174,6 +224,12 @@ async def redoc_html(request: Request):
     )
 
 
+@app.get("/occupancy", include_in_schema=False)
+async def occupancy():
+    """Current occupancy of concurrency budgets and coalesced calls for monitoring."""
+    return {"result": get_occupancy(), "coalescing": get_coalescing()}
+
+
 class CustomJSONResponse(JSONResponse):
     def render(self, content):
         return json.dumps(content, default=json_serialize).encode()
@@ -361,11 +417,76 @@ async def post_indicator(
     return await _post_indicator(request, key.value, parameters)
 
 
+@app.post(
+    "/indicators",
+    tags=["indicator"],
+    response_model=Union[IndicatorJSONResponse, IndicatorGeoJSONResponse],
+    responses={
+        200: {
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/IndicatorJSONResponse"}
+                },
+                "application/geo+json": {
+                    "schema": {"$ref": "#/components/schemas/IndicatorGeoJSONResponse"}
+                },
+            },
+        },
+    },
+)
+async def post_indicators(request: Request, parameters: IndicatorsRequest) -> Any:
+    """Request multiple indicators for your area of interest at once.
+
+    Identical requests to the ohsome API and databases are only made once for all
+    indicators. Only requests with the same parameters are shared: Mapping
+    Saturation, Currentness and User Activity query different time series and share
+    only the metadata of the ohsome API. Attribute Completeness is not available,
+    since it needs attributes as additional parameter.
+    """
+    media_type = _get_media_type(request, (MEDIA_TYPE_JSON, MEDIA_TYPE_GEOJSON))
+    topic, parameters_ = _get_topic(parameters)
+    keys = parameters_.pop("indicator_keys")
+    with share_calls():
+        results = await asyncio.gather(
+            *(
+                main.create_indicator(key=key, topic=topic, **parameters_)
+                for key in keys
+            )
+        )
+    return _indicator_response(
+        [indicator for indicators in results for indicator in indicators],
+        media_type,
+    )
+
+
 async def _post_indicator(
     request: Request,
     key: str,
     parameters: IndicatorRequest,
 ) -> Any:
+    topic, parameters_ = _get_topic(parameters)
+    if request.headers["accept"] in (MEDIA_TYPE_NDJSON, MEDIA_TYPE_GEOJSON_SEQ):
+        return await _stream_response(
+            main.create_indicator_stream(key=key, topic=topic, **parameters_),
+            request.headers["accept"],
+        )
+    indicators = await main.create_indicator(key=key, topic=topic, **parameters_)
+    return _indicator_response(indicators, _get_media_type(request))
+
+
+def _get_media_type(request: Request, media_types: Iterable[str] = MEDIA_TYPES) -> str:
+    media_type = request.headers["accept"]
+    if media_type not in media_types:
+        detail = "Content-Type needs to be one of: {0}".format(", ".join(media_types))
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=detail,
+        )
+    return media_type
+
+
+def _get_topic(parameters: IndicatorRequest) -> tuple[Topic, dict]:
+    """Get topic from request parameters. Return topic and remaining parameters."""
     parameters_ = dict(parameters)
     topic_key = parameters_.pop("topic").value
     topic_filter = parameters_.pop("topic_filter")
@@ -378,35 +499,186 @@ async def _post_indicator(
         except ValidationError as error:
             raise RequestValidationError(errors=error.errors()) from error
         topic.name = topic_name
+    return topic, parameters_
 
-    indicators = await main.create_indicator(key=key, topic=topic, **parameters_)
 
-    if request.headers["accept"] == MEDIA_TYPE_JSON:
+def _indicator_response(indicators: list[Indicator], media_type: str) -> dict:
+    # Attribution of each distinct indicator class
+    attribution = "; ".join(dict.fromkeys(i.attribution() for i in indicators))
+    if media_type == MEDIA_TYPE_JSON:
         return {
             "result": [i.as_dict(exclude_label=True) for i in indicators],
             "attribution": {
                 "url": ATTRIBUTION_URL,
-                "text": indicators[0].attribution(),
+                "text": attribution,
             },
         }
-    elif request.headers["accept"] == MEDIA_TYPE_GEOJSON:
-        return {
-            "type": "FeatureCollection",
-            "features": [i.as_feature(exclude_label=True) for i in indicators],
-            "attribution": {
-                "url": ATTRIBUTION_URL,
-                "text": indicators[0].attribution(),
-            },
+    return {
+        "type": "FeatureCollection",
+        "features": [i.as_feature(exclude_label=True) for i in indicators],
+        "attribution": {
+            "url": ATTRIBUTION_URL,
+            "text": attribution,
+        },
+    }
+
+
+async def _stream_response(
+    indicators: AsyncIterator[Indicator],
+    media_type: str,
+) -> StreamingResponse:
+    """Stream indicators in order of completion, one record per indicator.
+
+    The first indicator is awaited before the response is started. Errors until then
+    are answered with an error response as usual. Later errors end the stream with an
+    error record.
+    """
+    first = await anext(indicators, None)
+
+    async def encode() -> AsyncIterator[bytes]:
+        try:
+            if first is not None:
+                yield _encode_record(first, media_type)
+            async for indicator in indicators:
+                yield _encode_record(indicator, media_type)
+        except Exception as error:
+            logger.exception("Streaming of indicators failed.")
+            yield _encode_error_record(error, media_type)
+        finally:
+            await indicators.aclose()
+
+    return StreamingResponse(encode(), media_type=media_type)
+
+
+def _encode_record(indicator: Indicator, media_type: str) -> bytes:
+    """Encode indicator as line of NDJSON or as record of a GeoJSON Text Sequence."""
+    if media_type == MEDIA_TYPE_NDJSON:
+        record = CompIndicator.model_validate(indicator.as_dict(exclude_label=True))
+        return (record.model_dump_json(by_alias=True) + "\n").encode()
+    record = IndicatorFeature.model_validate(indicator.as_feature(exclude_label=True))
+    return (RECORD_SEPARATOR + record.model_dump_json(by_alias=True) + "\n").encode()
+
+
+def _encode_error_record(error: Exception, media_type: str) -> bytes:
+    """Encode error in the same form as error responses."""
+    record = json.dumps(
+        {
+            "apiVersion": __version__,
+            "type": getattr(error, "name", type(error).__name__),
+            "detail": [{"msg": getattr(error, "message", str(error))}],
         }
+    )
+    if media_type == MEDIA_TYPE_NDJSON:
+        return (record + "\n").encode()
+    return (RECORD_SEPARATOR + record + "\n").encode()
+
+
+@app.post(
+    "/jobs/indicators/{key}",
+    tags=["job"],
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobResponse,
+)
+async def post_indicator_job(
+    request: Request,
+    response: Response,
+    key: IndicatorEnumRequest,
+    parameters: IndicatorRequest,
+) -> Any:
+    """Submit a job computing an indicator for your area of interest.
+
+    Use for large FeatureCollections. The result is available at
+    `/jobs/{id}/result` once the job has succeeded.
+    """
+    media_type = _get_media_type(request, (MEDIA_TYPE_JSON, MEDIA_TYPE_GEOJSON))
+    topic, parameters_ = _get_topic(parameters)
+    if media_type == MEDIA_TYPE_JSON:
+        response_model = IndicatorJSONResponse
     else:
-        detail = "Content-Type needs to be either {0} or {1}".format(
-            MEDIA_TYPE_JSON,
-            MEDIA_TYPE_GEOJSON,
+        response_model = IndicatorGeoJSONResponse
+
+    async def run(job: Job) -> bytes:
+        indicators = await main.create_indicator(
+            key=key.value,
+            topic=topic,
+            progress=lambda indicators: job.progress(len(indicators)),
+            **parameters_,
+        )
+        content = _indicator_response(indicators, media_type)
+        response_ = response_model.model_validate(content)
+        return response_.model_dump_json(by_alias=True).encode()
+
+    try:
+        job = get_job_queue().submit(
+            key.value,
+            len(parameters.bpolys.features),
+            run,
+            media_type,
         )
+    except asyncio.QueueFull as error:
         raise HTTPException(
-            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            detail=detail,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job queue is full. Please try again later.",
+        ) from error
+    response.headers["Location"] = str(request.url_for("get_job", job_id=job.id))
+    return {"result": job.as_dict()}
+
+
+@app.get("/jobs/{job_id}", tags=["job"], response_model=JobResponse)
+async def get_job(job_id: UUID) -> Any:
+    """Get status and progress of a job."""
+    return {"result": _get_job(job_id).as_dict()}
+
+
+@app.get(
+    "/jobs/{job_id}/result",
+    tags=["job"],
+    response_model=Union[IndicatorJSONResponse, IndicatorGeoJSONResponse],
+    responses={
+        200: {
+            "content": {
+                "application/json": {
+                    "schema": {"$ref": "#/components/schemas/IndicatorJSONResponse"}
+                },
+                "application/geo+json": {
+                    "schema": {"$ref": "#/components/schemas/IndicatorGeoJSONResponse"}
+                },
+            },
+        },
+    },
+)
+async def get_job_result(job_id: UUID) -> Response:
+    """Get result of a succeeded job."""
+    job = _get_job(job_id)
+    result = get_job_queue().result(job.id)
+    if job.status != "succeeded" or result is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Job has not succeeded. Status: {0}".format(job.status),
+        )
+    return Response(content=result, media_type=job.media_type)
+
+
+@app.delete("/jobs/{job_id}", tags=["job"], response_model=JobResponse)
+async def delete_job(job_id: UUID) -> Any:
+    """Cancel a job. Delete the result of a finished job."""
+    job = await get_job_queue().cancel(str(job_id))
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found: {0}".format(job_id),
         )
+    return {"result": job.as_dict()}
+
+
+def _get_job(job_id: UUID) -> Job:
+    job = get_job_queue().get(str(job_id))
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found: {0}".format(job_id),
+        )
+    return job
 
 
 @app.get("/metadata", tags=["metadata"], response_model=MetadataResponse)
@@ -521,8 +793,22 @@ async def metadata_indicators_by_key(key: IndicatorEnum) -> Any:
     response_model=IndicatorMetadataCoverageResponse,
 )
 async def metadata_indicators_coverage(
+    request: Request,
     key: IndicatorEnum,
     inverse: bool = False,
+    simplify: SimplifyLevel = SimplifyLevel.none,
 ) -> Any:
-    """Get coverage geometry of an indicator by key."""
-    return await get_coverage(key.value, inverse)
+    """Get coverage geometry of an indicator by key.
+
+    Geometries can be simplified for map display with `simplify` (0: none to 3: high).
+    """
+    encoded = await get_coverage_response(key.value, inverse, simplify)
+    headers = {"ETag": encoded.etag, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), encoded.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        body = encoded.body_gzip
+    else:
+        body = encoded.body
+    return Response(content=body, media_type=MEDIA_TYPE_JSON, headers=headers)
@@ -0,0 +1,137 @@
+"""Cache of encoded responses of the coverage endpoint.
+
+Coverage geometries of indicators are large and change only with a new import of the
+reference datasets. Responses are encoded as JSON and compressed once per indicator,
+inverse flag and simplification level. They are cached for `coverage_cache_ttl`
+seconds. The ETag of a response is the hash of its body.
+"""
+
+import gzip
+import hashlib
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+
+from geojson import Feature, FeatureCollection
+
+from ohsome_quality_api.api.response_models import IndicatorMetadataCoverageResponse
+from ohsome_quality_api.config import get_config_value
+from ohsome_quality_api.indicators.definitions import get_coverage
+from ohsome_quality_api.utils.helper_asyncio import SingleFlight
+from ohsome_quality_api.utils.helper_executor import run_cpu_bound
+from ohsome_quality_api.utils.helper_geo import simplify
+
+
+class SimplifyLevel(IntEnum):
+    """Simplification level of coverage geometries.
+
+    Higher levels return lighter geometries (e.g. for map display).
+    """
+
+    none = 0
+    low = 1
+    medium = 2
+    high = 3
+
+
+# Tolerance of the Douglas-Peucker algorithm in degree
+TOLERANCES = {
+    SimplifyLevel.none: None,
+    SimplifyLevel.low: 0.001,
+    SimplifyLevel.medium: 0.01,
+    SimplifyLevel.high: 0.1,
+}
+
+
+@dataclass(frozen=True)
+class EncodedResponse:
+    body: bytes
+    body_gzip: bytes
+    etag: str
+
+
+class CoverageCache:
+    """Process-wide cache of encoded coverage responses.
+
+    Concurrent callers await one in-flight encoding per key.
+    """
+
+    def __init__(self) -> None:
+        self.responses: dict[tuple, tuple[EncodedResponse, float]] = {}
+        # Encoded responses are immutable and can be shared
+        self.single_flight = SingleFlight("coverage", copy_result=lambda r: r)
+
+    async def get(
+        self,
+        key: str,
+        inverse: bool,
+        level: SimplifyLevel,
+        ttl: float,
+    ) -> EncodedResponse:
+        cache_key = (key, inverse, level)
+        cached = self.responses.get(cache_key)
+        if cached is not None and time.monotonic() - cached[1] < ttl:
+            return cached[0]
+        response = await self.single_flight.do(
+            cache_key, build_response, key, inverse, level
+        )
+        if ttl > 0:
+            self.responses[cache_key] = (response, time.monotonic())
+        return response
+
+    def clear(self) -> None:
+        self.responses.clear()
+
+
+COVERAGE_CACHE = CoverageCache()
+
+
+async def get_coverage_response(
+    key: str,
+    inverse: bool = False,
+    level: SimplifyLevel = SimplifyLevel.none,
+) -> EncodedResponse:
+    """Get encoded coverage of an indicator (see `CoverageCache`)."""
+    ttl = get_config_value("coverage_cache_ttl")
+    return await COVERAGE_CACHE.get(key, inverse, level, ttl)
+
+
+async def build_response(
+    key: str,
+    inverse: bool,
+    level: SimplifyLevel,
+) -> EncodedResponse:
+    feature_collection = await get_coverage(key, inverse)
+    # Simplification, validation and compression of large geometries are CPU-bound
+    return await run_cpu_bound(encode, feature_collection, TOLERANCES[level])
+
+
+def encode(
+    feature_collection: FeatureCollection,
+    tolerance: float | None = None,
+) -> EncodedResponse:
+    if tolerance is not None:
+        feature_collection = FeatureCollection(
+            features=[
+                Feature(
+                    geometry=simplify(feature["geometry"], tolerance),
+                    properties=feature["properties"],
+                )
+                for feature in feature_collection["features"]
+            ]
+        )
+    response = IndicatorMetadataCoverageResponse.model_validate(feature_collection)
+    body = response.model_dump_json(by_alias=True).encode()
+    return EncodedResponse(
+        body=body,
+        body_gzip=gzip.compress(body),
+        etag='"{0}"'.format(hashlib.sha256(body).hexdigest()),
+    )
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check if ETag matches any entity tag of an `If-None-Match` header."""
+    if if_none_match is None:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
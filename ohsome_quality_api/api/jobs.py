@@ -0,0 +1,317 @@
+"""Asynchronous jobs for long-running indicator computations.
+
+Computing indicators for large FeatureCollections can take longer than clients and
+proxies are willing to wait for a response. Such computations are submitted as jobs
+instead. Jobs are queued in a bounded queue per process and computed by
+`job_workers` workers. Progress is reported per feature (see `main.create_indicator`).
+
+Results of finished jobs are stored as JSON files in the data directory and survive
+restarts. They are deleted `job_ttl` seconds after the job has finished. Queued and
+running jobs are kept in memory only.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import AsyncIterator, Awaitable, Callable, Literal
+
+from fastapi import FastAPI
+
+from ohsome_quality_api.config import get_config_value
+from ohsome_quality_api.utils.helper import json_serialize
+
+logger = logging.getLogger(__name__)
+
+DIRNAME = "jobs"
+# Seconds between clean ups of expired jobs
+CLEAN_UP_INTERVAL = 60 * 60
+
+JOB_QUEUE: "JobQueue | None" = None
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+@dataclass
+class Job:
+    """Job computing indicators for all features of a FeatureCollection.
+
+    Args:
+        run: Coroutine function computing the job. It receives the job to report
+            progress and returns the serialized result.
+    """
+
+    key: str
+    total: int
+    run: Callable[["Job"], Awaitable[bytes]] | None = field(default=None, repr=False)
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: JobStatus = "queued"
+    done: int = 0
+    media_type: str = "application/json"
+    error: dict | None = None
+    created: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished: datetime | None = None
+    # Context of the request the job has been submitted by (e.g. locale)
+    context: contextvars.Context = field(
+        default_factory=contextvars.copy_context,
+        repr=False,
+    )
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ("succeeded", "failed", "cancelled")
+
+    def progress(self, count: int) -> None:
+        self.done = min(self.done + count, self.total)
+
+    def as_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "key": self.key,
+            "status": self.status,
+            "progress": {"done": self.done, "total": self.total},
+            "media_type": self.media_type,
+            "error": self.error,
+            "created": self.created,
+            "finished": self.finished,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "Job":
+        return cls(
+            id=raw["id"],
+            key=raw["key"],
+            status=raw["status"],
+            done=raw["progress"]["done"],
+            total=raw["progress"]["total"],
+            media_type=raw["media_type"],
+            error=raw["error"],
+            created=datetime.fromisoformat(raw["created"]),
+            finished=datetime.fromisoformat(raw["finished"]),
+        )
+
+
+class JobQueue:
+    """Bounded queue of jobs computed by a fixed number of workers.
+
+    Workers are started on first submission in the running event loop.
+
+    Args:
+        size: Maximal number of queued jobs.
+        workers: Number of jobs computed concurrently.
+        path: Directory results of finished jobs are stored in.
+        ttl: Seconds finished jobs and their results are kept. `0` keeps them forever.
+    """
+
+    def __init__(self, size: int, workers: int, path: str, ttl: float = 0) -> None:
+        self.size = size
+        self.worker_count = workers
+        self.path = path
+        self.ttl = ttl
+        self.jobs: dict[str, Job] = {}
+        self.queue: asyncio.Queue[Job] | None = None
+        self.workers: list[asyncio.Task] = []
+
+    def submit(
+        self,
+        key: str,
+        total: int,
+        run: Callable[[Job], Awaitable[bytes]],
+        media_type: str,
+    ) -> Job:
+        """Queue a new job. Raise `asyncio.QueueFull` if the queue is full."""
+        self._start()
+        job = Job(key=key, total=total, run=run, media_type=media_type)
+        self.queue.put_nowait(job)
+        self.jobs[job.id] = job
+        return job
+
+    def get(self, id_: str) -> Job | None:
+        """Get unfinished job from memory or finished job from disk."""
+        job = self.jobs.get(id_)
+        if job is not None:
+            return job
+        try:
+            with open(self._path(id_), "r") as file:
+                return Job.from_dict(json.load(file))
+        except FileNotFoundError:
+            return None
+
+    def result(self, id_: str) -> bytes | None:
+        """Get serialized result of a succeeded job."""
+        try:
+            with open(self._path(id_, "result"), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    async def cancel(self, id_: str) -> Job | None:
+        """Cancel unfinished job. Delete stored job and result of finished job."""
+        job = self.jobs.get(id_)
+        if job is None:
+            job = self.get(id_)
+            if job is not None:
+                for suffix in ("json", "result"):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(self._path(id_, suffix))
+            return job
+        if job.task is None:
+            # Job is still queued. The worker skips it.
+            job.status = "cancelled"
+            await self._finish(job, "cancelled")
+        elif job.run is None:
+            # Job has finished and is being stored
+            await asyncio.wait([job.task])
+        else:
+            job.task.cancel()
+            await asyncio.wait([job.task])
+        return job
+
+    async def clean_up(self) -> None:
+        """Delete stored jobs and results which have expired."""
+        if self.ttl > 0:
+            await asyncio.to_thread(self._clean_up, time.time() - self.ttl)
+
+    async def close(self) -> None:
+        """Cancel workers and running jobs."""
+        tasks = [job.task for job in self.jobs.values() if job.task is not None]
+        tasks.extend(self.workers)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.jobs.clear()
+        self.workers = []
+        self.queue = None
+
+    def _start(self) -> None:
+        """Start workers (again) if not running in the current event loop."""
+        loop = asyncio.get_running_loop()
+        if self.queue is not None and all(
+            not w.done() and w.get_loop() is loop for w in self.workers
+        ):
+            return
+        # Unfinished jobs of a previous event loop will never be run
+        self.jobs.clear()
+        self.queue = asyncio.Queue(maxsize=self.size)
+        self.workers = [
+            loop.create_task(self._work()) for _ in range(self.worker_count)
+        ]
+
+    async def _work(self) -> None:
+        while True:
+            job = await self.queue.get()
+            try:
+                if job.status == "queued":
+                    # Run job in its own task to be able to cancel it
+                    job.task = asyncio.create_task(self._run(job), context=job.context)
+                    await asyncio.wait([job.task])
+            finally:
+                self.queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = "running"
+        try:
+            result = await job.run(job)
+        except asyncio.CancelledError:
+            await self._finish(job, "cancelled")
+            raise
+        except Exception as error:
+            logger.exception("Job {0} failed.".format(job.id))
+            job.error = {
+                "type": getattr(error, "name", type(error).__name__),
+                "detail": [{"msg": getattr(error, "message", str(error))}],
+            }
+            await self._finish(job, "failed")
+        else:
+            job.done = job.total
+            await self._finish(job, "succeeded", result)
+
+    async def _finish(
+        self,
+        job: Job,
+        status: JobStatus,
+        result: bytes | None = None,
+    ) -> None:
+        """Store finished job. Files are written in a thread to not block the loop.
+
+        The job is reported as finished once it has been stored.
+        """
+        job.run = None
+        finished = datetime.now(timezone.utc)
+        raw = {**job.as_dict(), "status": status, "finished": finished}
+        await asyncio.to_thread(self._store, job.id, raw, result)
+        job.status = status
+        job.finished = finished
+        self.jobs.pop(job.id, None)
+
+    def _store(self, id_: str, raw: dict, result: bytes | None) -> None:
+        os.makedirs(self.path, exist_ok=True)
+        if result is not None:
+            with open(self._path(id_, "result"), "wb") as file:
+                file.write(result)
+        with open(self._path(id_), "w") as file:
+            json.dump(raw, file, default=json_serialize)
+
+    def _clean_up(self, expired: float) -> None:
+        """Delete files of jobs finished before the expiry time (Unix time)."""
+        try:
+            entries = list(os.scandir(self.path))
+        except FileNotFoundError:
+            return
+        removed = 0
+        for entry in entries:
+            if entry.name.endswith((".json", ".result")) and (
+                entry.stat().st_mtime < expired
+            ):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(entry.path)
+                    removed += 1
+        if removed:
+            logger.info("Deleted {0} files of expired jobs.".format(removed))
+
+    def _path(self, id_: str, suffix: str = "json") -> str:
+        # Job IDs are validated UUIDs. They can not escape the directory.
+        return os.path.join(self.path, "{0}.{1}".format(uuid.UUID(id_), suffix))
+
+
+def get_job_queue() -> JobQueue:
+    """Get job queue of this process. Create queue on first call."""
+    global JOB_QUEUE
+    if JOB_QUEUE is None:
+        JOB_QUEUE = JobQueue(
+            size=get_config_value("job_queue_size"),
+            workers=get_config_value("job_workers"),
+            path=os.path.join(get_config_value("data_dir"), DIRNAME),
+            ttl=get_config_value("job_ttl"),
+        )
+    return JOB_QUEUE
+
+
+async def clean_up_periodically(queue: JobQueue) -> None:
+    """Delete expired jobs on start and every `CLEAN_UP_INTERVAL` seconds."""
+    while True:
+        try:
+            await queue.clean_up()
+        except OSError:
+            logger.exception("Clean up of expired jobs failed.")
+        await asyncio.sleep(CLEAN_UP_INTERVAL)
+
+
+@asynccontextmanager
+async def create_job_queue_for_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    app.state.job_queue = get_job_queue()
+    clean_up = asyncio.create_task(clean_up_periodically(app.state.job_queue))
+    try:
+        yield
+    finally:
+        clean_up.cancel()
+        await asyncio.gather(clean_up, return_exceptions=True)
+        await app.state.job_queue.close()
@@ -16,8 +16,14 @@ from pydantic import (
 )
 
 from ohsome_quality_api.api.request_context import RequestContext, request_context
-from ohsome_quality_api.attributes.definitions import AttributeEnum, get_attributes
-from ohsome_quality_api.indicators.definitions import get_valid_indicators
+from ohsome_quality_api.attributes.definitions import (
+    AttributeEnum,
+    get_attribute_keys,
+)
+from ohsome_quality_api.indicators.definitions import (
+    IndicatorEnumRequest,
+    get_valid_indicators,
+)
 from ohsome_quality_api.topics.definitions import TopicEnum
 from ohsome_quality_api.topics.models import TopicData
 from ohsome_quality_api.utils.helper import snake_to_lower_camel
@@ -144,6 +150,54 @@ class IndicatorRequest(BaseBpolys, BaseRequestContext):
         return self
 
 
+class IndicatorsRequest(IndicatorRequest):
+    indicator_keys: list[IndicatorEnumRequest] = Field(
+        title="Indicator Keys",
+        alias="indicators",
+        min_length=1,
+        examples=[["mapping-saturation", "currentness"]],
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                # NOTE: json.dumps avoids that keys are ordered by pydantic
+                json.dumps(
+                    {
+                        "indicators": ["mapping-saturation", "currentness"],
+                        "topic": "building-count",
+                        "bpolys": BPOLYS_EXAMPLE,
+                    }
+                ),
+            ]
+        }
+    )
+
+    @computed_field
+    @property
+    def indicator(self) -> str:
+        return ", ".join(self.indicator_keys)
+
+    @field_validator("indicator_keys")
+    @classmethod
+    def transform_indicators(cls, value) -> list[str]:
+        # Remove duplicates but keep order
+        return list(dict.fromkeys(indicator.value for indicator in value))
+
+    @model_validator(mode="after")
+    def validate_indicator_topic_combination(self):
+        valid_indicators = get_valid_indicators(self.topic.value)
+        for indicator in self.indicator_keys:
+            if indicator not in valid_indicators:
+                raise ValueError(
+                    "Invalid combination of indicator and topic: {} and {}".format(
+                        indicator,
+                        self.topic.value,
+                    )
+                )
+        return self
+
+
 class AttributeCompletenessKeyRequest(IndicatorRequest):
     attribute_keys: list[AttributeEnum] = Field(
         title="Attribute Keys",
@@ -185,7 +239,7 @@ class AttributeCompletenessKeyRequest(IndicatorRequest):
                     "Please define a custom attribute by providing attribute filter and title parameters."  # noqa
                 )
             case _:
-                valid_attributes = tuple(get_attributes()[self.topic.value].keys())
+                valid_attributes = get_attribute_keys(self.topic.value)
                 for attribute in self.attribute_keys:
                     if attribute not in valid_attributes:
                         raise ValueError(
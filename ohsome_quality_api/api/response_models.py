@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Literal
 
 from geojson_pydantic import Feature, FeatureCollection, MultiPolygon, Polygon
@@ -151,8 +152,32 @@ class IndicatorJSONResponse(BaseResponse):
     model_config = ConfigDict(extra="allow")
 
 
+IndicatorFeature = Feature[Polygon | MultiPolygon, CompIndicator]
+
+
 class IndicatorGeoJSONResponse(
     BaseResponse,
     FeatureCollection[Feature[Polygon | MultiPolygon, CompIndicator]],
 ):
     model_config = ConfigDict(extra="allow")
+
+
+class JobProgress(BaseConfig):
+    done: int
+    total: int
+
+
+class Job(BaseConfig):
+    id: str
+    key: IndicatorEnum
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    progress: JobProgress
+    media_type: str
+    error: dict | None = None
+    created: datetime
+    finished: datetime | None = None
+    model_config = ConfigDict(title="Job")
+
+
+class JobResponse(BaseResponse):
+    result: Job
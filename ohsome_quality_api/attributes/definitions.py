@@ -1,38 +1,48 @@
-import os
 from enum import Enum
-
-import yaml
+from types import MappingProxyType
 
 from ohsome_quality_api.attributes.models import Attribute
-from ohsome_quality_api.utils.helper import get_module_dir
+from ohsome_quality_api.utils.registry import load_yaml, registry, translate
 
 
-def load_attributes() -> dict[str, dict[str, Attribute]]:
+@registry
+def _load_attributes() -> dict[str, MappingProxyType[str, Attribute]]:
     """Read attributes from YAML file."""
-    directory = get_module_dir("ohsome_quality_api.attributes")
-    file = os.path.join(directory, "attributes.yaml")
-    with open(file, "r") as f:
-        raw = yaml.safe_load(f)
+    raw = load_yaml("ohsome_quality_api.attributes", "attributes.yaml")
     attributes = {}
     for topic_key, value in raw.items():
-        attributes[topic_key] = {}
-        for attribute_key, value_ in value.items():
-            attributes[topic_key][attribute_key] = Attribute(**value_)
+        attributes[topic_key] = MappingProxyType(
+            {
+                attribute_key: Attribute(**value_)
+                for attribute_key, value_ in value.items()
+            }
+        )
     return attributes
 
 
+def load_attributes() -> dict[str, dict[str, Attribute]]:
+    return {
+        topic_key: {k: translate(v) for k, v in value.items()}
+        for topic_key, value in _load_attributes().items()
+    }
+
+
 def get_attributes() -> dict[str, dict[str, Attribute]]:
     return load_attributes()
 
 
+def get_attribute_keys(topic_key: str) -> tuple[str, ...]:
+    return tuple(_load_attributes()[topic_key].keys())
+
+
 def get_attribute(topic_key, a_key: str | None) -> Attribute:
-    attributes = get_attributes()
+    attributes = _load_attributes()
     try:
         # TODO: Workaround to be able to display indicator in dashboard.
         # Remove if dashboard handles attribution key selection.
         if a_key is None:
-            return next(iter(attributes[topic_key].values()))
-        return attributes[topic_key][a_key]
+            return translate(next(iter(attributes[topic_key].values())))
+        return translate(attributes[topic_key][a_key])
     except KeyError as error:
         raise KeyError("Invalid topic or attribute key(s).") from error
 
@@ -58,7 +68,7 @@ def build_attribute_filter(
     topic_key: str,
 ) -> str:
     """Build attribute filter for ohsomeDB query."""
-    attributes = get_attributes()
+    attributes = _load_attributes()
     try:
         if attribute_keys is not None:
             attribute_filter = ""
@@ -81,7 +91,7 @@ def build_attribute_filter(
 
 
 attribute_keys = {
-    inner_key for outer_dict in load_attributes().values() for inner_key in outer_dict
+    inner_key for outer_dict in _load_attributes().values() for inner_key in outer_dict
 }
 
 AttributeEnum = Enum("AttributeEnum", {name: name for name in attribute_keys})
@@ -1,13 +1,22 @@
-"""Load configuration from environment variables or configuration file on disk."""
+"""Load configuration from environment variables or configuration file on disk.
 
+The configuration is loaded once and cached as immutable snapshot. Call
+`reload_config` to pick up changes to the configuration file or environment variables.
+"""
+
+import logging
 import os
+from functools import cache
 from types import MappingProxyType
+from typing import Any, Callable
 
 import yaml
 
 from ohsome_quality_api import __version__
 from ohsome_quality_api.utils.helper import get_project_root
 
+logger = logging.getLogger(__name__)
+
 
 def get_config_path() -> str:
     """Get configuration file path
@@ -21,6 +30,7 @@ def get_config_path() -> str:
 def load_config_default() -> dict:
     return {
         "ohsomedb_enabled": False,
+        "ohsomedb_indicators": "",
         "ohsomedb_host": "localhost",
         "ohsomedb_port": 5432,
         "ohsomedb_db": "postgres",
@@ -28,16 +38,43 @@ def load_config_default() -> dict:
         "ohsomedb_password": "mylocalpassword",
         "ohsomedb_contributions_table": "contributions",
         "ohsomedb_search_path": '"global_2026-04-27",public',
+        "ohsomedb_pool_min_size": 5,
+        "ohsomedb_pool_max_size": 30,
         "postgres_host": "localhost",
         "postgres_port": 5445,
         "postgres_db": "oqapi",
         "postgres_user": "oqapi",
         "postgres_password": "oqapi",
+        "postgres_pool_min_size": 10,
+        "postgres_pool_max_size": 10,
+        "pool_max_inactive_connection_lifetime": 300,
+        "pool_statement_cache_size": 100,
+        "coverage_index_ttl": 86400,
+        "coverage_cache_ttl": 86400,
         "data_dir": get_default_data_dir(),
         "geom_size_limit": 1000,
         "log_level": "INFO",
         "ohsome_api": "https://api.ohsome.org/v1/",
+        "ohsome_api_max_connections": 100,
+        "ohsome_api_max_keepalive_connections": 20,
+        "ohsome_api_keepalive_expiry": 5,
+        "ohsome_api_http2": False,
+        "ohsome_api_metadata_ttl": 300,
         "concurrent_computations": 4,
+        "concurrency_ohsome_api": 32,
+        "concurrency_ohsomedb": 30,
+        "concurrency_oqapidb": 10,
+        "concurrency_cpu": os.cpu_count() or 1,
+        "executor": "thread",
+        "r_workers": 2,
+        "r_fit_timeout": 60,
+        "r_worker_max_fits": 100,
+        "mapping_saturation_backend": "r",
+        "result_cache_size": 0,
+        "result_cache_disk": False,
+        "job_workers": 2,
+        "job_queue_size": 100,
+        "job_ttl": 604800,
         "user_agent": "ohsome-quality-api/{}".format(__version__),
         "heigit_api_key": "foo",
         "datasets": {
@@ -62,6 +99,7 @@ def load_config_from_env() -> dict:
     """Load configuration from environment variables."""
     cfg = {
         "ohsomedb_enabled": os.getenv("OQAPI_OHSOMEDB_ENABLED"),
+        "ohsomedb_indicators": os.getenv("OQAPI_OHSOMEDB_INDICATORS"),
         "ohsomedb_host": os.getenv("OHSOMEDB_HOST"),
         "ohsomedb_port": os.getenv("OHSOMEDB_PORT"),
         "ohsomedb_db": os.getenv("OHSOMEDB_DB"),
@@ -69,23 +107,105 @@ def load_config_from_env() -> dict:
         "ohsomedb_password": os.getenv("OHSOMEDB_PASSWORD"),
         "ohsomedb_contributions_table": os.getenv("OHSOMEDB_CONTRIBUTIONS_TABLE"),
         "ohsomedb_search_path": os.getenv("OHSOMEDB_SEARCH_PATH"),
+        "ohsomedb_pool_min_size": os.getenv("OHSOMEDB_POOL_MIN_SIZE"),
+        "ohsomedb_pool_max_size": os.getenv("OHSOMEDB_POOL_MAX_SIZE"),
         "postgres_host": os.getenv("POSTGRES_HOST"),
         "postgres_port": os.getenv("POSTGRES_PORT"),
         "postgres_db": os.getenv("POSTGRES_DB"),
         "postgres_user": os.getenv("POSTGRES_USER"),
         "postgres_password": os.getenv("POSTGRES_PASSWORD"),
+        "postgres_pool_min_size": os.getenv("POSTGRES_POOL_MIN_SIZE"),
+        "postgres_pool_max_size": os.getenv("POSTGRES_POOL_MAX_SIZE"),
+        "pool_max_inactive_connection_lifetime": os.getenv(
+            "OQAPI_POOL_MAX_INACTIVE_CONNECTION_LIFETIME"
+        ),
+        "pool_statement_cache_size": os.getenv("OQAPI_POOL_STATEMENT_CACHE_SIZE"),
+        "coverage_index_ttl": os.getenv("OQAPI_COVERAGE_INDEX_TTL"),
+        "coverage_cache_ttl": os.getenv("OQAPI_COVERAGE_CACHE_TTL"),
         "data_dir": os.getenv("OQAPI_DATA_DIR"),
         "geom_size_limit": os.getenv("OQAPI_GEOM_SIZE_LIMIT"),
         "ohsome_api": os.getenv("OQAPI_OHSOME_API"),
+        "ohsome_api_max_connections": os.getenv("OQAPI_OHSOME_API_MAX_CONNECTIONS"),
+        "ohsome_api_max_keepalive_connections": os.getenv(
+            "OQAPI_OHSOME_API_MAX_KEEPALIVE_CONNECTIONS"
+        ),
+        "ohsome_api_keepalive_expiry": os.getenv("OQAPI_OHSOME_API_KEEPALIVE_EXPIRY"),
+        "ohsome_api_http2": os.getenv("OQAPI_OHSOME_API_HTTP2"),
+        "ohsome_api_metadata_ttl": os.getenv("OQAPI_OHSOME_API_METADATA_TTL"),
         "concurrent_computations": os.getenv("OQAPI_CONCURRENT_COMPUTATIONS"),
+        "concurrency_ohsome_api": os.getenv("OQAPI_CONCURRENCY_OHSOME_API"),
+        "concurrency_ohsomedb": os.getenv("OQAPI_CONCURRENCY_OHSOMEDB"),
+        "concurrency_oqapidb": os.getenv("OQAPI_CONCURRENCY_OQAPIDB"),
+        "concurrency_cpu": os.getenv("OQAPI_CONCURRENCY_CPU"),
+        "executor": os.getenv("OQAPI_EXECUTOR"),
+        "r_workers": os.getenv("OQAPI_R_WORKERS"),
+        "r_fit_timeout": os.getenv("OQAPI_R_FIT_TIMEOUT"),
+        "r_worker_max_fits": os.getenv("OQAPI_R_WORKER_MAX_FITS"),
+        "mapping_saturation_backend": os.getenv("OQAPI_MAPPING_SATURATION_BACKEND"),
+        "result_cache_size": os.getenv("OQAPI_RESULT_CACHE_SIZE"),
+        "result_cache_disk": os.getenv("OQAPI_RESULT_CACHE_DISK"),
+        "job_workers": os.getenv("OQAPI_JOB_WORKERS"),
+        "job_queue_size": os.getenv("OQAPI_JOB_QUEUE_SIZE"),
+        "job_ttl": os.getenv("OQAPI_JOB_TTL"),
         "user_agent": os.getenv("OQAPI_USER_AGENT"),
         "heigit_api_key": os.getenv("OQAPI_HEIGIT_API_KEY"),
     }
     return {k: v for k, v in cfg.items() if v is not None}
 
 
-def get_config() -> MappingProxyType:
-    """Get configuration variables from environment and file.
+def to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes", "on")
+    return bool(value)
+
+
+# Types of configuration values. Values from environment variables are always strings.
+CONFIG_TYPES: MappingProxyType[str, Callable] = MappingProxyType(
+    {
+        "ohsomedb_enabled": to_bool,
+        "ohsomedb_port": int,
+        "ohsomedb_pool_min_size": int,
+        "ohsomedb_pool_max_size": int,
+        "postgres_port": int,
+        "postgres_pool_min_size": int,
+        "postgres_pool_max_size": int,
+        "pool_max_inactive_connection_lifetime": float,
+        "pool_statement_cache_size": int,
+        "coverage_index_ttl": float,
+        "coverage_cache_ttl": float,
+        "geom_size_limit": float,
+        "ohsome_api_max_connections": int,
+        "ohsome_api_max_keepalive_connections": int,
+        "ohsome_api_keepalive_expiry": float,
+        "ohsome_api_http2": to_bool,
+        "ohsome_api_metadata_ttl": float,
+        "concurrent_computations": int,
+        "concurrency_ohsome_api": int,
+        "concurrency_ohsomedb": int,
+        "concurrency_oqapidb": int,
+        "concurrency_cpu": int,
+        "r_workers": int,
+        "r_fit_timeout": float,
+        "r_worker_max_fits": int,
+        "result_cache_size": int,
+        "result_cache_disk": to_bool,
+        "job_workers": int,
+        "job_queue_size": int,
+        "job_ttl": float,
+    }
+)
+
+
+def coerce_config(cfg: dict) -> dict:
+    """Coerce configuration values to their expected type."""
+    for key, type_ in CONFIG_TYPES.items():
+        if cfg.get(key) is not None:
+            cfg[key] = type_(cfg[key])
+    return cfg
+
+
+def load_config() -> MappingProxyType:
+    """Load configuration variables from environment and file.
 
     Configuration values from file will be given precedence over default vaules.
     Configuration values from environment variables will be given precedence over file
@@ -96,10 +216,25 @@ def get_config() -> MappingProxyType:
     cfg_env = load_config_from_env()
     cfg.update(cfg_file)
     cfg.update(cfg_env)
-    return MappingProxyType(cfg)
+    return MappingProxyType(coerce_config(cfg))
+
+
+@cache
+def get_config() -> MappingProxyType:
+    """Get cached configuration snapshot. Load configuration on first call."""
+    return load_config()
+
+
+def reload_config() -> None:
+    """Invalidate cached configuration snapshot.
+
+    The configuration will be loaded again on next access.
+    """
+    get_config.cache_clear()
+    logger.info("Configuration invalidated. Reload on next access.")
 
 
-def get_config_value(key: str) -> str | int | dict:
+def get_config_value(key: str) -> str | int | float | bool | dict:
     config = get_config()
     return config[key]
 
@@ -12,25 +12,46 @@ On preventing SQL injections:
 
     If the query string is build from user input,
     please make sure no SQL injection attack is possible.
+
+On prepared statements:
+    asyncpg prepares every query and caches the prepared statement per connection
+    (up to `pool_statement_cache_size` statements). Queries are read from SQL files
+    once (see `utils.registry.load_sql`). Their text is identical across requests,
+    so the server parses and plans each query only once per connection.
+
+On geometries:
+    Geometries are sent to and received from PostGIS as binary `geometry` values
+    (EWKB) instead of GeoJSON text (see `geodatabase.wkb`). Query parameters of type
+    `geometry` (e.g. `$1::geometry`) accept GeoJSON geometries. Columns of type
+    `geometry` are returned as GeoJSON geometry dictionaries in EPSG:4326.
 """
 
 import logging
-import os
 from contextlib import asynccontextmanager
 from typing import Literal
 
 import asyncpg
-import geojson
 from asyncpg import Pool, Record
 from fastapi import FastAPI, Request
 from geojson import Feature, FeatureCollection, MultiPolygon
 
 from ohsome_quality_api.config import get_config_value
+from ohsome_quality_api.geodatabase import wkb
+from ohsome_quality_api.geodatabase.coverage import (
+    CoverageIndexCache,
+    Relation,
+    bounds,
+)
+from ohsome_quality_api.utils.helper_asyncio import (
+    DATABASE_SINGLE_FLIGHT,
+    OHSOMEDB_BUDGET,
+    OQAPIDB_BUDGET,
+)
+from ohsome_quality_api.utils.registry import load_all_sql, load_sql
 
 logger = logging.getLogger("ohsome_quality_api")
 
-WORKING_DIR = os.path.dirname(os.path.abspath(__file__))
-
+MODULE_NAME = "ohsome_quality_api.geodatabase"
 
 OQAPIDB_POOL: Pool
 OHSOMEDB_POOL: Pool
@@ -41,8 +62,39 @@ def log_query(record):
     logger.debug("Args:\n" + str(record.args))
 
 
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """Register codec of the PostGIS `geometry` type on a new connection."""
+    await conn.set_type_codec(
+        "geometry",
+        schema="public",
+        encoder=wkb.encode,
+        decoder=wkb.decode,
+        format="binary",
+    )
+
+
+def get_pool_kwargs(database: Literal["oqapidb", "ohsomedb"]) -> dict:
+    """Get keyword arguments for `asyncpg.create_pool` from configuration."""
+    match database:
+        case "oqapidb":
+            prefix = "postgres"
+        case "ohsomedb":
+            prefix = "ohsomedb"
+    # Idle connections are closed after `max_inactive_connection_lifetime`.
+    # Connections closed by the server are replaced by the pool on acquire.
+    return {
+        "min_size": get_config_value(prefix + "_pool_min_size"),
+        "max_size": get_config_value(prefix + "_pool_max_size"),
+        "max_inactive_connection_lifetime": get_config_value(
+            "pool_max_inactive_connection_lifetime"
+        ),
+        "statement_cache_size": get_config_value("pool_statement_cache_size"),
+    }
+
+
 @asynccontextmanager
 async def create_pool_for_lifespan(app: FastAPI):
+    load_all_sql()
     # DSN in libpq connection URI format
     oqapidb_dsn = "postgres://{user}:{password}@{host}:{port}/{database}".format(
         host=get_config_value("postgres_host"),
@@ -63,12 +115,15 @@ async def create_pool_for_lifespan(app: FastAPI):
         "search_path": get_config_value("ohsomedb_search_path"),
     }
     async with (
-        asyncpg.create_pool(oqapidb_dsn) as oqapidb_pool,
+        asyncpg.create_pool(
+            oqapidb_dsn,
+            init=init_connection,
+            **get_pool_kwargs("oqapidb"),
+        ) as oqapidb_pool,
         asyncpg.create_pool(
             ohsomedb_dsn,
-            min_size=5,  # TODO put into config value
-            max_size=30,  # TODO put info config value
             server_settings=server_settings,
+            **get_pool_kwargs("ohsomedb"),
         ) as ohsomedb_pool,
     ):
         app.state.oqapidb_pool = await oqapidb_pool
@@ -91,20 +146,30 @@ async def get_connection(database: Literal["oqapidb", "ohsomedb"] = "oqapidb"):
     match database:
         case "oqapidb":
             pool = OQAPIDB_POOL
+            budget = OQAPIDB_BUDGET
         case "ohsomedb":
             pool = OHSOMEDB_POOL
-    async with pool.acquire() as conn:
-        try:
-            with conn.query_logger(log_query):
-                yield conn
-        finally:
-            await conn.close()
+            budget = OHSOMEDB_BUDGET
+    # Connection is released back to the pool (not closed) after leaving the context.
+    async with budget.acquire(), pool.acquire() as conn:
+        with conn.query_logger(log_query):
+            yield conn
 
 
 async def fetch(
     query: str,
     *args,
     database: Literal["oqapidb", "ohsomedb"] = "oqapidb",
+) -> list:
+    # Identical concurrent queries share one database round trip
+    key = (database, query, repr(args))
+    return await DATABASE_SINGLE_FLIGHT.do(key, _fetch, query, *args, database=database)
+
+
+async def _fetch(
+    query: str,
+    *args,
+    database: Literal["oqapidb", "ohsomedb"] = "oqapidb",
 ) -> list:
     async with get_connection(database) as conn:
         return await conn.fetch(query, *args)
@@ -119,13 +184,11 @@ async def get_shdi(bpoly: Feature | FeatureCollection) -> list[Record]:
     If intersection with multiple GDL regions occurs, return the weighted average using
     the intersection area as the weight.
     """
-    file_path = os.path.join(WORKING_DIR, "select_shdi.sql")
-    with open(file_path, "r") as file:
-        query = file.read()
+    query = load_sql(MODULE_NAME, "select_shdi.sql")
     if isinstance(bpoly, Feature):
-        geom = [str(bpoly.geometry)]
+        geom = [bpoly.geometry]
     elif isinstance(bpoly, FeatureCollection):
-        geom = [str(feature.geometry) for feature in bpoly.features]
+        geom = [feature.geometry for feature in bpoly.features]
     else:
         raise TypeError(
             "Expected type `Feature` or `FeatureCollection`. Got `{0}` instead.".format(
@@ -139,12 +202,69 @@ async def get_shdi(bpoly: Feature | FeatureCollection) -> list[Record]:
 # TODO: Check calls of the function
 async def get_reference_coverage(table_name: str) -> Feature:
     """Get reference coverage for a bounding polygon."""
-    file_path = os.path.join(WORKING_DIR, "select_coverage.sql")
-    with open(file_path, "r") as file:
-        query = file.read()
+    query = load_sql(MODULE_NAME, "select_coverage.sql", table_name=table_name)
     async with get_connection() as conn:
-        result = await conn.fetch(query.format(table_name=table_name))
-    return Feature(geometry=geojson.loads(result[0]["geom"]))
+        result = await conn.fetch(query)
+    return Feature(geometry=result[0]["geom"])
+
+
+async def get_coverage_geometries(table_name: str, column: str) -> list[dict]:
+    """Get all geometries of a coverage table."""
+    query = load_sql(
+        MODULE_NAME,
+        "select_coverage_geometries.sql",
+        table_name=table_name,
+        column=column,
+    )
+    async with get_connection() as conn:
+        result = await conn.fetch(query)
+    return [record["geom"] for record in result if record["geom"] is not None]
+
+
+COVERAGE_INDEX_CACHE = CoverageIndexCache(get_coverage_geometries)
+
+
+async def relate_to_coverage(
+    bpoly: Feature,
+    table_name: str,
+    column: str = "geom",
+) -> Relation:
+    """Relate bounding box of AoI to coverage geometry using an in-memory index.
+
+    The index is refreshed after `coverage_index_ttl` seconds (see
+    `geodatabase.coverage`). If the index is disabled "overlaps" is returned.
+    """
+    ttl = get_config_value("coverage_index_ttl")
+    bbox = bounds(bpoly["geometry"])
+    if ttl <= 0 or bbox is None:
+        return "overlaps"
+    index = await COVERAGE_INDEX_CACHE.get(table_name, column, ttl)
+    return index.relate(bbox)
+
+
+async def get_intersection(bpoly: Feature, table_name: str) -> tuple[float, Feature]:
+    """Get ratio of AOI area to intersection area and intersection geometry.
+
+    Both are computed from a single intersection of AoI and coverage geometry. If the
+    AoI lies outside or within the coverage, the database is not queried.
+
+    Returns:
+        The ratio of area within coverage (between 0-1) and the intersection
+        geometry. If the AOI lies outside of the coverage geometry the ratio is 0 and
+        the geometry is empty.
+    """
+    match await relate_to_coverage(bpoly, table_name):
+        case "disjoint":
+            return 0.0, Feature(geometry=MultiPolygon(coordinates=[]))
+        case "within":
+            return 1.0, Feature(geometry=bpoly.geometry)
+    query = load_sql(MODULE_NAME, "select_intersection.sql", table_name=table_name)
+    async with get_connection() as conn:
+        result = await conn.fetch(query, bpoly.geometry)
+    if result:
+        return result[0]["area_ratio"], Feature(geometry=result[0]["geom"])
+    else:
+        return 0.0, Feature(geometry=MultiPolygon(coordinates=[]))
 
 
 async def get_intersection_area(bpoly: Feature, table_name: str) -> float:
@@ -153,40 +273,21 @@ async def get_intersection_area(bpoly: Feature, table_name: str) -> float:
     The result is the ratio of area within coverage (between 0-1) or an empty list if
     AOI lies outside of coverage geometry.
     """
-    file_path = os.path.join(WORKING_DIR, "select_intersection.sql")
-    with open(file_path, "r") as file:
-        query = file.read()
-    geom = str(bpoly.geometry)
-    async with get_connection() as conn:
-        result = await conn.fetch(query.format(table_name=table_name), geom)
-        if result:
-            return result[0]["area_ratio"]
-        else:
-            return 0.0
+    area_ratio, _ = await get_intersection(bpoly, table_name)
+    return area_ratio
 
 
 async def get_intersection_geom(bpoly: Feature, table_name: str) -> Feature:
     """Get intersection geometry of AoI and coverage geometry."""
-    file_path = os.path.join(WORKING_DIR, "select_intersection.sql")
-    with open(file_path, "r") as file:
-        query = file.read()
-    geom = str(bpoly.geometry)
-    async with get_connection() as conn:
-        result = await conn.fetch(query.format(table_name=table_name), geom)
-        if result:
-            return Feature(geometry=geojson.loads(result[0]["geom"]))
-        else:
-            return Feature(geometry=MultiPolygon(coordinates=[]))
+    _, feature = await get_intersection(bpoly, table_name)
+    return feature
 
 
 async def area(bpoly: Feature) -> float:
     """Compute area of given geometry in Kilometer using PostGIS ST_Area."""
-    file_path = os.path.join(WORKING_DIR, "select_area.sql")
-    with open(file_path, "r") as file:
-        query = file.read()
-    geom = str(bpoly.geometry)
+    query = load_sql(MODULE_NAME, "select_area.sql")
     async with get_connection() as conn:
-        result = await conn.fetch(query, geom)
+        result = await conn.fetch(query, bpoly.geometry)
     if result[0]["area"]:
         return result[0]["area"] / 1_000_000
     else:
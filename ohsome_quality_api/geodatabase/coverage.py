@@ -0,0 +1,170 @@
+"""In-memory index of coverage geometries of reference datasets.
+
+Indicators comparing OSM with a reference dataset intersect the AoI with the coverage
+of the reference dataset. Coverage geometries are loaded once per process and refreshed
+in the background after `coverage_index_ttl` seconds. The relation of the bounding box
+of an AoI to a coverage is then decided in memory:
+
+- disjoint: The bounding box does not intersect the coverage.
+- within: The bounding box lies within the coverage.
+- overlaps: The boundary of the coverage crosses the bounding box (or the relation
+  could not be decided). Only in this case the database has to compute the exact
+  intersection.
+
+The coverage geometry is stored as NumPy array of its edges. All tests are vectorized
+over the edges.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Literal
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Relation = Literal["disjoint", "within", "overlaps"]
+BBox = tuple[float, float, float, float]
+
+
+class CoverageIndex:
+    """Edges of a (Multi)Polygon coverage geometry.
+
+    Each row of `edges` holds the coordinates (x1, y1, x2, y2) of one edge of any ring.
+    """
+
+    def __init__(self, geometries: list[dict]) -> None:
+        edges = []
+        for ring in rings(geometries):
+            if len(ring) > 1:
+                array = np.asarray(ring, dtype=float)[:, :2]
+                edges.append(np.hstack((array[:-1], array[1:])))
+        self.edges = np.vstack(edges) if edges else np.empty((0, 4))
+
+    def relate(self, bbox: BBox) -> Relation:
+        """Relate bounding box of an AoI to the coverage."""
+        min_x, min_y, max_x, max_y = bbox
+        x1, y1, x2, y2 = self.edges.T
+        # Edges with a bounding box intersecting the bounding box of the AoI
+        candidates = (
+            (np.minimum(x1, x2) <= max_x)
+            & (np.maximum(x1, x2) >= min_x)
+            & (np.minimum(y1, y2) <= max_y)
+            & (np.maximum(y1, y2) >= min_y)
+        )
+        if candidates.any():
+            x1, y1, x2, y2 = self.edges[candidates].T
+            # Side of each corner of the bounding box relative to the line of each edge
+            # An edge crosses the bounding box if the corners are not on the same side.
+            corners = ((min_x, min_y), (min_x, max_y), (max_x, min_y), (max_x, max_y))
+            sides = np.array(
+                [(x2 - x1) * (y - y1) - (y2 - y1) * (x - x1) for x, y in corners]
+            )
+            separated = (sides > 0).all(axis=0) | (sides < 0).all(axis=0)
+            if not separated.all():
+                return "overlaps"
+        # No edge crosses the bounding box: It lies either within or outside of the
+        # coverage.
+        if self.contains(min_x, min_y):
+            return "within"
+        return "disjoint"
+
+    def contains(self, x: float, y: float) -> bool:
+        """Point in polygon test using the even-odd rule."""
+        x1, y1, x2, y2 = self.edges.T
+        straddles = (y1 > y) != (y2 > y)
+        with np.errstate(all="ignore"):
+            x_crossing = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+        crossings = np.count_nonzero(straddles & (x < x_crossing))
+        return crossings % 2 == 1
+
+
+class CoverageIndexCache:
+    """Process-wide cache of coverage indices.
+
+    Concurrent callers await one in-flight request per coverage. After the TTL has
+    expired the cached index is still returned while one refresh runs in the
+    background.
+
+    Args:
+        load: Coroutine function returning the geometries of a coverage by table and
+            column name.
+    """
+
+    def __init__(self, load: Callable[[str, str], Awaitable[list[dict]]]) -> None:
+        self.load = load
+        self.indices: dict[tuple[str, str], CoverageIndex] = {}
+        self.fetched_at: dict[tuple[str, str], float] = {}
+        self.tasks: dict[tuple[str, str], asyncio.Task] = {}
+
+    async def get(self, table_name: str, column: str, ttl: float) -> CoverageIndex:
+        key = (table_name, column)
+        index = self.indices.get(key)
+        if index is None:
+            # Shield shared request from cancellation of a single caller
+            return await asyncio.shield(self.refresh(key))
+        if time.monotonic() - self.fetched_at[key] >= ttl:
+            self.refresh(key)
+        return index
+
+    def refresh(self, key: tuple[str, str]) -> asyncio.Task:
+        """Start loading of the coverage unless it is already in-flight."""
+        loop = asyncio.get_running_loop()
+        task = self.tasks.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._fetch(key))
+            task.add_done_callback(self._done)
+            self.tasks[key] = task
+        return task
+
+    async def _fetch(self, key: tuple[str, str]) -> CoverageIndex:
+        geometries = await self.load(*key)
+        index = CoverageIndex(geometries)
+        self.indices[key] = index
+        self.fetched_at[key] = time.monotonic()
+        logger.info(
+            "Loaded coverage index of {0} with {1} edges.".format(
+                key[0], len(index.edges)
+            )
+        )
+        return index
+
+    def _done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.warning("Loading coverage index failed.")
+
+
+def rings(geometries: list[dict]) -> list[list]:
+    """Get all rings of (Multi)Polygon geometries."""
+    result = []
+    for geometry in geometries:
+        match geometry["type"]:
+            case "Polygon":
+                result.extend(geometry["coordinates"])
+            case "MultiPolygon":
+                for polygon in geometry["coordinates"]:
+                    result.extend(polygon)
+            case _:
+                raise ValueError(
+                    "Expected Polygon or MultiPolygon. Got {0} instead.".format(
+                        geometry["type"]
+                    )
+                )
+    return result
+
+
+def bounds(geometry: dict) -> BBox | None:
+    """Get bounding box of a (Multi)Polygon. Return `None` for other geometries."""
+    try:
+        parts = [np.asarray(ring, dtype=float)[:, :2] for ring in rings([geometry])]
+    except ValueError:
+        return None
+    if not parts:
+        return None
+    array = np.vstack(parts)
+    min_x, min_y = array.min(axis=0)
+    max_x, max_y = array.max(axis=0)
+    return float(min_x), float(min_y), float(max_x), float(max_y)
@@ -1,6 +1,4 @@
 SELECT
     ST_Area (
-		ST_GeomFromGeoJSON (
-			$1
-		)::geography
+		$1::geometry::geography
 	) AS area;
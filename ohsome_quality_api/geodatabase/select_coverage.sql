@@ -1,4 +1,4 @@
 SELECT
-    ST_AsGeoJSON (ST_Transform (geom, 4326)) as geom
+    ST_Transform (geom, 4326) as geom
 FROM
     {table_name};
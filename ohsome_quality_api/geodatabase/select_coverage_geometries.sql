@@ -0,0 +1,4 @@
+SELECT
+    ST_Transform ({column}, 4326) AS geom
+FROM
+    {table_name};
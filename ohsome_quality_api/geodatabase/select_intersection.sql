@@ -1,13 +1,22 @@
 WITH bpoly AS (
     SELECT
-        ST_Setsrid (ST_GeomFromGeoJSON ($1), 4326) AS geom
+        $1::geometry AS geom
+),
+intersection AS MATERIALIZED (
+    -- clip input geom with coverage
+    -- (materialized to not compute the intersection again for each reference)
+    SELECT
+        ST_Intersection (bpoly.geom, coverage.geom) AS geom,
+        ST_Area (bpoly.geom) AS area
+    FROM
+        bpoly,
+        {table_name} coverage
+    WHERE
+        ST_Intersects (bpoly.geom, coverage.geom)
 )
 SELECT
     -- ratio of area within coverage (empty if outside, between 0-1 if intersection)
-    ST_Area (ST_Intersection (bpoly.geom, coverage.geom)) / ST_Area (bpoly.geom) as area_ratio,
-    ST_AsGeoJSON (ST_Intersection (bpoly.geom, coverage.geom)) AS geom
+    ST_Area (intersection.geom) / intersection.area AS area_ratio,
+    intersection.geom
 FROM
-    bpoly,
-    {table_name} coverage
-WHERE
-    ST_Intersects (bpoly.geom, coverage.geom)
+    intersection
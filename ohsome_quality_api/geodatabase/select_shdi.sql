@@ -1,11 +1,11 @@
 WITH bpoly AS (
     SELECT
-        ST_Setsrid (public.ST_GeomFromGeoJSON (geojson), 4326) AS geom,
+        geom,
         -- Row number is used to make sure order of result is the same as order of input
         -- (Probably unnecessary)
         row_number() OVER () AS rownumber
     FROM
-        unnest(cast($1 AS text[])) AS geojson
+        unnest(cast($1 AS public.geometry[])) AS geom
 )
 SELECT
     SUM(ST_Area (ST_Intersection (shdi.geom, bpoly.geom)::geography) / ST_Area
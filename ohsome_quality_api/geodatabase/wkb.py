@@ -0,0 +1,214 @@
+"""Codec for the PostGIS `geometry` type using Extended Well-Known Binary (EWKB).
+
+Geometries are exchanged with PostGIS in the binary format of the `geometry` type
+instead of GeoJSON text (`ST_GeomFromGeoJSON` and `ST_AsGeoJSON`). Coordinates are
+converted from and to bytes as NumPy arrays.
+
+On the Python side geometries are GeoJSON geometry mappings (e.g. `geojson.Polygon`)
+or objects implementing `__geo_interface__` (e.g. `geojson_pydantic` geometries).
+Decoded geometries are plain GeoJSON geometry dictionaries.
+
+Specification of (E)WKB:
+    https://libgeos.org/specifications/wkb/
+"""
+
+import struct
+from typing import Any
+
+import numpy as np
+
+SRID = 4326
+
+# Flags of EWKB geometry type
+_Z = 0x80000000
+_M = 0x40000000
+_SRID = 0x20000000
+
+TYPES = {
+    1: "Point",
+    2: "LineString",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+    7: "GeometryCollection",
+}
+CODES = {name: code for code, name in TYPES.items()}
+
+# Nesting depth of positions in the coordinates of a GeoJSON geometry
+DEPTH = {
+    "Point": 0,
+    "LineString": 1,
+    "Polygon": 2,
+    "MultiPoint": 1,
+    "MultiLineString": 2,
+    "MultiPolygon": 3,
+}
+
+_UINT = struct.Struct("<I")
+
+
+def encode(geometry: Any, srid: int = SRID) -> bytes:
+    """Encode GeoJSON geometry as little-endian EWKB with SRID."""
+    geometry = getattr(geometry, "__geo_interface__", geometry)
+    buffer = bytearray()
+    _encode(geometry, buffer, srid)
+    return bytes(buffer)
+
+
+def decode(data: bytes) -> dict:
+    """Decode (E)WKB to GeoJSON geometry. M values are dropped."""
+    geometry, _ = _decode(memoryview(data), 0)
+    return geometry
+
+
+def _encode(geometry: dict, buffer: bytearray, srid: int | None = None) -> None:
+    type_ = geometry["type"]
+    if type_ == "GeometryCollection":
+        _encode_header(buffer, type_, False, srid)
+        parts = geometry["geometries"]
+        buffer += _UINT.pack(len(parts))
+        for part in parts:
+            _encode(getattr(part, "__geo_interface__", part), buffer)
+        return
+    coordinates = geometry["coordinates"]
+    has_z = _has_z(coordinates, DEPTH[type_])
+    _encode_header(buffer, type_, has_z, srid)
+    _encode_coordinates(buffer, type_, coordinates, has_z)
+
+
+def _encode_coordinates(
+    buffer: bytearray,
+    type_: str,
+    coordinates: list,
+    has_z: bool,
+) -> None:
+    dims = 3 if has_z else 2
+    match type_:
+        case "Point":
+            if len(coordinates) == 0:
+                # Empty point is encoded as point with NaN coordinates
+                coordinates = [np.nan] * dims
+            buffer += _positions(coordinates, dims).tobytes()
+        case "LineString":
+            _encode_points(buffer, coordinates, dims)
+        case "Polygon":
+            buffer += _UINT.pack(len(coordinates))
+            for ring in coordinates:
+                _encode_points(buffer, ring, dims)
+        case _:
+            # Parts of multi geometries are geometries with own header
+            part_type = type_.removeprefix("Multi")
+            buffer += _UINT.pack(len(coordinates))
+            for part in coordinates:
+                _encode_header(buffer, part_type, has_z)
+                _encode_coordinates(buffer, part_type, part, has_z)
+
+
+def _encode_header(
+    buffer: bytearray,
+    type_: str,
+    has_z: bool,
+    srid: int | None = None,
+) -> None:
+    code = CODES[type_]
+    if has_z:
+        code |= _Z
+    if srid is not None:
+        code |= _SRID
+    buffer.append(1)  # little-endian
+    buffer += _UINT.pack(code)
+    if srid is not None:
+        buffer += _UINT.pack(srid)
+
+
+def _encode_points(buffer: bytearray, points: list, dims: int) -> None:
+    buffer += _UINT.pack(len(points))
+    if len(points) > 0:
+        buffer += _positions(points, dims).tobytes()
+
+
+def _positions(positions: list, dims: int) -> np.ndarray:
+    array = np.asarray(positions, dtype="<f8")
+    return array[..., :dims]
+
+
+def _has_z(coordinates: list, depth: int) -> bool:
+    """Check if first position of the coordinates has a Z value."""
+    for _ in range(depth):
+        if len(coordinates) == 0:
+            return False
+        coordinates = coordinates[0]
+    return len(coordinates) > 2
+
+
+def _decode(data: memoryview, offset: int) -> tuple[dict, int]:
+    reader = _Reader(data, offset)
+    type_ = reader.read_header()
+    match type_:
+        case "Point":
+            (position,) = reader.read_positions(1)
+            coordinates = [] if all(np.isnan(position)) else position
+        case "LineString":
+            coordinates = reader.read_points()
+        case "Polygon":
+            coordinates = [reader.read_points() for _ in range(reader.read_uint())]
+        case _:
+            parts = []
+            for _ in range(reader.read_uint()):
+                part, reader.offset = _decode(data, reader.offset)
+                parts.append(part)
+            if type_ == "GeometryCollection":
+                return {"type": type_, "geometries": parts}, reader.offset
+            coordinates = [part["coordinates"] for part in parts]
+    return {"type": type_, "coordinates": coordinates}, reader.offset
+
+
+class _Reader:
+    """Read a single (E)WKB geometry from a buffer starting at an offset."""
+
+    def __init__(self, data: memoryview, offset: int) -> None:
+        self.data = data
+        self.offset = offset
+        self.uint = _UINT
+        self.dtype = np.dtype("<f8")
+        self.has_z = False
+        self.dims = 2
+
+    def read_header(self) -> str:
+        if self.data[self.offset] == 0:  # big-endian
+            self.uint = struct.Struct(">I")
+            self.dtype = np.dtype(">f8")
+        self.offset += 1
+        code = self.read_uint()
+        has_z = bool(code & _Z)
+        has_m = bool(code & _M)
+        if code & _SRID:
+            self.offset += 4
+        code &= 0x0FFFFFFF
+        if code > 1000:
+            # ISO WKB: Z, M and ZM are encoded by adding 1000, 2000 and 3000
+            has_z = has_z or (code // 1000) in (1, 3)
+            has_m = has_m or (code // 1000) in (2, 3)
+            code %= 1000
+        self.has_z = has_z
+        self.dims = 2 + has_z + has_m
+        return TYPES[code]
+
+    def read_uint(self) -> int:
+        (value,) = self.uint.unpack_from(self.data, self.offset)
+        self.offset += 4
+        return value
+
+    def read_positions(self, count: int) -> list:
+        array = np.frombuffer(
+            self.data,
+            dtype=self.dtype,
+            count=count * self.dims,
+            offset=self.offset,
+        )
+        self.offset += count * self.dims * 8
+        return array.reshape(count, self.dims)[:, : 2 + self.has_z].tolist()
+
+    def read_points(self) -> list:
+        return self.read_positions(self.read_uint())
@@ -1,5 +1,5 @@
+import asyncio
 import logging
-from datetime import datetime
 from string import Template
 
 import plotly.graph_objects as go
@@ -8,11 +8,11 @@ from dateutil.parser import isoparse
 from fastapi_i18n import _, get_locale
 from geojson import Feature
 
+from ohsome_quality_api import ohsomedb
 from ohsome_quality_api.attributes.definitions import (
     build_attribute_filter,
     build_attribute_title,
 )
-from ohsome_quality_api.config import get_config_value
 from ohsome_quality_api.indicators.base import BaseIndicator
 from ohsome_quality_api.ohsome_api import client as ohsome_api_client
 from ohsome_quality_api.topics.models import Topic
@@ -20,14 +20,6 @@ from ohsome_quality_api.topics.models import Topic
 logger = logging.getLogger(__name__)
 
 
-def is_ohsomedb_enabled() -> bool:
-    ohsomedb_enabled = get_config_value("ohsomedb_enabled")
-    if ohsomedb_enabled or ohsomedb_enabled in ("True", "true"):  # noqa: SIM103
-        return True
-    else:
-        return False
-
-
 class AttributeCompleteness(BaseIndicator):
     """
     Attribute completeness of map features.
@@ -76,29 +68,39 @@ class AttributeCompleteness(BaseIndicator):
         )
 
     async def preprocess(self):
-        raw = await ohsome_api_client.metadata()
-        latest_timestamp = datetime.fromisoformat(
-            raw["temporalExtent"]["latestTimestamp"]
-        )
-        end = latest_timestamp.strftime("%Y-%m-01")
-        start = "2008-" + latest_timestamp.strftime("%m-%d")
-
-        result_1 = await ohsome_api_client.features(
-            aoi=self.feature.geometry,
-            measure=self.topic.aggregation_type,
-            ohsome_filter=self.topic.filter,
-            time_series={"start": start, "end": end},
-        )
-        result_2 = await ohsome_api_client.features(
-            aoi=self.feature.geometry,
-            measure=self.topic.aggregation_type,
-            ohsome_filter=f"({self.topic.filter}) and ({self.attribute_filter})",
-            time_series={"start": start, "end": end},
+        if ohsomedb.is_enabled("attribute-completeness"):
+            await self.preprocess_ohsomedb()
+            return
+
+        # Features of the topic with and without attributes are queried concurrently
+        result_1, result_2 = await asyncio.gather(
+            ohsome_api_client.features_series_end(
+                aoi=self.feature.geometry,
+                measure=self.topic.aggregation_type,
+                ohsome_filter=self.topic.filter,
+            ),
+            ohsome_api_client.features_series_end(
+                aoi=self.feature.geometry,
+                measure=self.topic.aggregation_type,
+                ohsome_filter=f"({self.topic.filter}) and ({self.attribute_filter})",
+            ),
         )
 
-        absolute_value_1 = result_1["value"][-1]
-        absolute_value_2 = result_2["value"][-1]
+        self.set_absolute_values(result_1["value"], result_2["value"])
+        self.result.timestamp_osm = isoparse(result_1["timestamp"])
+
+    async def preprocess_ohsomedb(self):
+        # Features with and without attributes are aggregated in a single query
+        result = await ohsomedb.filter_ratio(
+            aggregation=self.topic.aggregation_type,
+            bpolys=self.feature.geometry,
+            filter_=self.topic.filter,
+            attribute_filter=self.attribute_filter,
+        )
+        self.set_absolute_values(result[0]["value"], result[0]["value_attribute"])
+        self.result.timestamp_osm = result[0]["snapshot_ts"]
 
+    def set_absolute_values(self, absolute_value_1, absolute_value_2) -> None:
         match self.topic.aggregation_type:
             case "count":
                 self.absolute_value_1 = absolute_value_1
@@ -112,8 +114,6 @@ class AttributeCompleteness(BaseIndicator):
             case _:
                 raise ValueError("Unexpected aggregation type.")
 
-        self.result.timestamp_osm = isoparse(result_1["timestamp"][-1])
-
     def calculate(self) -> None:
         if (
             self.absolute_value_1 == 0
@@ -1,9 +1,7 @@
 import json
-import os
 from abc import ABCMeta, abstractmethod
 
 import plotly.graph_objects as go
-import yaml
 from fastapi_i18n import _
 from geojson import Feature, Polygon
 
@@ -18,9 +16,10 @@ from ohsome_quality_api.topics.models import Topic
 from ohsome_quality_api.utils.helper import (
     camel_to_hyphen,
     camel_to_snake,
-    get_module_dir,
     json_serialize,
 )
+from ohsome_quality_api.utils.helper_asyncio import gather_with_semaphore
+from ohsome_quality_api.utils.registry import load_yaml, registry, translate
 
 
 class BaseIndicator(metaclass=ABCMeta):
@@ -144,6 +143,28 @@ class BaseIndicator(metaclass=ABCMeta):
         """
         pass
 
+    @classmethod
+    async def preprocess_batch(cls, indicators: list["BaseIndicator"]) -> None:
+        """Fetch and preprocess data of indicators for multiple features.
+
+        Defaults to preprocessing each indicator on its own. This method should be
+        overwritten by the Sub Class if data of all features can be fetched at once.
+        """
+        await gather_with_semaphore(
+            [indicator.preprocess() for indicator in indicators]
+        )
+
+    @classmethod
+    def has_preprocess_batch(cls) -> bool:
+        """Check if data of all features is fetched at once (see `preprocess_batch`).
+
+        Otherwise each feature is preprocessed and calculated on its own.
+        """
+        preprocess_batch = getattr(
+            cls.preprocess_batch, "__func__", cls.preprocess_batch
+        )
+        return preprocess_batch is not BaseIndicator.preprocess_batch.__func__
+
     @abstractmethod
     def calculate(self) -> None:
         """Calculate indicator results.
@@ -182,10 +203,21 @@ class BaseIndicator(metaclass=ABCMeta):
 
     def get_template(self) -> IndicatorTemplates:
         """Get template for indicator."""
-        indicator_key = camel_to_snake(type(self).__name__)
-        directory = get_module_dir(f"ohsome_quality_api.indicators.{indicator_key}")
-        file = os.path.join(directory, "templates.yaml")
-        with open(file, "r") as file:
-            raw = yaml.safe_load(file)
-        templates = IndicatorTemplates(**raw)
-        return templates
+        templates = load_templates(camel_to_snake(type(self).__name__))
+        label_description = translate(
+            templates.label_description,
+            fields=("green", "yellow", "red", "undefined"),
+        )
+        return templates.model_copy(
+            update={
+                "label_description": label_description,
+                "result_description": _(templates.result_description),
+            }
+        )
+
+
+@registry
+def load_templates(indicator_key: str) -> IndicatorTemplates:
+    """Read untranslated templates of an indicator from YAML file."""
+    raw = load_yaml(f"ohsome_quality_api.indicators.{indicator_key}", "templates.yaml")
+    return IndicatorTemplates(**raw)
@@ -1,11 +1,10 @@
+import asyncio
 import logging
-import os
-from pathlib import Path
 from string import Template
+from types import MappingProxyType
 
 import geojson
 import plotly.graph_objects as pgo
-import yaml
 from babel.dates import format_date
 from babel.numbers import format_decimal, format_percent
 from dateutil import parser
@@ -20,16 +19,14 @@ from ohsome_quality_api.geodatabase import client as db_client
 from ohsome_quality_api.indicators.base import BaseIndicator
 from ohsome_quality_api.ohsome import client as ohsome_client
 from ohsome_quality_api.topics.models import Topic
+from ohsome_quality_api.utils.helper_asyncio import gather_with_semaphore
+from ohsome_quality_api.utils.registry import load_sql, load_yaml, registry
 
 logger = logging.getLogger(__name__)
 
 
 def is_ohsomedb_enabled() -> bool:
-    ohsomedb_enabled = get_config_value("ohsomedb_enabled")
-    if ohsomedb_enabled or ohsomedb_enabled in ("True", "true"):  # noqa: SIM103
-        return True
-    else:
-        return False
+    return bool(get_config_value("ohsomedb_enabled"))
 
 
 class BuildingComparison(BaseIndicator):
@@ -87,66 +84,133 @@ class BuildingComparison(BaseIndicator):
         else:
             await self.preprocess_ohsomeapi()
 
-    async def preprocess_ohsomeapi(self) -> None:
-        for key, val in self.data_ref.items():
-            # get coverage [%]
-            self.area_cov[key] = await db_client.get_intersection_area(
-                self.feature,
-                val["coverage"]["simple"],
-            )
-            if self.check_major_edge_cases(key) != "":
-                continue
+    @classmethod
+    def has_preprocess_batch(cls) -> bool:
+        # OSM data is fetched for each feature on its own from the ohsomeDB
+        return not is_ohsomedb_enabled()
 
-            # clip input geom with coverage of reference dataset
-            feature = await db_client.get_intersection_geom(
-                self.feature,
-                val["coverage"]["simple"],
+    @classmethod
+    async def preprocess_batch(cls, indicators: list["BuildingComparison"]) -> None:
+        """Fetch OSM building area of all features in one request to the ohsome API.
+
+        The request runs concurrently to the queries of the reference building area.
+        """
+        if is_ohsomedb_enabled():
+            await super().preprocess_batch(indicators)
+            return
+        clipped = await gather_with_semaphore(
+            [indicator.preprocess_coverage() for indicator in indicators]
+        )
+        targets = [
+            (indicator, key, feature)
+            for indicator, features in zip(indicators, clipped, strict=True)
+            for key, feature in features.items()
+        ]
+        if not targets:
+            return
+
+        async def get_area_osm() -> None:
+            results = await ohsome_client.query_group_by_boundary(
+                indicators[0].topic,
+                [target[2] for target in targets],
             )
+            for (indicator, key, _feature), result in zip(
+                targets, results, strict=True
+            ):
+                indicator.set_area_osm(key, result)
+
+        await gather_with_semaphore(
+            [
+                get_area_osm(),
+                *(
+                    indicator.get_area_ref(key, feature)
+                    for indicator, key, feature in targets
+                ),
+            ]
+        )
 
-            # get reference building area
-            result = await get_reference_building_area(
-                geojson.dumps(feature), val["table_name"]
+    async def preprocess_ohsomeapi(self) -> None:
+        async def preprocess_dataset(key: str) -> None:
+            feature = await self.get_intersection(key)
+            if feature is None:
+                return
+            # Reference and OSM building area are independent of each other
+            await asyncio.gather(
+                self.get_area_ref(key, feature),
+                self.get_area_osm(key, feature),
             )
-            self.area_ref[key] = result / (1000 * 1000)
 
-            # get osm building area
-            result = await ohsome_client.query(self.topic, feature)
-            value = result["result"][0]["value"] or 0.0  # if None
-            self.area_osm[key] = value / (1000 * 1000)
-            timestamp = result["result"][0]["timestamp"]
-            self.result.timestamp_osm = parser.isoparse(timestamp)
+        await asyncio.gather(*(preprocess_dataset(key) for key in self.data_ref))
 
     async def preprocess_ohsomedb(self) -> None:
-        for key, val in self.data_ref.items():
-            # get coverage [%]
-            self.area_cov[key] = await db_client.get_intersection_area(
-                self.feature,
-                val["coverage"]["simple"],
+        async def preprocess_dataset(key: str) -> None:
+            feature = await self.get_intersection(key)
+            if feature is None:
+                return
+            # OSM building area is queried for the whole AoI. The query is identical
+            # for each dataset and shared between them (see `SingleFlight`).
+            await asyncio.gather(
+                self.get_area_ref(key, feature),
+                self.get_area_osm_ohsomedb(key),
             )
-            if self.check_major_edge_cases(key) != "":
-                continue
 
-            # clip input geom with coverage of reference dataset
-            feature = await db_client.get_intersection_geom(
-                self.feature,
-                val["coverage"]["simple"],
-            )
+        await asyncio.gather(*(preprocess_dataset(key) for key in self.data_ref))
 
-            # get reference building area
-            result = await get_reference_building_area(
-                geojson.dumps(feature), val["table_name"]
-            )
-            self.area_ref[key] = result / (1000 * 1000)
+    async def preprocess_coverage(self) -> dict[str, Feature]:
+        """Get coverage of the reference datasets.
 
-            # get osm building area
-            result = await ohsomedb.single_snapshot_aggregation(
-                aggregation=self.topic.aggregation_type,
-                bpolys=self.feature.geometry,
-                filter_=self.topic.filter,
-            )
-            value = float(result[0]["value"]) or 0.0  # if None
-            self.area_osm[key] = value / (1000 * 1000)
-            self.result.timestamp_osm = result[0]["snapshot_ts"]
+        Returns:
+            The AoI clipped with the coverage of each reference dataset for which no
+            major edge case is present.
+        """
+        clipped = await asyncio.gather(
+            *(self.get_intersection(key) for key in self.data_ref)
+        )
+        return {
+            key: feature
+            for key, feature in zip(self.data_ref, clipped, strict=True)
+            if feature is not None
+        }
+
+    async def get_intersection(self, key: str) -> Feature | None:
+        """Get coverage [%] and clip input geom with coverage of reference dataset.
+
+        Returns:
+            The clipped input geom or `None` if a major edge case is present.
+        """
+        self.area_cov[key], feature = await db_client.get_intersection(
+            self.feature,
+            self.data_ref[key]["coverage"]["simple"],
+        )
+        if self.check_major_edge_cases(key) != "":
+            return None
+        return feature
+
+    async def get_area_ref(self, key: str, feature: Feature) -> None:
+        result = await get_reference_building_area(
+            geojson.dumps(feature), self.data_ref[key]["table_name"]
+        )
+        self.area_ref[key] = result / (1000 * 1000)
+
+    async def get_area_osm(self, key: str, feature: Feature) -> None:
+        result = await ohsome_client.query(self.topic, feature)
+        self.set_area_osm(key, result)
+
+    def set_area_osm(self, key: str, result: dict) -> None:
+        value = result["result"][0]["value"] or 0.0  # if None
+        self.area_osm[key] = value / (1000 * 1000)
+        timestamp = result["result"][0]["timestamp"]
+        self.result.timestamp_osm = parser.isoparse(timestamp)
+
+    async def get_area_osm_ohsomedb(self, key: str) -> None:
+        result = await ohsomedb.single_snapshot_aggregation(
+            aggregation=self.topic.aggregation_type,
+            bpolys=self.feature.geometry,
+            filter_=self.topic.filter,
+        )
+        value = float(result[0]["value"]) or 0.0  # if None
+        self.area_osm[key] = value / (1000 * 1000)
+        self.result.timestamp_osm = result[0]["snapshot_ts"]
 
     def calculate(self) -> None:
         major_edge_case: bool = False
@@ -359,19 +423,14 @@ class BuildingComparison(BaseIndicator):
 # alru needs hashable type, therefore, use string instead of Feature
 # @alru_cache
 async def get_reference_building_area(feature_str: str, table_name: str) -> float:
-    path = Path(__file__).parent / "query.sql"
-    with open(path, "r") as file:
-        query = file.read()
+    query = load_sql(__package__, "query.sql", table_name=table_name)
     feature = geojson.loads(feature_str)
-    geom = geojson.dumps(feature.geometry)
-    results = await db_client.fetch(
-        query.format(table_name=table_name),
-        geom,
-    )
+    results = await db_client.fetch(query, feature.geometry)
     return results[0][0] or 0.0
 
 
-def load_datasets_metadata() -> dict:
-    file_path = os.path.join(os.path.dirname(__file__), "datasets.yaml")
-    with open(file_path, "r") as f:
-        return yaml.safe_load(f)
+@registry
+def load_datasets_metadata() -> MappingProxyType[str, dict]:
+    return load_yaml(
+        "ohsome_quality_api.indicators.building_comparison", "datasets.yaml"
+    )
@@ -1,7 +1,7 @@
 WITH bpoly AS (
     SELECT
         -- split mutlipolygon into list of polygons for more efficient processing
-        (ST_DUMP (ST_Setsrid (ST_GeomFromGeoJSON ($1), 4326))).geom AS geom
+        (ST_DUMP ($1::geometry)).geom AS geom
 )
 SELECT
     SUM({table_name}.area) as area
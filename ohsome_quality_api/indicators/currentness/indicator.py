@@ -10,13 +10,11 @@ Abbreviations:
 
 import locale
 import logging
-import os
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from string import Template
 
 import plotly.graph_objects as pgo
-import yaml
 from babel.dates import format_date
 from babel.numbers import format_decimal, format_percent
 from dateutil.parser import isoparse
@@ -24,10 +22,12 @@ from fastapi_i18n import _, get_locale
 from geojson import Feature
 from plotly.subplots import make_subplots
 
+from ohsome_quality_api import ohsomedb
 from ohsome_quality_api.definitions import Color
 from ohsome_quality_api.indicators.base import BaseIndicator
 from ohsome_quality_api.ohsome_api import client as ohsome_client
 from ohsome_quality_api.topics.models import Topic
+from ohsome_quality_api.utils.registry import load_yaml, registry
 
 logger = logging.getLogger(__name__)
 
@@ -76,30 +76,18 @@ class Currentness(BaseIndicator):
         Beside the creation, latest contribution includes also the change to the
         geometry and the tag. It excludes deletion.
         """
-        raw = await ohsome_client.metadata()
-        latest_timestamp = datetime.fromisoformat(
-            raw["temporalExtent"]["latestTimestamp"]
-        )
-        end = latest_timestamp.strftime("%Y-%m-01")
-        start = "2008-" + latest_timestamp.strftime("%m-%d")
-        result = await ohsome_client.currentness(
-            aoi=self.feature["geometry"],
-            measure=self.topic.aggregation_type,
-            ohsome_filter=self.topic.filter,
-            time_bins={
-                "start": start,
-                "end": end,
-                "binSize": "P1M",
-            },
-        )
+        if ohsomedb.is_enabled("currentness"):
+            ends, values = await self.preprocess_ohsomedb()
+        else:
+            ends, values = await self.preprocess_ohsome_api()
         contrib_abs = []
         contrib_sum = 0
 
         # latest contributions first
-        timestamps = [isoparse(t) for t in reversed(result["end"])]
+        timestamps = list(reversed(ends))
 
         # latest contributions first
-        for c in reversed(result["value"]):
+        for c in reversed(values):
             match self.topic.aggregation_type:
                 case "count":
                     value = c
@@ -121,6 +109,39 @@ class Currentness(BaseIndicator):
         self.contrib_sum = contrib_sum
         self.result.timestamp_osm = timestamps[0]
 
+    async def preprocess_ohsome_api(self) -> tuple[list[datetime], list[float]]:
+        raw = await ohsome_client.metadata()
+        latest_timestamp = datetime.fromisoformat(
+            raw["temporalExtent"]["latestTimestamp"]
+        )
+        end = latest_timestamp.strftime("%Y-%m-01")
+        start = "2008-" + latest_timestamp.strftime("%m-%d")
+        result = await ohsome_client.currentness(
+            aoi=self.feature["geometry"],
+            measure=self.topic.aggregation_type,
+            ohsome_filter=self.topic.filter,
+            time_bins={
+                "start": start,
+                "end": end,
+                "binSize": "P1M",
+            },
+        )
+        return [isoparse(t) for t in result["end"]], result["value"]
+
+    async def preprocess_ohsomedb(self) -> tuple[list[datetime], list[float]]:
+        # The ohsomeDB is queried for its current snapshot
+        latest_timestamp = datetime.now(timezone.utc)
+        end = latest_timestamp.strftime("%Y-%m-01")
+        start = "2008-" + latest_timestamp.strftime("%m-%d")
+        result = await ohsomedb.latest_contribution_bins(
+            aggregation=self.topic.aggregation_type,
+            bpolys=self.feature["geometry"],
+            filter_=self.topic.filter,
+            start=start,
+            end=end,
+        )
+        return [r["end"] for r in result], [r["value"] for r in result]
+
     def calculate(self):
         """Determine up-to-date, in-between and out-of-date contributions.
 
@@ -372,6 +393,7 @@ def month_to_year_month(months: int):
     return " ".join([years_str, months_str]).strip()
 
 
+@registry
 def load_thresholds(topic_key: str) -> tuple[int, int, str]:
     """Load thresholds based on topic keys.
 
@@ -384,9 +406,7 @@ def load_thresholds(topic_key: str) -> tuple[int, int, str]:
     Returns:
         tuple: (up-to-date, out-of-date)
     """
-    file = os.path.join(os.path.dirname(__file__), "thresholds.yaml")
-    with open(file, "r") as f:
-        raw = yaml.safe_load(f)
+    raw = load_yaml("ohsome_quality_api.indicators.currentness", "thresholds.yaml")
     try:
         # topic thresholds
         source = raw[topic_key].get("source", "")
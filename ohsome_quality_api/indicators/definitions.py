@@ -1,45 +1,43 @@
-import os
 from enum import Enum
 
-import yaml
 from geojson import FeatureCollection
 
 from ohsome_quality_api.indicators.models import IndicatorMetadata
 from ohsome_quality_api.projects.definitions import ProjectEnum
-from ohsome_quality_api.topics.definitions import load_topic_presets
-from ohsome_quality_api.utils.helper import (
-    get_class_from_key,
-    get_module_dir,
-)
+from ohsome_quality_api.topics.definitions import get_topic_preset
+from ohsome_quality_api.utils.helper import get_class_from_key
+from ohsome_quality_api.utils.registry import load_yaml, registry, translate
 
 
 def get_indicator_keys() -> list[str]:
-    return [str(t) for t in load_indicators()]
+    return [str(t) for t in _load_indicators()]
 
 
-def load_indicators() -> dict[str, IndicatorMetadata]:
-    directory = get_module_dir("ohsome_quality_api.indicators")
-    file = os.path.join(directory, "indicators.yaml")
-    with open(file, "r") as f:
-        raw = yaml.safe_load(f)
+@registry
+def _load_indicators() -> dict[str, IndicatorMetadata]:
+    raw = load_yaml("ohsome_quality_api.indicators", "indicators.yaml")
     indicators = {}
     for k, v in raw.items():
         indicators[k] = IndicatorMetadata(**v)
     return indicators
 
 
+def load_indicators() -> dict[str, IndicatorMetadata]:
+    return {k: translate(v) for k, v in _load_indicators().items()}
+
+
 def get_indicator_metadata(project: ProjectEnum = None) -> dict[str, IndicatorMetadata]:
-    indicators = load_indicators()
+    indicators = _load_indicators()
     if project is not None:
-        return {k: v for k, v in indicators.items() if project in v.projects}
+        return {k: translate(v) for k, v in indicators.items() if project in v.projects}
     else:
-        return indicators
+        return {k: translate(v) for k, v in indicators.items()}
 
 
 def get_indicator(indicator_key: str) -> IndicatorMetadata:
-    indicators = get_indicator_metadata()
+    indicators = _load_indicators()
     try:
-        return indicators[indicator_key]
+        return translate(indicators[indicator_key])
     except KeyError as error:
         raise KeyError(
             "Invalid project key. Valid project keys are: " + str(indicators.keys())
@@ -48,8 +46,7 @@ def get_indicator(indicator_key: str) -> IndicatorMetadata:
 
 def get_valid_indicators(topic_key: str) -> tuple:
     """Get valid Indicator/Topic combination of a Topic."""
-    td = load_topic_presets()
-    return tuple(td[topic_key].indicators)
+    return tuple(get_topic_preset(topic_key).indicators)
 
 
 async def get_coverage(indicator_key: str, inverse: bool = False) -> FeatureCollection:
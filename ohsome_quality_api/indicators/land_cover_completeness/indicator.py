@@ -1,5 +1,5 @@
+import asyncio
 import logging
-from datetime import datetime
 from string import Template
 
 import plotly.graph_objects as pgo
@@ -8,6 +8,7 @@ from dateutil.parser import isoparse
 from fastapi_i18n import _, get_locale
 from geojson import Feature
 
+from ohsome_quality_api import ohsomedb
 from ohsome_quality_api.geodatabase import client as geodatabase_client
 from ohsome_quality_api.indicators.base import BaseIndicator
 from ohsome_quality_api.ohsome_api import client as ohsome_api_client
@@ -30,27 +31,37 @@ class LandCoverCompleteness(BaseIndicator):
         self.area_feature: float = 0
 
     async def preprocess(self):
-        self.area_feature = await geodatabase_client.area(self.feature)
+        if ohsomedb.is_enabled("land-cover-completeness"):
+            await self.preprocess_ohsomedb()
+            return
 
-        raw = await ohsome_api_client.metadata()
-        latest_timestamp = datetime.fromisoformat(
-            raw["temporalExtent"]["latestTimestamp"]
-        )
-        end = latest_timestamp.strftime("%Y-%m-01")
-        start = "2008-" + latest_timestamp.strftime("%m-%d")
-
-        result = await ohsome_api_client.features(
-            aoi=self.feature.geometry,
-            measure=self.topic.aggregation_type,
-            ohsome_filter=self.topic.filter,
-            time_series={"start": start, "end": end},
+        # Area of the AoI and of OSM features are queried concurrently
+        self.area_feature, result = await asyncio.gather(
+            geodatabase_client.area(self.feature),
+            ohsome_api_client.features_series_end(
+                aoi=self.feature.geometry,
+                measure=self.topic.aggregation_type,
+                ohsome_filter=self.topic.filter,
+            ),
         )
 
-        if result["value"][-1]:
-            self.area_osm = result["value"][-1] / 1_000_000
+        if result["value"]:
+            self.area_osm = result["value"] / 1_000_000
         else:
             self.area_osm = 0
-        self.result.timestamp_osm = isoparse(result["timestamp"][-1])
+        self.result.timestamp_osm = isoparse(result["timestamp"])
+
+    async def preprocess_ohsomedb(self):
+        self.area_feature, result = await asyncio.gather(
+            geodatabase_client.area(self.feature),
+            ohsomedb.single_snapshot_aggregation(
+                aggregation=self.topic.aggregation_type,
+                bpolys=self.feature.geometry,
+                filter_=self.topic.filter,
+            ),
+        )
+        self.area_osm = float(result[0]["value"] or 0) / 1_000_000
+        self.result.timestamp_osm = result[0]["snapshot_ts"]
 
     def calculate(self):
         area_ratio = self.area_osm / self.area_feature
@@ -1,11 +1,8 @@
-import json
 import logging
 import math
 from datetime import datetime, timezone
-from pathlib import Path
 from string import Template
 
-import geojson
 import plotly.graph_objects as pgo
 from babel.numbers import format_decimal, format_percent
 from fastapi_i18n import _, get_locale
@@ -24,6 +21,7 @@ from ohsome_quality_api.definitions import Color
 from ohsome_quality_api.geodatabase import client
 from ohsome_quality_api.indicators.base import BaseIndicator
 from ohsome_quality_api.topics.models import Topic
+from ohsome_quality_api.utils.registry import load_sql
 
 logger = logging.getLogger(__name__)
 # Source: https://land.copernicus.eu/content/corine-land-cover-nomenclature-guidelines/docs/pdf/CLC2018_Nomenclature_illustrated_guide_20190510.pdf
@@ -92,25 +90,21 @@ class LandCoverThematicAccuracy(BaseIndicator):
     @classmethod
     async def coverage(cls, inverse=False) -> list[Feature]:
         if inverse:
-            query = (
-                "SELECT ST_AsGeoJSON(inversed) FROM osm_corine_intersection_coverage"
-            )
+            query = "SELECT inversed FROM osm_corine_intersection_coverage"
         else:
-            query = "SELECT ST_AsGeoJSON(simple) FROM osm_corine_intersection_coverage"
+            query = "SELECT simple FROM osm_corine_intersection_coverage"
         result = await client.fetch(query)
-        return [Feature(geometry=geojson.loads(result[0][0]))]
+        return [Feature(geometry=result[0][0])]
 
     async def preprocess(self) -> None:
         if self.clc_class:
-            with open(Path(__file__).parent / "query-single-class.sql", "r") as file:
-                query = file.read()
+            query = load_sql(__package__, "query-single-class.sql")
             results = await client.fetch(
-                query, str(self.feature["geometry"]), int(self.clc_class.value)
+                query, self.feature["geometry"], int(self.clc_class.value)
             )
         else:
-            with open(Path(__file__).parent / "query-multi-classes.sql", "r") as file:
-                query = file.read()
-            results = await client.fetch(query, str(self.feature["geometry"]))
+            query = load_sql(__package__, "query-multi-classes.sql")
+            results = await client.fetch(query, self.feature["geometry"])
         self.clc_classes_corine = [str(r["clc_class_corine"]) for r in results]
         self.clc_classes_osm = [str(r["clc_class_osm"]) for r in results]
         self.areas = [r["area"] / 1_000_000 for r in results]  # sqkm
@@ -470,15 +464,22 @@ class LandCoverThematicAccuracy(BaseIndicator):
 
 
 async def get_covered_area(feature) -> float:
+    relation = await client.relate_to_coverage(
+        feature, "osm_corine_intersection_coverage", "simple"
+    )
+    match relation:
+        case "disjoint":
+            return 0.0
+        case "within":
+            return 1.0
     query = """SELECT ST_Area(
-            ST_Intersection(simple, ST_SetSRID(ST_GeomFromGeoJSON($1), 4326))
+            ST_Intersection(simple, $1::geometry)
                               ) / NULLIF(
-                ST_Area(ST_SetSRID(ST_GeomFromGeoJSON($1), 4326)), 0) AS
+                ST_Area($1::geometry), 0) AS
                       coverage_percent
 
            FROM osm_corine_intersection_coverage
-           WHERE ST_Intersects(simple, ST_SetSRID(ST_GeomFromGeoJSON($1), 4326))
+           WHERE ST_Intersects(simple, $1::geometry)
         """
-    feature_geojson_str = json.dumps(feature["geometry"])
-    result = await client.fetch(query, feature_geojson_str)
+    result = await client.fetch(query, feature["geometry"])
     return result[0][0]
@@ -1,7 +1,7 @@
 WITH bpoly AS (
     SELECT
         -- split mutlipolygon into list of polygons for more efficient processing
-        (ST_Dump (ST_SetSRID (ST_GeomFromGeoJSON ($1), 4326))).geom AS geometry
+        (ST_Dump ($1::geometry)).geom AS geometry
 )
 SELECT
     CLC_class as clc_class_corine,
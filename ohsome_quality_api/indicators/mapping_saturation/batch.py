@@ -0,0 +1,515 @@
+"""Fit statistical models to many time series at once.
+
+The Mapping Saturation indicator fits the same model families to the time series of
+every feature of a FeatureCollection. Instead of fitting each series on its own, the
+series are stacked into a 2-D array (features × months) and every model family is
+fitted to all series at once. The Levenberg-Marquardt algorithm below evaluates
+residuals and analytic Jacobians of all series in a single vectorized step. Initial
+guesses are computed for all series at once following the self-start functions of
+`native.py`.
+
+Series which can not be modeled by a model family (no convergence or nearly singular
+gradient at the solution) are skipped like a failed fit of a single model.
+
+Fitted models are returned as instances of the classes in `models.py`.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.stats.distributions import t as t_distribution
+
+from ohsome_quality_api.indicators.mapping_saturation import models
+from ohsome_quality_api.indicators.mapping_saturation.native import MIN_RCOND
+
+logger = logging.getLogger(__name__)
+
+MAX_ITERATIONS = 200
+# Same as the default tolerances of `scipy.optimize.curve_fit`
+TOLERANCE = 1.49012e-08
+
+# Initial guesses of the parameter `k` of the two-steps-sigmoidal model
+DOUBLES_K = tuple(10.0**-i for i in range(10))
+
+
+@dataclass(frozen=True)
+class Family:
+    """Model family fitted to all series at once.
+
+    Functions take x of shape (months,) and parameters of shape (series, parameters).
+    """
+
+    model: type[models.BaseStatModel]
+    coefficients: tuple[str, ...]
+    asymptote: int
+    function: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    jacobian: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    # Initial guesses tried in order until the fit of a series succeeds
+    starts: tuple[Callable[[np.ndarray, np.ndarray], np.ndarray], ...]
+    bounds: Callable[[np.ndarray, np.ndarray], tuple] | None = None
+    # Add 1 to data because model fails on zeros (see `models.SSmicmen`)
+    shift: bool = False
+    # Reject fits with a nearly singular gradient like R does
+    singular: bool = True
+
+
+def columns(params: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Split parameters into columns broadcastable against x."""
+    return tuple(params.T[..., np.newaxis])
+
+
+def linregress(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Simple linear regression of each row. Returns intercepts and slopes."""
+    x, y = np.broadcast_arrays(x, y)
+    x_mean = x.mean(axis=-1, keepdims=True)
+    y_mean = y.mean(axis=-1, keepdims=True)
+    slope = np.sum((x - x_mean) * (y - y_mean), axis=-1) / np.sum(
+        (x - x_mean) ** 2, axis=-1
+    )
+    return y_mean[:, 0] - slope * x_mean[:, 0], slope
+
+
+def linear(basis: tuple[np.ndarray, ...], y: np.ndarray) -> np.ndarray:
+    """Linear least squares of each row. Returns coefficients of the basis.
+
+    Coefficients of rows with non-finite values are NaN.
+    """
+    design = np.stack(np.broadcast_arrays(*basis, y)[:-1], axis=-1)
+    valid = np.all(np.isfinite(design), axis=(1, 2)) & np.all(np.isfinite(y), axis=1)
+    coef = np.full((len(y), len(basis)), np.nan)
+    coef[valid] = (np.linalg.pinv(design[valid]) @ y[valid, :, np.newaxis])[..., 0]
+    return coef
+
+
+def logit_start(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Initial guess of the midpoint and scale of logistic models."""
+    y_min = y.min(axis=1, keepdims=True)
+    rng = np.ptp(y, axis=1, keepdims=True)
+    prop = (y - y_min + 0.05 * rng) / (1.1 * rng)
+    return linregress(np.log(prop / (1 - prop)), x)
+
+
+def sigmoid(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    x_0, k, asym = columns(params)
+    return asym / (1 + np.exp(-k * (x - x_0)))
+
+
+def sigmoid_jacobian(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    x_0, k, asym = columns(params)
+    e = np.exp(-k * (x - x_0))
+    d = 1 / (1 + e)
+    return np.stack([-asym * d**2 * e * k, asym * d**2 * e * (x - x_0), d], -1)
+
+
+def sigmoid_start(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # Same as `models.Sigmoid.initial_guess`
+    ones = np.ones(len(y))
+    return np.column_stack([ones * x.size / 2, ones * 0, y.max(axis=1, initial=0)])
+
+
+def sigmoid_bounds(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Same as `models.Sigmoid.bounds`
+    ones = np.ones(len(y))
+    lower = np.column_stack([ones * 0, ones * -1, ones * 0])
+    upper = np.column_stack([ones * x.size * 1.5, ones, y.max(axis=1, initial=0)])
+    return lower, upper
+
+
+def logis(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    asym, xmid, scal = columns(params)
+    return asym / (1 + np.exp((xmid - x) / scal))
+
+
+def logis_jacobian(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    asym, xmid, scal = columns(params)
+    e = np.exp((xmid - x) / scal)
+    d = 1 / (1 + e)
+    return np.stack(
+        [d, -asym * d**2 * e / scal, asym * d**2 * e * (xmid - x) / scal**2], -1
+    )
+
+
+def logis_start(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    xmid, scal = logit_start(x, y)
+    d = 1 / (1 + np.exp((xmid[:, np.newaxis] - x) / scal[:, np.newaxis]))
+    (asym,) = linear((d,), y).T
+    return np.column_stack([asym, xmid, scal])
+
+
+def doubles(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    e, f, k, b, z, c = columns(params)
+    return (
+        e
+        + (f - e) * 1 / 2 * (np.tanh(k * (x - b)) + 1)
+        + (z - f) * 1 / 2 * (np.tanh(k * (x - c)) + 1)
+    )
+
+
+def doubles_jacobian(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    e, f, k, b, z, c = columns(params)
+    t_b = np.tanh(k * (x - b))
+    t_c = np.tanh(k * (x - c))
+    return np.stack(
+        [
+            1 - (t_b + 1) / 2,
+            (t_b + 1) / 2 - (t_c + 1) / 2,
+            (f - e) / 2 * (1 - t_b**2) * (x - b) + (z - f) / 2 * (1 - t_c**2) * (x - c),
+            -(f - e) / 2 * (1 - t_b**2) * k,
+            (t_c + 1) / 2,
+            -(z - f) / 2 * (1 - t_c**2) * k,
+        ],
+        -1,
+    )
+
+
+def doubles_start(x: np.ndarray, y: np.ndarray, k: float) -> np.ndarray:
+    # Same as `native.ssdoubles` and `ssdoubles.R`
+    ones = np.ones(len(y))
+    return np.column_stack(
+        [
+            y.min(axis=1),
+            y.max(axis=1) / 2,
+            ones * k,
+            x[np.argmin(y, axis=1)],
+            y.max(axis=1),
+            ones * x.max() * 0.5,
+        ]
+    )
+
+
+def fpl(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    a, b, xmid, scal = columns(params)
+    return a + (b - a) / (1 + np.exp((xmid - x) / scal))
+
+
+def fpl_jacobian(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    a, b, xmid, scal = columns(params)
+    e = np.exp((xmid - x) / scal)
+    d = 1 / (1 + e)
+    return np.stack(
+        [
+            1 - d,
+            d,
+            -(b - a) * d**2 * e / scal,
+            (b - a) * d**2 * e * (xmid - x) / scal**2,
+        ],
+        -1,
+    )
+
+
+def fpl_start(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    xmid, scal = logit_start(x, y)
+    d = 1 / (1 + np.exp((xmid[:, np.newaxis] - x) / scal[:, np.newaxis]))
+    a, b_a = linear((np.ones_like(d), d), y).T
+    return np.column_stack([a, a + b_a, xmid, scal])
+
+
+def asymp(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    asym, r0, lrc = columns(params)
+    return asym + (r0 - asym) * np.exp(-np.exp(lrc) * x)
+
+
+def asymp_jacobian(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    asym, r0, lrc = columns(params)
+    q = np.exp(-np.exp(lrc) * x)
+    return np.stack([1 - q, q, -(r0 - asym) * q * np.exp(lrc) * x], -1)
+
+
+def asymp_start(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # Rough estimate of the asymptote outside the range of y (`NLSstRtAsymptote`)
+    y_min, y_max, last = y.min(axis=1), y.max(axis=1), y[:, -1]
+    rng = np.ptp(y, axis=1)
+    asym = np.where(
+        np.abs(y_max - last) < np.abs(y_min - last), y_max + rng / 8, y_min - rng / 8
+    )
+    _, slope = linregress(x, np.log(np.abs(y - asym[:, np.newaxis])))
+    # Invalid initial estimate of the rate constant (slope >= 0) results in NaN
+    lrc = np.log(-slope)
+    q = np.exp(-np.exp(lrc[:, np.newaxis]) * x)
+    asym, r0 = linear((1 - q, q), y).T
+    return np.column_stack([asym, r0, lrc])
+
+
+def micmen(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    vm, k = columns(params)
+    return vm * x / (k + x)
+
+
+def micmen_jacobian(x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    vm, k = columns(params)
+    return np.stack([x / (k + x), -vm * x / (k + x) ** 2], -1)
+
+
+def micmen_start(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # Lineweaver-Burk
+    intercept, slope = linregress(1 / x, 1 / y)
+    k = np.abs(slope / intercept)
+    (vm,) = linear((x / (k[:, np.newaxis] + x),), y).T
+    return np.column_stack([vm, k])
+
+
+FAMILIES = (
+    Family(
+        model=models.Sigmoid,
+        coefficients=("x_0", "k", "L"),
+        asymptote=2,
+        function=sigmoid,
+        jacobian=sigmoid_jacobian,
+        starts=(sigmoid_start,),
+        bounds=sigmoid_bounds,
+        singular=False,
+    ),
+    Family(
+        model=models.SSlogis,
+        coefficients=("Asym", "xmid", "scal"),
+        asymptote=0,
+        function=logis,
+        jacobian=logis_jacobian,
+        starts=(logis_start,),
+    ),
+    Family(
+        model=models.SSdoubleS,
+        coefficients=("e", "f", "k", "b", "Z", "c"),
+        asymptote=4,
+        function=doubles,
+        jacobian=doubles_jacobian,
+        starts=tuple(partial(doubles_start, k=k) for k in DOUBLES_K),
+        shift=True,
+    ),
+    Family(
+        model=models.SSfpl,
+        coefficients=("A", "B", "xmid", "scal"),
+        asymptote=1,
+        function=fpl,
+        jacobian=fpl_jacobian,
+        starts=(fpl_start,),
+    ),
+    Family(
+        model=models.SSasymp,
+        coefficients=("asym", "R0", "lrc"),
+        asymptote=0,
+        function=asymp,
+        jacobian=asymp_jacobian,
+        starts=(asymp_start,),
+    ),
+    Family(
+        model=models.SSmicmen,
+        coefficients=("Vm", "K"),
+        asymptote=0,
+        function=micmen,
+        jacobian=micmen_jacobian,
+        starts=(micmen_start,),
+        shift=True,
+    ),
+)
+
+
+def levenberg_marquardt(
+    family: Family,
+    x: np.ndarray,
+    y: np.ndarray,
+    start: np.ndarray,
+    bounds: tuple[np.ndarray, np.ndarray] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Minimize the sum of squared residuals of all series at once.
+
+    Parameters of each series are updated independently. Bounds are enforced by
+    projecting the parameters onto the bounds after each step.
+
+    Returns:
+        Parameters and mask of converged series.
+    """
+    params = np.where(np.isfinite(start), start, 0)
+    if bounds is not None:
+        params = np.clip(params, *bounds)
+    residuals = family.function(x, params) - y
+    cost = np.sum(residuals**2, axis=1)
+    damping = np.full(len(y), 1e-3)
+    factor = np.full(len(y), 2.0)
+    converged = np.zeros(len(y), dtype=bool)
+    # Series with invalid initial guess can not be modeled
+    done = ~np.all(np.isfinite(start), axis=1) | ~np.isfinite(cost)
+    identity = np.eye(params.shape[1])
+    for _ in range(MAX_ITERATIONS):
+        (active,) = np.nonzero(~done)
+        if active.size == 0:
+            break
+        jacobian = family.jacobian(x, params[active])
+        jtj = jacobian.transpose(0, 2, 1) @ jacobian
+        gradient = (jacobian.transpose(0, 2, 1) @ residuals[active, :, np.newaxis])[
+            ..., 0
+        ]
+        # Gradient could not be evaluated (e.g. overflow)
+        valid = np.all(np.isfinite(jtj), axis=(1, 2)) & np.all(
+            np.isfinite(gradient), axis=1
+        )
+        done[active[~valid]] = True
+        active, jtj, gradient = active[valid], jtj[valid], gradient[valid]
+        # Scale parameters to unit gradient norm (Marquardt)
+        scale = np.sqrt(np.diagonal(jtj, axis1=1, axis2=2))
+        scale = np.where((scale > 0) & np.isfinite(scale), scale, 1)
+        scaled = jtj / (scale[:, :, np.newaxis] * scale[:, np.newaxis, :])
+        system = scaled + damping[active, np.newaxis, np.newaxis] * identity
+        try:
+            step = -np.linalg.solve(system, (gradient / scale)[..., np.newaxis])
+        except np.linalg.LinAlgError:
+            step = -(np.linalg.pinv(system) @ (gradient / scale)[..., np.newaxis])
+        step = step[..., 0] / scale
+        candidate = params[active] + step
+        if bounds is not None:
+            candidate = np.clip(candidate, bounds[0][active], bounds[1][active])
+            step = candidate - params[active]
+        candidate_residuals = family.function(x, candidate) - y[active]
+        candidate_cost = np.sum(candidate_residuals**2, axis=1)
+
+        # Actual and predicted (by the linear model) reduction of the cost
+        actual = cost[active] - candidate_cost
+        predicted = -np.sum(
+            step * (2 * gradient + (jtj @ step[..., np.newaxis])[..., 0]), axis=1
+        )
+        ratio = actual / predicted
+        better = np.isfinite(candidate_cost) & (actual > 0)
+        # Termination criteria of MINPACK (`scipy.optimize.leastsq`)
+        small = (
+            (np.abs(actual) <= TOLERANCE * cost[active])
+            & (predicted <= TOLERANCE * cost[active])
+        ) | (
+            np.linalg.norm(step * scale, axis=1)
+            <= TOLERANCE * np.linalg.norm(params[active] * scale, axis=1)
+        )
+        params[active[better]] = candidate[better]
+        residuals[active[better]] = candidate_residuals[better]
+        cost[active[better]] = candidate_cost[better]
+        # Update of the damping parameter by Nielsen (1999)
+        damping[active] = np.where(
+            better,
+            damping[active] * np.maximum(1 / 3, 1 - (2 * ratio - 1) ** 3),
+            damping[active] * factor[active],
+        )
+        factor[active] = np.where(better, 2, factor[active] * 2)
+        # No further decrease of the cost possible
+        stalled = damping[active] > 1e16
+        converged[active[small | stalled]] = True
+        done[active[small | stalled]] = True
+    return params, converged & np.all(np.isfinite(params), axis=1)
+
+
+def fit_family(
+    family: Family,
+    x: np.ndarray,
+    y: np.ndarray,
+    level: float = 0.95,
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray] | None]:
+    """Fit model family to all series.
+
+    Returns:
+        Coefficients, confidence interval of the asymptote and fitted values per series
+        or `None` if the series could not be modeled.
+    """
+    bounds = family.bounds(x, y) if family.bounds is not None else None
+    params = np.zeros((len(y), len(family.coefficients)))
+    success = np.zeros(len(y), dtype=bool)
+    for start in family.starts:
+        (failed,) = np.nonzero(~success)
+        if failed.size == 0:
+            break
+        result, converged = levenberg_marquardt(
+            family,
+            x,
+            y[failed],
+            start(x, y[failed]),
+            None if bounds is None else (bounds[0][failed], bounds[1][failed]),
+        )
+        if family.singular:
+            converged &= rcond(family, x, result) >= MIN_RCOND
+        params[failed] = result
+        success[failed[converged]] = True
+
+    fitted_values = family.function(x, params)
+    jacobian = family.jacobian(x, params)
+    degrees_of_freedom = x.size - params.shape[1]
+    variance = np.sum((fitted_values - y) ** 2, axis=1) / degrees_of_freedom
+    jtj = jacobian.transpose(0, 2, 1) @ jacobian
+    jtj = np.where(np.isfinite(jtj), jtj, 0)
+    scale = np.sqrt(np.diagonal(jtj, axis1=1, axis2=2))
+    scale = np.where(scale > 0, scale, 1)
+    scale = scale[:, :, np.newaxis] * scale[:, np.newaxis, :]
+    covariance = np.linalg.pinv(jtj / scale) / scale
+    tval = t_distribution.ppf(1.0 - (1.0 - level) / 2.0, degrees_of_freedom)
+    error = np.sqrt(variance * covariance[:, family.asymptote, family.asymptote]) * tval
+    asymptote = params[:, family.asymptote]
+    asym_conf_int = np.column_stack([asymptote - error, asymptote + error])
+
+    if family.singular:
+        # Gradient of constant series is singular (see `native.check`)
+        success &= np.ptp(y, axis=1) > 0
+
+    results = []
+    for i in range(len(y)):
+        result = (params[i], asym_conf_int[i], fitted_values[i])
+        if success[i] and all(np.all(np.isfinite(r)) for r in result):
+            results.append(result)
+        else:
+            results.append(None)
+    return results
+
+
+def rcond(family: Family, x: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """Reciprocal condition number of the column-scaled gradient of each series."""
+    jacobian = family.jacobian(x, params)
+    jacobian = jacobian / np.linalg.norm(jacobian, axis=1, keepdims=True)
+    jacobian = np.where(np.isfinite(jacobian), jacobian, 0)
+    singular_values = np.linalg.svd(jacobian, compute_uv=False)
+    return singular_values[:, -1] / singular_values[:, 0]
+
+
+def fit(xdata: ArrayLike, ydata: ArrayLike) -> list[list[models.BaseStatModel]]:
+    """Fit all model families to all time series at once.
+
+    Args:
+        xdata: Months of shape (months,).
+        ydata: Time series of shape (series, months).
+
+    Returns:
+        Fitted models per time series.
+    """
+    xdata = np.asarray(xdata)
+    ydata = np.asarray(ydata)
+    fitted_models: list[list[models.BaseStatModel]] = [[] for _ in ydata]
+    for family in FAMILIES:
+        logger.info("Run {} for {} series".format(family.model.name, len(ydata)))
+        x = xdata.astype(float)
+        y = ydata.astype(float)
+        if family.shift:
+            # Same as the model classes
+            if xdata.min(initial=0) == 0:
+                x = x + 1
+            y = np.where(ydata.min(axis=1, initial=0)[:, np.newaxis] == 0, y + 1, y)
+        with np.errstate(all="ignore"):
+            results = fit_family(family, x, y)
+        skipped = sum(result is None for result in results)
+        if skipped:
+            logger.info(
+                'Skipping model "{0}" for {1} series'.format(family.model.name, skipped)
+            )
+        for i, result in enumerate(results):
+            if result is None:
+                continue
+            coef, asym_conf_int, fitted_values = result
+            if family.shift:
+                # Substract 1 from fitted values to adjust manipulated ydata
+                fitted_values = fitted_values - 1
+            fitted_models[i].append(
+                family.model.from_fit(
+                    xdata,
+                    ydata[i],
+                    dict(zip(family.coefficients, coef, strict=True)),
+                    asym_conf_int,
+                    fitted_values,
+                )
+            )
+    return fitted_models
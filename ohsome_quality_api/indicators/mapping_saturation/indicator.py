@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from string import Template
 
 import numpy as np
@@ -10,9 +10,10 @@ from fastapi_i18n import _, get_locale
 from geojson import Feature
 from rpy2.rinterface_lib.embedded import RRuntimeError
 
+from ohsome_quality_api import ohsomedb
 from ohsome_quality_api.definitions import Color
 from ohsome_quality_api.indicators.base import BaseIndicator
-from ohsome_quality_api.indicators.mapping_saturation import models
+from ohsome_quality_api.indicators.mapping_saturation import batch, models
 from ohsome_quality_api.ohsome_api import client as ohsome_api_client
 from ohsome_quality_api.topics.models import Topic, TopicData
 
@@ -83,6 +84,10 @@ class MappingSaturation(BaseIndicator):
                 self.timestamps.append(isoparse(item["timestamp"]))
             return
 
+        if ohsomedb.is_enabled("mapping-saturation"):
+            await self.preprocess_ohsomedb()
+            return
+
         raw = await ohsome_api_client.metadata()
         latest_timestamp = datetime.fromisoformat(
             raw["temporalExtent"]["latestTimestamp"]
@@ -102,7 +107,51 @@ class MappingSaturation(BaseIndicator):
         self.values = result["value"]
         self.timestamps = [isoparse(t) for t in result["timestamp"]]
 
-    def calculate(self) -> None:  # noqa: C901
+    async def preprocess_ohsomedb(self):
+        # The ohsomeDB is queried for its current snapshot
+        latest_timestamp = datetime.now(timezone.utc)
+        end = latest_timestamp.strftime("%Y-%m-01")
+        start = "2008-" + latest_timestamp.strftime("%m-%d")
+        result = await ohsomedb.monthly_aggregation(
+            aggregation=self.topic.aggregation_type,
+            bpolys=self.feature["geometry"],
+            filter_=self.topic.filter,
+            start=start,
+            end=end,
+        )
+        self.values = [r["value"] for r in result]
+        self.timestamps = [r["timestamp"] for r in result]
+
+    @classmethod
+    def calculate_batch(cls, indicators: list["MappingSaturation"]) -> None:
+        """Calculate indicators of multiple features.
+
+        Models are fitted to the time series of all features at once (see `batch.py`).
+        """
+        # Time series of equal length are fitted together
+        groups: dict[int, list[MappingSaturation]] = {}
+        for indicator in indicators:
+            if not indicator.check_edge_cases():
+                groups.setdefault(len(indicator.values), []).append(indicator)
+        fitted_models = {}
+        for length, group in groups.items():
+            ydata = np.array([indicator.values for indicator in group])
+            results = batch.fit(np.arange(length), ydata)
+            for indicator, fm in zip(group, results, strict=True):
+                fitted_models[id(indicator)] = fm
+        for indicator in indicators:
+            indicator.calculate(fitted_models.get(id(indicator)))
+
+    def calculate(  # noqa: C901
+        self,
+        fitted_models: list[models.BaseStatModel] | None = None,
+    ) -> None:
+        """Calculate indicator.
+
+        Args:
+            fitted_models: Models already fitted to the data (see `calculate_batch`).
+                If not given, models are fitted one after another.
+        """
         # Latest timestamp of ohsome API results
         edge_case_description = self.check_edge_cases()
         self.result.timestamp_osm = self.timestamps[-1]
@@ -111,34 +160,8 @@ class MappingSaturation(BaseIndicator):
             self.result.description = edge_case_description
             return
         xdata = np.array(range(len(self.timestamps)))
-        fitted_models = []
-        for model in (
-            models.Sigmoid,
-            models.SSlogis,
-            models.SSdoubleS,
-            models.SSfpl,
-            models.SSasymp,
-            models.SSmicmen,
-        ):
-            logger.info("Run {}".format(model.name))
-            try:
-                fitted_models.append(model(xdata=xdata, ydata=np.array(self.values)))
-            # RRuntimeError can occur if data can not be modeled by the R model
-            except RRuntimeError as error:
-                logger.info(
-                    'Skipping model "{0}" due to RRuntimeError: {1}'.format(
-                        model.name, str(error).strip()
-                    )
-                )
-                continue
-            # RuntimeError can occur if data could not be modeled by `curve_fit` (scipy)
-            except RuntimeError as error:
-                logger.info(
-                    'Skipping model "{0}" due to RuntimeError: {1}'.format(
-                        model.name, str(error).strip()
-                    )
-                )
-                continue
+        if fitted_models is None:
+            fitted_models = self.fit_models(xdata)
         self.fitted_models = self.select_models(fitted_models)
         if not self.fitted_models:
             logger.info("No model has been run successfully.")
@@ -195,6 +218,38 @@ class MappingSaturation(BaseIndicator):
             + getattr(self.templates.label_description, self.result.label)
         )
 
+    def fit_models(self, xdata: np.ndarray) -> list[models.BaseStatModel]:
+        """Fit all models one after another. Skip models which can not be fitted."""
+        fitted_models = []
+        for model in (
+            models.Sigmoid,
+            models.SSlogis,
+            models.SSdoubleS,
+            models.SSfpl,
+            models.SSasymp,
+            models.SSmicmen,
+        ):
+            logger.info("Run {}".format(model.name))
+            try:
+                fitted_models.append(model(xdata=xdata, ydata=np.array(self.values)))
+            # RRuntimeError can occur if data can not be modeled by the R model
+            except RRuntimeError as error:
+                logger.info(
+                    'Skipping model "{0}" due to RRuntimeError: {1}'.format(
+                        model.name, str(error).strip()
+                    )
+                )
+                continue
+            # RuntimeError can occur if data could not be modeled by `curve_fit` (scipy)
+            except RuntimeError as error:
+                logger.info(
+                    'Skipping model "{0}" due to RuntimeError: {1}'.format(
+                        model.name, str(error).strip()
+                    )
+                )
+                continue
+        return fitted_models
+
     def create_figure(self) -> None:
         if self.result.label == "undefined" and self.best_fit is None:
             if not self.fitted_models and self.check_edge_cases() == "":
@@ -17,9 +17,21 @@ raise an `RRuntimeError`.
 #     `with robjects.default_converter.context()`
 #     because of
 #     https://github.com/rpy2/rpy2/pull/1076/changes#diff-0f477f4ec1a1057412d1907d470a84b42251161f3581383d2713e7775b6a62bf
+#
+# NOTE: The embedded R is not thread-safe. Calls from multiple threads (e.g. thread
+#     pool executor) are serialized using `R_LOCK`.
+#
+# NOTE: If `r_workers` is configured, R models are fitted by a pool of R worker
+#     processes (see `r_worker.py`) instead of the R embedded in this process.
+#
+# NOTE: If `mapping_saturation_backend` is `numpy`, self-starting models are fitted by
+#     native NumPy/SciPy implementations (see `native.py`) instead of R.
 
 import os
+import threading
 from abc import ABC, abstractmethod
+from functools import cache
+from typing import Callable
 
 import numpy as np
 import rpy2.robjects.packages as rpackages
@@ -28,6 +40,84 @@ from rpy2 import robjects
 from scipy.optimize import curve_fit
 from scipy.stats.distributions import t as t_distribution
 
+# Import module instead of function to avoid circular import (config -> utils.helper)
+from ohsome_quality_api import config
+from ohsome_quality_api.indicators.mapping_saturation import native, r_worker
+
+R_LOCK = threading.Lock()
+
+SSDOUBLES_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "ssdoubles.R"
+)
+
+
+@cache
+def load_rstats():
+    """Import R `stats` package and define `SSdoubleS` once per process."""
+    with robjects.default_converter.context():
+        rstats = rpackages.importr("stats")
+        with open(SSDOUBLES_FILE, "r") as f:
+            robjects.r(f.read())
+    return rstats
+
+
+def fit_nls(
+    formula: str,
+    asym: str,
+    xdata: ArrayLike,
+    ydata: ArrayLike,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fit self-starting nonlinear model using the R embedded in this process.
+
+    Args:
+        formula: R formula of the model
+        asym: Name of the parameter representing the asymptote
+
+    Returns:
+        Coefficients, confidence interval of the asymptote and fitted values.
+    """
+    with R_LOCK, robjects.default_converter.context():
+        rstats = load_rstats()
+        fmla = robjects.Formula(formula)
+        env = fmla.environment
+        env["x"] = robjects.FloatVector(xdata)
+        env["y"] = robjects.FloatVector(ydata)
+        fm = rstats.nls(fmla)
+        return (
+            np.array(rstats.coef(fm)),
+            np.array(rstats.confint(fm, asym, 0.95)),
+            np.array(rstats.fitted(fm)),
+        )
+
+
+def nls(
+    formula: str,
+    asym: str,
+    xdata: ArrayLike,
+    ydata: ArrayLike,
+    fit_native: Callable[[ArrayLike, ArrayLike], native.FitResult],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fit self-starting nonlinear model using the configured backend.
+
+    Args:
+        formula: R formula of the model
+        asym: Name of the parameter representing the asymptote
+        fit_native: Native implementation of the model
+    """
+    backend = config.get_config_value("mapping_saturation_backend")
+    match backend:
+        case "numpy":
+            return fit_native(xdata, ydata)
+        case "r" if config.get_config_value("r_workers") > 0:
+            return r_worker.get_pool().fit(formula, asym, xdata, ydata)
+        case "r":
+            return fit_nls(formula, asym, xdata, ydata)
+        case _:
+            raise ValueError(
+                "Invalid mapping saturation backend: {}. ".format(backend)
+                + "Valid backends are: r and numpy."
+            )
+
 
 class BaseStatModel(ABC):
     """Base Statistical Model"""
@@ -40,6 +130,23 @@ class BaseStatModel(ABC):
         self.fitted_values = None
         self.asym_conf_int = None
 
+    @classmethod
+    def from_fit(
+        cls,
+        xdata: ArrayLike,
+        ydata: ArrayLike,
+        coefficients: dict,
+        asym_conf_int: ArrayLike,
+        fitted_values: ArrayLike,
+    ) -> "BaseStatModel":
+        """Create model from parameters estimated elsewhere (see `batch.py`)."""
+        model = cls.__new__(cls)
+        BaseStatModel.__init__(model, xdata, ydata)
+        model.coefficients = coefficients
+        model.asym_conf_int = asym_conf_int
+        model.fitted_values = fitted_values
+        return model
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -210,22 +317,18 @@ class SSlogis(BaseStatModel):
 
     def __init__(self, xdata, ydata):
         super().__init__(xdata, ydata)
-        with robjects.default_converter.context():
-            rstats = rpackages.importr("stats")
-            fmla = robjects.Formula("y ~ SSlogis(x, Asym, xmid, scal)")
-            env = fmla.environment
-            env["x"] = robjects.FloatVector(xdata)
-            env["y"] = robjects.FloatVector(ydata)
-            fm = rstats.nls(fmla)
-            coef = np.array(rstats.coef(fm))
-            self.coefficients = {
-                "Asym": coef[0],
-                "xmid": coef[1],
-                "scal": coef[2],
-            }
-            # Confidence interval of asymptote
-            self.asym_conf_int = np.array(rstats.confint(fm, "Asym", 0.95))
-            self.fitted_values = np.array(rstats.fitted(fm))
+        coef, self.asym_conf_int, self.fitted_values = nls(
+            "y ~ SSlogis(x, Asym, xmid, scal)",
+            "Asym",
+            xdata,
+            ydata,
+            native.sslogis,
+        )
+        self.coefficients = {
+            "Asym": coef[0],
+            "xmid": coef[1],
+            "scal": coef[2],
+        }
 
     @property
     def asymptote(self):
@@ -260,31 +363,23 @@ class SSdoubleS(BaseStatModel):
             xdata = xdata + 1
         if ydata.min(initial=0) == 0:
             ydata = ydata + 1
-        with robjects.default_converter.context():
-            rstats = rpackages.importr("stats")
-            fp = os.path.join(
-                os.path.dirname(os.path.realpath(__file__)), "ssdoubles.R"
-            )
-            with open(fp, "r") as f:
-                ssdoubles = f.read()
-            robjects.r(ssdoubles)
-            fmla = robjects.Formula("y ~ SSdoubleS(x, e, f, k, b, Z, c)")
-            env = fmla.environment
-            env["x"] = robjects.FloatVector(xdata)
-            env["y"] = robjects.FloatVector(ydata)
-            fm = rstats.nls(fmla)
-            coef = np.array(rstats.coef(fm))
-            self.coefficients = {
-                "e": coef[0],
-                "f": coef[1],
-                "k": coef[2],
-                "b": coef[3],
-                "Z": coef[4],
-                "c": coef[5],
-            }
-            self.asym_conf_int = np.array(rstats.confint(fm, "Z", 0.95))
-            # Substract 1 from fitted values to adjust manipulated ydata (ydata + 1)
-            self.fitted_values = np.array(rstats.fitted(fm)) - 1
+        coef, self.asym_conf_int, fitted_values = nls(
+            "y ~ SSdoubleS(x, e, f, k, b, Z, c)",
+            "Z",
+            xdata,
+            ydata,
+            native.ssdoubles,
+        )
+        self.coefficients = {
+            "e": coef[0],
+            "f": coef[1],
+            "k": coef[2],
+            "b": coef[3],
+            "Z": coef[4],
+            "c": coef[5],
+        }
+        # Substract 1 from fitted values to adjust manipulated ydata (ydata + 1)
+        self.fitted_values = fitted_values - 1
 
     @property
     def asymptote(self):
@@ -324,22 +419,19 @@ class SSfpl(BaseStatModel):
 
     def __init__(self, xdata, ydata):
         super().__init__(xdata, ydata)
-        with robjects.default_converter.context():
-            rstats = rpackages.importr("stats")
-            fmla = robjects.Formula("y ~ SSfpl(x, A, B, xmid, scal)")
-            env = fmla.environment
-            env["x"] = robjects.FloatVector(xdata)
-            env["y"] = robjects.FloatVector(ydata)
-            fm = rstats.nls(fmla)
-            coef = np.array(rstats.coef(fm))
-            self.coefficients = {
-                "A": coef[0],
-                "B": coef[1],
-                "xmid": coef[2],
-                "scal": coef[3],
-            }
-            self.asym_conf_int = np.array(rstats.confint(fm, "B", 0.95))
-            self.fitted_values = np.array(rstats.fitted(fm))
+        coef, self.asym_conf_int, self.fitted_values = nls(
+            "y ~ SSfpl(x, A, B, xmid, scal)",
+            "B",
+            xdata,
+            ydata,
+            native.ssfpl,
+        )
+        self.coefficients = {
+            "A": coef[0],
+            "B": coef[1],
+            "xmid": coef[2],
+            "scal": coef[3],
+        }
 
     @property
     def asymptote(self):
@@ -376,21 +468,18 @@ class SSasymp(BaseStatModel):
 
     def __init__(self, xdata, ydata):
         super().__init__(xdata, ydata)
-        with robjects.default_converter.context():
-            rstats = rpackages.importr("stats")
-            fmla = robjects.Formula("y ~ SSasymp(x, asym, R0, lrc)")
-            env = fmla.environment
-            env["x"] = robjects.FloatVector(xdata)
-            env["y"] = robjects.FloatVector(ydata)
-            fm = rstats.nls(fmla)
-            coef = np.array(rstats.coef(fm))
-            self.coefficients = {
-                "asym": coef[0],
-                "R0": coef[1],
-                "lrc": coef[2],
-            }
-            self.asym_conf_int = np.array(rstats.confint(fm, "asym", 0.95))
-            self.fitted_values = np.array(rstats.fitted(fm))
+        coef, self.asym_conf_int, self.fitted_values = nls(
+            "y ~ SSasymp(x, asym, R0, lrc)",
+            "asym",
+            xdata,
+            ydata,
+            native.ssasymp,
+        )
+        self.coefficients = {
+            "asym": coef[0],
+            "R0": coef[1],
+            "lrc": coef[2],
+        }
 
     @property
     def asymptote(self):
@@ -427,21 +516,19 @@ class SSmicmen(BaseStatModel):
             xdata = xdata + 1
         if ydata.min(initial=0) == 0:
             ydata = ydata + 1
-        with robjects.default_converter.context():
-            rstats = rpackages.importr("stats")
-            fmla = robjects.Formula("y ~ SSmicmen(x, Vm, K)")
-            env = fmla.environment
-            env["x"] = robjects.FloatVector(xdata)
-            env["y"] = robjects.FloatVector(ydata)
-            fm = rstats.nls(fmla)
-            coef = np.array(rstats.coef(fm))
-            self.coefficients = {
-                "Vm": coef[0],
-                "K": coef[1],
-            }
-            self.asym_conf_int = np.array(rstats.confint(fm, "Vm", 0.95))
-            # Substract 1 from fitted values to adjust manipulated ydata (ydata + 1)
-            self.fitted_values = np.array(rstats.fitted(fm)) - 1
+        coef, self.asym_conf_int, fitted_values = nls(
+            "y ~ SSmicmen(x, Vm, K)",
+            "Vm",
+            xdata,
+            ydata,
+            native.ssmicmen,
+        )
+        self.coefficients = {
+            "Vm": coef[0],
+            "K": coef[1],
+        }
+        # Substract 1 from fitted values to adjust manipulated ydata (ydata + 1)
+        self.fitted_values = fitted_values - 1
 
     @property
     def asymptote(self):
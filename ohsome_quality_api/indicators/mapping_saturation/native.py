@@ -0,0 +1,266 @@
+"""Native NumPy/SciPy implementations of the self-starting R models.
+
+The initial parameter estimates follow the self-start functions of the R `stats`
+package (`SSlogis`, `SSfpl`, `SSasymp` and `SSmicmen`) and of `ssdoubles.R`. Starting
+from those, all parameters are estimated by non-linear least squares.
+
+Differences to R:
+    Confidence intervals of the asymptote are Wald intervals based on the
+    t-distribution. R computes confidence intervals by profiling the likelihood.
+
+    R fails to fit ill-conditioned models ("singular gradient"). Fits with a nearly
+    singular gradient at the solution are rejected (see `MIN_RCOND`).
+
+All fit functions return the coefficients (in the same order as the R models), the
+confidence interval of the asymptote and the fitted values. A `NativeFitError` is
+raised if the model can not be fitted. This corresponds to an `RRuntimeError` raised
+by `nls` of R (e.g. "singular gradient").
+"""
+
+import warnings
+from typing import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.optimize import OptimizeWarning, curve_fit, least_squares
+from scipy.stats.distributions import t as t_distribution
+
+FitResult = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+# Minimal reciprocal condition number of the (column-scaled) gradient at the solution
+MIN_RCOND = 1e-3
+
+
+class NativeFitError(RuntimeError):
+    """Model could not be fitted."""
+
+
+def logis(x: ArrayLike, asym: float, xmid: float, scal: float) -> ArrayLike:
+    return asym / (1 + np.exp((xmid - x) / scal))
+
+
+def doubles(
+    x: ArrayLike,
+    e: float,
+    f: float,
+    k: float,
+    b: float,
+    z: float,
+    c: float,
+) -> ArrayLike:
+    return (
+        e
+        + (f - e) * 1 / 2 * (np.tanh(k * (x - b)) + 1)
+        + (z - f) * 1 / 2 * (np.tanh(k * (x - c)) + 1)
+    )
+
+
+def fpl(x: ArrayLike, a: float, b: float, xmid: float, scal: float) -> ArrayLike:
+    return a + (b - a) / (1 + np.exp((xmid - x) / scal))
+
+
+def asymp(x: ArrayLike, asym: float, r0: float, lrc: float) -> ArrayLike:
+    return asym + (r0 - asym) * np.exp(-np.exp(lrc) * x)
+
+
+def micmen(x: ArrayLike, vm: float, k: float) -> ArrayLike:
+    return vm * x / (k + x)
+
+
+def lm(x: ArrayLike, y: ArrayLike) -> tuple[float, float]:
+    """Simple linear regression. Returns intercept and slope."""
+    slope, intercept = np.polyfit(x, y, 1)
+    return intercept, slope
+
+
+def plinear(
+    basis: Callable[..., np.ndarray],
+    x: ArrayLike,
+    y: ArrayLike,
+    start: tuple,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Partially linear least squares like `nls(algorithm = "plinear")` of R.
+
+    Args:
+        basis: Function of x and the nonlinear parameters returning the columns
+            multiplied by the linear parameters.
+        start: Initial guess of the nonlinear parameters.
+
+    Returns:
+        Nonlinear and linear parameters.
+    """
+
+    def linear(params: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        columns = np.column_stack(basis(x, *params))
+        beta = np.linalg.lstsq(columns, y, rcond=None)[0]
+        return columns, beta
+
+    def residuals(params: ArrayLike) -> np.ndarray:
+        columns, beta = linear(params)
+        return columns @ beta - y
+
+    result = least_squares(residuals, np.asarray(start, dtype=float), method="lm")
+    if not result.success or not np.all(np.isfinite(result.x)):
+        raise NativeFitError("Partially linear fit did not converge.")
+    return result.x, linear(result.x)[1]
+
+
+def rcond(function: Callable, x: ArrayLike, params: ArrayLike) -> float:
+    """Reciprocal condition number of the column-scaled gradient.
+
+    The gradient is computed by complex-step differentiation, which does not suffer
+    from cancellation like finite differences.
+    """
+    x = np.asarray(x, dtype=complex)
+    steps = 1e-20 * np.maximum(np.abs(params), 1)
+    gradient = np.column_stack(
+        [
+            function(x, *(params + 1j * step * unit)).imag / step
+            for step, unit in zip(steps, np.eye(len(params)), strict=True)
+        ]
+    )
+    gradient = gradient / np.linalg.norm(gradient, axis=0)
+    singular_values = np.linalg.svd(gradient, compute_uv=False)
+    return singular_values[-1] / singular_values[0]
+
+
+def fit(
+    function: Callable,
+    x: ArrayLike,
+    y: ArrayLike,
+    start: ArrayLike,
+    asym: int,
+    level: float = 0.95,
+) -> FitResult:
+    """Estimate all parameters by non-linear least squares.
+
+    Args:
+        asym: Position of the asymptote parameter.
+    """
+    try:
+        with warnings.catch_warnings():
+            # Covariance could not be estimated. Checked below.
+            warnings.simplefilter("ignore", OptimizeWarning)
+            popt, pcov = curve_fit(function, x, y, p0=start)
+    except (RuntimeError, ValueError, np.linalg.LinAlgError) as error:
+        raise NativeFitError(str(error)) from error
+    if not np.all(np.isfinite(pcov)) or not rcond(function, x, popt) >= MIN_RCOND:
+        raise NativeFitError("Singular gradient.")
+    degrees_of_freedom = len(y) - len(popt)
+    tval = t_distribution.ppf(1.0 - (1.0 - level) / 2.0, degrees_of_freedom)
+    error = np.sqrt(np.diag(pcov))[asym] * tval
+    asym_conf_int = np.array([popt[asym] - error, popt[asym] + error])
+    return popt, asym_conf_int, function(x, *popt)
+
+
+def logit_start(x: ArrayLike, y: ArrayLike) -> tuple[float, float]:
+    """Initial guess of the midpoint and scale of logistic models."""
+    rng = y.max() - y.min()
+    prop = (y - y.min() + 0.05 * rng) / (1.1 * rng)
+    return lm(np.log(prop / (1 - prop)), x)
+
+
+def check(func: Callable[[np.ndarray, np.ndarray], FitResult]) -> Callable:
+    """Validate input, ignore floating point errors and check result."""
+
+    def wrapper(xdata: ArrayLike, ydata: ArrayLike) -> FitResult:
+        x = np.asarray(xdata, dtype=float)
+        y = np.asarray(ydata, dtype=float)
+        if len(x) < 3 or np.ptp(y) == 0:
+            raise NativeFitError("Too few distinct data points.")
+        try:
+            with np.errstate(all="ignore"):
+                result = func(x, y)
+        except np.linalg.LinAlgError as error:
+            raise NativeFitError(str(error)) from error
+        if not all(np.all(np.isfinite(r)) for r in result):
+            raise NativeFitError("Fit resulted in non-finite values.")
+        return result
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+@check
+def sslogis(x: np.ndarray, y: np.ndarray) -> FitResult:
+    """Self-starting logistic model. Coefficients: Asym, xmid, scal."""
+    xmid, scal = logit_start(x, y)
+    (xmid, scal), (asym,) = plinear(
+        lambda x, xmid, scal: (1 / (1 + np.exp((xmid - x) / scal)),),
+        x,
+        y,
+        (xmid, scal),
+    )
+    return fit(logis, x, y, (asym, xmid, scal), asym=0)
+
+
+@check
+def ssdoubles(x: np.ndarray, y: np.ndarray) -> FitResult:
+    """Two-steps-sigmoidal model. Coefficients: e, f, k, b, Z, c.
+
+    Initial guess of `k` is decreased until a fit succeeds (see `ssdoubles.R`).
+    """
+    e, z = y.min(), y.max()
+    f = y.max() / 2
+    b = x[np.argmin(y)]
+    c = x.max() * 0.5
+    k = 10.0
+    for _ in range(101):
+        k = k / 10
+        try:
+            return fit(doubles, x, y, (e, f, k, b, z, c), asym=4)
+        except NativeFitError:
+            continue
+    raise NativeFitError("Singular gradient.")
+
+
+@check
+def ssfpl(x: np.ndarray, y: np.ndarray) -> FitResult:
+    """Self-starting four-parameter logistic model. Coefficients: A, B, xmid, scal."""
+    xmid, scal = logit_start(x, y)
+    (xmid, lscal), (a, b_a) = plinear(
+        lambda x, xmid, lscal: (
+            np.ones_like(x),
+            1 / (1 + np.exp((xmid - x) / np.exp(lscal))),
+        ),
+        x,
+        y,
+        (xmid, np.log(np.abs(scal))),
+    )
+    return fit(fpl, x, y, (a, a + b_a, xmid, np.exp(lscal)), asym=1)
+
+
+@check
+def ssasymp(x: np.ndarray, y: np.ndarray) -> FitResult:
+    """Self-starting asymptotic regression model. Coefficients: Asym, R0, lrc."""
+    # Rough estimate of the asymptote outside the range of y (`NLSstRtAsymptote`)
+    rng = np.array([y.min(), y.max()])
+    if np.argmin(np.abs(rng - y[-1])) == 1:
+        asym = rng[1] + np.ptp(y) / 8
+    else:
+        asym = rng[0] - np.ptp(y) / 8
+    _, slope = lm(x, np.log(np.abs(y - asym)))
+    if slope >= 0:
+        raise NativeFitError("Invalid initial estimate of the rate constant.")
+    (lrc,), (asym, r0) = plinear(
+        lambda x, lrc: (1 - np.exp(-np.exp(lrc) * x), np.exp(-np.exp(lrc) * x)),
+        x,
+        y,
+        (np.log(-slope),),
+    )
+    return fit(asymp, x, y, (asym, r0, lrc), asym=0)
+
+
+@check
+def ssmicmen(x: np.ndarray, y: np.ndarray) -> FitResult:
+    """Self-starting Michaelis-Menten model. Coefficients: Vm, K."""
+    # Lineweaver-Burk
+    intercept, slope = lm(1 / x, 1 / y)
+    (k,), (vm,) = plinear(
+        lambda x, k: (x / (k + x),),
+        x,
+        y,
+        (np.abs(slope / intercept),),
+    )
+    return fit(micmen, x, y, (vm, k), asym=0)
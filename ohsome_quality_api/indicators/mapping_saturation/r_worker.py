@@ -0,0 +1,223 @@
+"""Pool of long-lived R worker processes to fit the nonlinear models.
+
+The R interpreter embedded by `rpy2` is single-threaded and can not be called
+concurrently. Fits are therefore dispatched to worker processes, each running its own
+R with the `stats` package and `ssdoubles.R` loaded once on start.
+
+Data is sent as raw bytes of `float64` arrays over a pipe. A fit exceeding the
+timeout kills the worker. Workers are recycled after a number of fits.
+
+Configuration: `r_workers` (number of workers, `0` to use the embedded R),
+`r_fit_timeout` (seconds) and `r_worker_max_fits`.
+"""
+
+import atexit
+import contextlib
+import logging
+import multiprocessing
+import queue
+import threading
+from multiprocessing.connection import Connection
+from typing import Callable
+
+import numpy as np
+from numpy.typing import ArrayLike
+from rpy2.rinterface_lib.embedded import RRuntimeError
+
+# Import module instead of function to avoid circular import (config -> utils.helper)
+from ohsome_quality_api import config
+
+logger = logging.getLogger(__name__)
+
+POOL: "RWorkerPool | None" = None
+POOL_LOCK = threading.Lock()
+
+
+class RWorkerError(RuntimeError):
+    """R worker process failed."""
+
+
+class RWorkerTimeoutError(RWorkerError):
+    """Fit exceeded the timeout."""
+
+
+def encode(array: ArrayLike) -> bytes:
+    return np.asarray(array, dtype=np.float64).tobytes()
+
+
+def decode(raw: bytes) -> np.ndarray:
+    return np.frombuffer(raw, dtype=np.float64).copy()
+
+
+def work(
+    conn: Connection,
+    fit: Callable,
+    initializer: Callable | None = None,
+) -> None:
+    """Main loop of a worker process."""
+    init_error = None
+    try:
+        if initializer is not None:
+            initializer()
+    except Exception as error:
+        # Keep worker alive to report error instead of being restarted on every fit
+        init_error = error
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        if init_error is not None:
+            conn.send(("error", type(init_error).__name__, str(init_error)))
+            continue
+        formula, asym, xdata, ydata = message
+        try:
+            result = fit(formula, asym, decode(xdata), decode(ydata))
+        except Exception as error:
+            conn.send(("error", type(error).__name__, str(error)))
+        else:
+            conn.send(("ok", *(encode(r) for r in result)))
+    conn.close()
+
+
+class RWorker:
+    def __init__(
+        self,
+        context: multiprocessing.context.BaseContext,
+        fit: Callable,
+        initializer: Callable | None = None,
+    ):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=work,
+            args=(child_conn, fit, initializer),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.fits = 0
+
+    def fit(self, message: tuple, timeout: float) -> tuple:
+        self.fits += 1
+        self.conn.send(message)
+        if not self.conn.poll(timeout):
+            raise RWorkerTimeoutError(
+                "Fit exceeded timeout of {} seconds.".format(timeout)
+            )
+        return self.conn.recv()
+
+    def stop(self) -> None:
+        with contextlib.suppress(OSError):
+            self.conn.send(None)
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class RWorkerPool:
+    def __init__(
+        self,
+        size: int,
+        timeout: float,
+        max_fits: int,
+        fit: Callable,
+        initializer: Callable | None = None,
+    ):
+        self.timeout = timeout
+        self.max_fits = max_fits
+        self.fit_func = fit
+        self.initializer = initializer
+        # Fork is not safe with threads and an embedded R interpreter
+        self.context = multiprocessing.get_context("spawn")
+        self.idle: queue.Queue[RWorker] = queue.Queue()
+        for _ in range(size):
+            self.idle.put(self.spawn())
+
+    def spawn(self) -> RWorker:
+        return RWorker(self.context, self.fit_func, self.initializer)
+
+    def fit(
+        self,
+        formula: str,
+        asym: str,
+        xdata: ArrayLike,
+        ydata: ArrayLike,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fit model in an idle worker. Block until a worker is available.
+
+        Returns:
+            Coefficients, confidence interval of the asymptote and fitted values.
+        """
+        worker = self.idle.get()
+        try:
+            response = worker.fit(
+                (formula, asym, encode(xdata), encode(ydata)),
+                self.timeout,
+            )
+        except RWorkerTimeoutError:
+            logger.warning("Kill R worker: " + formula)
+            worker.kill()
+            worker = self.spawn()
+            raise
+        except (EOFError, OSError) as error:
+            worker.kill()
+            worker = self.spawn()
+            raise RWorkerError("R worker died unexpectedly.") from error
+        finally:
+            if worker.fits >= self.max_fits:
+                worker.stop()
+                worker = self.spawn()
+            self.idle.put(worker)
+        match response:
+            case ("ok", coef, asym_conf_int, fitted_values):
+                return decode(coef), decode(asym_conf_int), decode(fitted_values)
+            case ("error", "RRuntimeError", message):
+                raise RRuntimeError(message)
+            case ("error", name, message):
+                raise RWorkerError("{}: {}".format(name, message))
+
+    def shutdown(self) -> None:
+        while True:
+            try:
+                self.idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+def get_pool() -> RWorkerPool:
+    """Get pool of R workers. Start workers on first call."""
+    global POOL
+    with POOL_LOCK:
+        if POOL is None:
+            # Import here to avoid circular import (models -> r_worker)
+            from ohsome_quality_api.indicators.mapping_saturation.models import (
+                fit_nls,
+                load_rstats,
+            )
+
+            POOL = RWorkerPool(
+                size=config.get_config_value("r_workers"),
+                timeout=config.get_config_value("r_fit_timeout"),
+                max_fits=config.get_config_value("r_worker_max_fits"),
+                fit=fit_nls,
+                initializer=load_rstats,
+            )
+        return POOL
+
+
+def shutdown_pool() -> None:
+    global POOL
+    with POOL_LOCK:
+        if POOL is not None:
+            POOL.shutdown()
+            POOL = None
+
+
+atexit.register(shutdown_pool)
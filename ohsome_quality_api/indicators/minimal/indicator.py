@@ -17,6 +17,18 @@ class Minimal(BaseIndicator):
 
     async def preprocess(self) -> None:
         query_results = await ohsome_client.query(self.topic, self.feature)
+        self.set_count(query_results)
+
+    @classmethod
+    async def preprocess_batch(cls, indicators: list["Minimal"]) -> None:
+        query_results = await ohsome_client.query_group_by_boundary(
+            indicators[0].topic,
+            [indicator.feature for indicator in indicators],
+        )
+        for indicator, query_results_ in zip(indicators, query_results, strict=True):
+            indicator.set_count(query_results_)
+
+    def set_count(self, query_results: dict) -> None:
         self.count = query_results["result"][0]["value"]
         self.result.timestamp_osm = dateutil.parser.isoparse(
             query_results["result"][0]["timestamp"]
@@ -1,11 +1,10 @@
+import asyncio
 import logging
-import os
-from pathlib import Path
 from string import Template
+from types import MappingProxyType
 
 import geojson
 import plotly.graph_objects as pgo
-import yaml
 from async_lru import alru_cache
 from babel.dates import format_date
 from babel.numbers import format_decimal, format_percent
@@ -18,6 +17,7 @@ from ohsome_quality_api.definitions import Color, get_attribution
 from ohsome_quality_api.geodatabase import client as db_client
 from ohsome_quality_api.indicators.base import BaseIndicator
 from ohsome_quality_api.topics.models import Topic
+from ohsome_quality_api.utils.registry import load_sql, load_yaml, registry
 
 logger = logging.getLogger(__name__)
 
@@ -80,35 +80,31 @@ class RoadComparison(BaseIndicator):
         return get_attribution(["OSM"])
 
     async def preprocess(self) -> None:
-        for key, val in self.data_ref.items():
-            # get area covered by reference dataset [%]
-            self.area_cov[key] = await db_client.get_intersection_area(
-                self.feature,
-                val["coverage"]["simple"],
-            )
-            self.warnings[key] = self.check_major_edge_cases(key)
-            if self.warnings[key] != "":
-                continue
-
-            # clip input geom with coverage of reference dataset
-            feature = await db_client.get_intersection_geom(
-                self.feature,
-                val["coverage"]["simple"],
-            )
+        # Reference datasets are independent of each other
+        await asyncio.gather(*(self.preprocess_dataset(key) for key in self.data_ref))
+
+    async def preprocess_dataset(self, key: str) -> None:
+        val = self.data_ref[key]
+        # get area covered by reference dataset [%] and covered road length
+        (
+            self.area_cov[key],
+            length_matched,
+            length_total,
+        ) = await get_matched_roadlengths(
+            geojson.dumps(self.feature),
+            val["coverage"]["simple"],
+            val["table_name"],
+        )
+        self.warnings[key] = self.check_major_edge_cases(key)
+        if self.warnings[key] != "":
+            return
 
-            # get covered road length
-            (
-                self.length_matched[key],
-                self.length_total[key],
-            ) = await get_matched_roadlengths(
-                geojson.dumps(feature),
-                val["table_name"],
-            )
-            if self.length_total[key] is None:
-                self.length_total[key] = 0
-                self.length_matched[key] = 0
-            elif self.length_matched[key] is None:
-                self.length_matched[key] = 0
+        if length_total is None:
+            self.length_total[key] = 0
+            self.length_matched[key] = 0
+        else:
+            self.length_total[key] = length_total
+            self.length_matched[key] = length_matched or 0
 
     def calculate(self) -> None:
         self.result.description = ""
@@ -337,22 +333,28 @@ class RoadComparison(BaseIndicator):
 @alru_cache
 async def get_matched_roadlengths(
     feature_str: str,
+    coverage_table: str,
     table_name: str,
-) -> tuple[float, float]:
-    file_path = Path(__file__).parent / "query.sql"
-    with open(file_path, "r") as file:
-        query = file.read()
+) -> tuple[float, float | None, float | None]:
+    """Get coverage of the reference dataset and matched and total road length.
+
+    The AoI is clipped with the coverage and road lengths are aggregated within the
+    clipped AoI in a single query. The query is skipped if the AoI lies outside of the
+    coverage.
+    """
     feature = geojson.loads(feature_str)
-    table_name = table_name.replace(" ", "_")
-    geom = geojson.dumps(feature.geometry)
-    results = await db_client.fetch(
-        query.format(table_name=table_name),
-        geom,
+    if await db_client.relate_to_coverage(feature, coverage_table) == "disjoint":
+        return 0.0, None, None
+    query = load_sql(
+        __package__,
+        "query.sql",
+        coverage_table=coverage_table,
+        table_name=table_name.replace(" ", "_"),
     )
-    return results[0][0], results[0][1]
+    results = await db_client.fetch(query, feature.geometry)
+    return results[0][0] or 0.0, results[0][1], results[0][2]
 
 
-def load_datasets_metadata() -> dict:
-    file_path = os.path.join(os.path.dirname(__file__), "datasets.yaml")
-    with open(file_path, "r") as f:
-        return yaml.safe_load(f)
+@registry
+def load_datasets_metadata() -> MappingProxyType[str, dict]:
+    return load_yaml("ohsome_quality_api.indicators.road_comparison", "datasets.yaml")
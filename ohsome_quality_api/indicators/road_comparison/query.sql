@@ -1,11 +1,34 @@
 WITH bpoly AS (
     SELECT
-        -- split mutlipolygon into list of polygons for more efficient processing
-        (ST_DUMP (ST_Setsrid (ST_GeomFromGeoJSON ($1), 4326))).geom AS geom
+        $1::geometry AS geom
+),
+intersection AS (
+    -- clip input geom with coverage of reference dataset
+    SELECT
+        ST_Intersection (bpoly.geom, coverage.geom) AS geom,
+        ST_Area (bpoly.geom) AS area
+    FROM
+        bpoly,
+        {coverage_table} coverage
+    WHERE
+        ST_Intersects (bpoly.geom, coverage.geom)
+),
+parts AS (
+    -- split mutlipolygon into list of polygons for more efficient processing
+    SELECT
+        (ST_DUMP (intersection.geom)).geom AS geom
+    FROM
+        intersection
 )
 SELECT
+    -- ratio of area within coverage (empty if outside, between 0-1 if intersection)
+    (
+        SELECT
+            SUM(ST_Area (intersection.geom) / intersection.area)
+        FROM
+            intersection) AS area_ratio,
     SUM(cr.covered),
     SUM(cr.length)
 FROM
-    bpoly
-    LEFT JOIN {table_name} cr ON ST_Intersects (cr.midpoint, bpoly.geom);
+    parts
+    LEFT JOIN {table_name} cr ON ST_Intersects (cr.midpoint, parts.geom);
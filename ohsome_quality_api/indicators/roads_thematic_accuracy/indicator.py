@@ -1,11 +1,9 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from pathlib import Path
 from string import Template
 from typing import Literal
 
-import geojson
 import plotly.graph_objects as pgo
 from babel.numbers import format_percent
 from fastapi_i18n import _, get_locale
@@ -16,11 +14,10 @@ from ohsome_quality_api.definitions import Color
 from ohsome_quality_api.geodatabase import client
 from ohsome_quality_api.indicators.base import BaseIndicator
 from ohsome_quality_api.topics.models import Topic
+from ohsome_quality_api.utils.registry import load_sql
 
 logger = logging.getLogger(__name__)
 
-QUERIES_DIR = Path(__file__).parent / "queries"
-
 # Mark attributes for gettext extractor (to be translated)
 [_(attribute) for attribute in ["surface", "oneway", "lanes", "name", "width"]]
 
@@ -52,20 +49,25 @@ class RoadsThematicAccuracy(BaseIndicator):
     async def coverage(cls, inverse=False) -> list[Feature]:
         # TODO: do we want two separate coverages for Germany?
         if inverse:
-            query = (
-                "SELECT ST_AsGeoJSON(inversed) FROM osm_corine_intersection_coverage"
-            )
+            query = "SELECT inversed FROM osm_corine_intersection_coverage"
         else:
-            query = "SELECT ST_AsGeoJSON(simple) FROM osm_corine_intersection_coverage"
+            query = "SELECT simple FROM osm_corine_intersection_coverage"
         result = await client.fetch(query)
-        return [Feature(geometry=geojson.loads(result[0][0]))]
+        return [Feature(geometry=result[0][0])]
 
     async def preprocess(self) -> None:
         if self.attribute is not None:
-            query = Path(QUERIES_DIR / f"{self.attribute}.sql").read_text()
+            query = load_sql(__package__, f"queries/{self.attribute}.sql")
+        else:
+            query = load_sql(__package__, "queries/all_attributes.sql")
+        relation = await client.relate_to_coverage(
+            self.feature, "osm_corine_intersection_coverage", "simple"
+        )
+        if relation == "disjoint":
+            # No road within coverage (see `coverage`)
+            response = [{}]
         else:
-            query = Path(QUERIES_DIR / "all_attributes.sql").read_text()
-        response = await client.fetch(query, str(self.feature["geometry"]))
+            response = await client.fetch(query, self.feature["geometry"])
         self.matched_data = MatchedData(
             total_dlm=(response[0].get("total_dlm") or 0) / 1000,
             present_in_both=(response[0].get("present_in_both") or 0) / 1000,
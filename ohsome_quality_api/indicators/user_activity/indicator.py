@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from statistics import median
 from string import Template
 
@@ -10,6 +10,7 @@ from babel.dates import format_date
 from fastapi_i18n import _, get_locale
 from geojson import Feature
 
+from ohsome_quality_api import ohsomedb
 from ohsome_quality_api.indicators.base import BaseIndicator
 from ohsome_quality_api.ohsome_api import client as ohsome_client
 from ohsome_quality_api.topics.models import Topic
@@ -38,6 +39,22 @@ class UserActivity(BaseIndicator):
         self.bin_total = None
 
     async def preprocess(self) -> None:
+        if ohsomedb.is_enabled("user-activity"):
+            ends, values = await self.preprocess_ohsomedb()
+        else:
+            ends, values = await self.preprocess_ohsome_api()
+        # TODO: What does it mean? Do we need this check?
+        if len(values) == 0:
+            return
+        timestamps = list(reversed(ends))
+        users_abs = list(reversed(values))
+        self.bin_total = Bin(
+            users_abs,
+            timestamps,
+        )
+        self.result.timestamp_osm = timestamps[0]
+
+    async def preprocess_ohsome_api(self) -> tuple[list[datetime], list[int]]:
         raw = await ohsome_client.metadata()
         latest_timestamp = datetime.fromisoformat(
             raw["temporalExtent"]["latestTimestamp"]
@@ -53,16 +70,20 @@ class UserActivity(BaseIndicator):
                 "binSize": "P1M",
             },
         )
-        # TODO: What does it mean? Do we need this check?
-        if len(result["value"]) == 0:
-            return
-        timestamps = [datetime.fromisoformat(end) for end in reversed(result["end"])]
-        users_abs = list(reversed(result["value"]))
-        self.bin_total = Bin(
-            users_abs,
-            timestamps,
+        return [datetime.fromisoformat(end) for end in result["end"]], result["value"]
+
+    async def preprocess_ohsomedb(self) -> tuple[list[datetime], list[int]]:
+        # The ohsomeDB is queried for its current snapshot
+        latest_timestamp = datetime.now(timezone.utc)
+        end = latest_timestamp.strftime("%Y-%m-01")
+        start = "2008-" + latest_timestamp.strftime("%m-%d")
+        result = await ohsomedb.users_per_month(
+            bpolys=self.feature["geometry"],
+            filter_=self.topic.filter,
+            start=start,
+            end=end,
         )
-        self.result.timestamp_osm = timestamps[0]
+        return [r["end"] for r in result], [r["value"] for r in result]
 
     def calculate(self):
         edge_cases = check_major_edge_cases(sum(self.bin_total.users_abs))
@@ -1,32 +1,55 @@
 """Controller for computing Indicators."""
 
+import asyncio
 import logging
-from typing import Coroutine
+from typing import AsyncIterator, Callable, Coroutine
 
 from geojson import Feature, FeatureCollection
 
+from ohsome_quality_api.config import get_config_value
 from ohsome_quality_api.indicators.base import BaseIndicator as Indicator
 from ohsome_quality_api.topics.models import Topic, TopicData
 from ohsome_quality_api.utils.helper import get_class_from_key
-from ohsome_quality_api.utils.helper_asyncio import gather_with_semaphore
+from ohsome_quality_api.utils.helper_asyncio import CPU_BUDGET, gather_with_semaphore
+from ohsome_quality_api.utils.helper_executor import run_cpu_bound
+from ohsome_quality_api.utils.result_cache import (
+    build_key,
+    get_data_version,
+    get_result_cache,
+)
 from ohsome_quality_api.utils.validators import validate_area
 
 logger = logging.getLogger(__name__)
 
+# Callback receiving indicators as soon as they have been computed
+Progress = Callable[[list[Indicator]], None]
+
+# Indicators computed from reference datasets only. Their results do not depend on the
+# version of the OSM data and are not cached.
+UNCACHED_INDICATORS = (
+    "land-cover-thematic-accuracy",
+    "road-comparison",
+    "roads-thematic-accuracy",
+)
+
 
 async def create_indicator(
     key: str,
     bpolys: FeatureCollection,
     topic: TopicData | Topic,
     include_figure: bool = True,
+    progress: Progress | None = None,
     **kwargs,
 ) -> list[Indicator]:
     """Create indicator(s) for features of a GeoJSON FeatureCollection.
 
     Indicators are computed asynchronously utilizing semaphores.
     Properties of the input GeoJSON are preserved.
+
+    Results are cached if the cache is enabled (see `utils/result_cache.py`).
+
+    If given, `progress` is called with indicators as soon as they are computed.
     """
-    tasks: list[Coroutine] = []
     for i, feature in enumerate(bpolys.features):
         if "id" not in feature:
             feature["id"] = i
@@ -44,23 +67,168 @@ async def create_indicator(
             "roads-thematic-accuracy",
         ]:
             validate_area(feature)
-        tasks.append(
-            _create_indicator(
+    if (
+        isinstance(topic, Topic)
+        and key not in UNCACHED_INDICATORS
+        and get_result_cache() is not None
+    ):
+        return await _create_indicators_cached(
+            key,
+            bpolys.features,
+            topic,
+            include_figure,
+            progress,
+            **kwargs,
+        )
+    return await _create_indicators(
+        key,
+        bpolys.features,
+        topic,
+        include_figure,
+        progress,
+        **kwargs,
+    )
+
+
+async def create_indicator_stream(
+    key: str,
+    bpolys: FeatureCollection,
+    topic: TopicData | Topic,
+    include_figure: bool = True,
+    **kwargs,
+) -> AsyncIterator[Indicator]:
+    """Create indicator(s) and yield them in order of completion.
+
+    See `create_indicator`. Errors of the computation are raised by the iterator.
+    """
+    queue: asyncio.Queue[list[Indicator] | Exception | None] = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            await create_indicator(
                 key,
-                feature,
+                bpolys,
                 topic,
                 include_figure,
+                progress=queue.put_nowait,
                 **kwargs,
             )
+        except Exception as error:
+            queue.put_nowait(error)
+        else:
+            queue.put_nowait(None)
+
+    task = asyncio.create_task(produce())
+    try:
+        while (item := await queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            for indicator in item:
+                yield indicator
+    finally:
+        task.cancel()
+
+
+async def _create_indicators(
+    key: str,
+    features: list[Feature],
+    topic: TopicData | Topic,
+    include_figure: bool = True,
+    progress: Progress | None = None,
+    **kwargs,
+) -> list[Indicator]:
+    indicator_class = get_class_from_key(class_type="indicator", key=key)
+    if len(features) > 1 and (
+        indicator_class.has_preprocess_batch() or _is_calculated_in_batch(key)
+    ):
+        return await _create_indicators_batch(
+            key,
+            features,
+            topic,
+            include_figure,
+            progress,
+            **kwargs,
+        )
+    # Each feature is computed on its own. Fast features are not held back by slow
+    # ones.
+    tasks: list[Coroutine] = [
+        _create_indicator(
+            key,
+            feature,
+            topic,
+            include_figure,
+            progress,
+            **kwargs,
         )
+        for feature in features
+    ]
     return await gather_with_semaphore(tasks)
 
 
+def _is_calculated_in_batch(key: str) -> bool:
+    return (
+        key == "mapping-saturation"
+        and get_config_value("mapping_saturation_backend") == "numpy"
+    )
+
+
+async def _create_indicators_cached(
+    key: str,
+    features: list[Feature],
+    topic: Topic,
+    include_figure: bool = True,
+    progress: Progress | None = None,
+    **kwargs,
+) -> list[Indicator]:
+    """Create indicators from cached results. Compute only missing results.
+
+    Cached results are only valid for the current version of the OSM data.
+    """
+    cache = get_result_cache()
+    version = await get_data_version()
+    cache_keys = [
+        build_key(key, topic, feature, include_figure, **kwargs) for feature in features
+    ]
+    indicator_class = get_class_from_key(class_type="indicator", key=key)
+    indicators: list[Indicator | None] = []
+    missing: list[int] = []
+    for i, (feature, cache_key) in enumerate(zip(features, cache_keys, strict=True)):
+        result = await cache.get(cache_key, version)
+        if result is None:
+            indicators.append(None)
+            missing.append(i)
+        else:
+            indicator = indicator_class(topic, feature, **kwargs)
+            indicator.result = result
+            indicators.append(indicator)
+    logger.info(
+        "Results in cache: {0} of {1}".format(
+            len(features) - len(missing), len(features)
+        )
+    )
+    if progress is not None and len(features) > len(missing):
+        progress([indicator for indicator in indicators if indicator is not None])
+    if missing:
+        computed = await _create_indicators(
+            key,
+            [features[i] for i in missing],
+            topic,
+            include_figure,
+            progress,
+            **kwargs,
+        )
+        for i, indicator in zip(missing, computed, strict=True):
+            await cache.set(cache_keys[i], version, indicator.result)
+            indicators[i] = indicator
+    return indicators
+
+
 async def _create_indicator(
     key: str,
     feature: Feature,
     topic: Topic,
     include_figure: bool = True,
+    progress: Progress | None = None,
     **kwargs,
 ) -> Indicator:
     """Create an indicator from scratch."""
@@ -79,13 +247,87 @@ async def _create_indicator(
     logger.info("Run preprocessing")
     await indicator.preprocess()
 
+    return await _compute_with_budget(indicator, include_figure, progress)
+
+
+async def _create_indicators_batch(
+    key: str,
+    features: list[Feature],
+    topic: Topic,
+    include_figure: bool = True,
+    progress: Progress | None = None,
+    **kwargs,
+) -> list[Indicator]:
+    """Create indicators for multiple features.
+
+    Data of all features is fetched at once if supported by the indicator (see
+    `preprocess_batch`). Mapping Saturation indicators are calculated at once if the
+    `numpy` backend is configured. In both cases calculation starts only after data of
+    all features has been fetched.
+    """
+    logger.info("Indicator key:  {0:4}".format(key))
+    logger.info("Topic key:     {0:4}".format(topic.key))
+    logger.info("Features:       {0:4}".format(len(features)))
+
+    indicator_class = get_class_from_key(class_type="indicator", key=key)
+    indicators = [indicator_class(topic, feature, **kwargs) for feature in features]
+
+    logger.info("Run preprocessing")
+    await indicator_class.preprocess_batch(indicators)
+
+    if _is_calculated_in_batch(key):
+        async with CPU_BUDGET.acquire():
+            indicators = await run_cpu_bound(_compute_batch, indicators, include_figure)
+        if progress is not None:
+            progress(indicators)
+        return indicators
+    return await asyncio.gather(
+        *(
+            _compute_with_budget(indicator, include_figure, progress)
+            for indicator in indicators
+        )
+    )
+
+
+async def _compute_with_budget(
+    indicator: Indicator,
+    include_figure: bool = True,
+    progress: Progress | None = None,
+) -> Indicator:
+    async with CPU_BUDGET.acquire():
+        indicator = await run_cpu_bound(_compute, indicator, include_figure)
+    if progress is not None:
+        progress([indicator])
+    return indicator
+
+
+def _compute(indicator: Indicator, include_figure: bool = True) -> Indicator:
+    """Run CPU-bound stages of the indicator computation.
+
+    Executed in a thread or process pool. In case of a process pool the indicator is
+    pickled and a copy is returned.
+    """
     logger.info("Run calculation")
     indicator.calculate()
+    _create_figure(indicator, include_figure)
+    return indicator
+
 
+def _compute_batch(
+    indicators: list[Indicator],
+    include_figure: bool = True,
+) -> list[Indicator]:
+    """Run CPU-bound stages of the computation of multiple indicators at once."""
+    logger.info("Run calculation in batch")
+    type(indicators[0]).calculate_batch(indicators)
+    for indicator in indicators:
+        _create_figure(indicator, include_figure)
+    return indicators
+
+
+def _create_figure(indicator: Indicator, include_figure: bool = True) -> None:
     if include_figure:
         logger.info("Run figure creation")
         indicator.create_figure()
     else:
         indicator.result.figure = None
-
-    return indicator
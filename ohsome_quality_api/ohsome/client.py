@@ -12,6 +12,8 @@ from schema import Or, Schema, SchemaError, Use
 from ohsome_quality_api.config import get_config_value
 from ohsome_quality_api.topics.models import Topic, TopicData
 from ohsome_quality_api.utils.exceptions import OhsomeApiError, TopicDataSchemaError
+from ohsome_quality_api.utils.helper_asyncio import OHSOME_API_SINGLE_FLIGHT
+from ohsome_quality_api.utils.helper_http import get_client
 
 
 @singledispatch
@@ -90,6 +92,27 @@ async def _(
         ) from error
 
 
+async def query_group_by_boundary(
+    topic: Topic,
+    features: list[Feature],
+    **kwargs,
+) -> list[dict]:
+    """Query ohsome API for multiple features in one "group by boundary" request.
+
+    Returns:
+        Query results of each feature in the same order and format as if each feature
+        has been queried on its own.
+    """
+    bpolys = FeatureCollection(
+        [Feature(id=str(i), geometry=f["geometry"]) for i, f in enumerate(features)]
+    )
+    response = await query(topic, bpolys, group_by_boundary=True, **kwargs)
+    results: list[dict] = [{} for _ in features]
+    for group in response["groupByResult"]:
+        results[int(group["groupByObject"])] = {"result": group["result"]}
+    return results
+
+
 async def query_ohsome_api(url: str, data: dict) -> dict:
     """Query the ohsome API.
 
@@ -100,9 +123,14 @@ async def query_ohsome_api(url: str, data: dict) -> dict:
         OhsomeApiError: In case of any response except 2xx status codes or invalid
             response due to timeout during streaming.
     """
+    # Identical concurrent queries share one request
+    key = (url, json.dumps(data, sort_keys=True))
+    return await OHSOME_API_SINGLE_FLIGHT.do(key, _query_ohsome_api, url, data)
+
+
+async def _query_ohsome_api(url: str, data: dict) -> dict:
     headers = {"user-agent": get_config_value("user_agent")}
-    # 660s timeout for reading, and a 300s timeout elsewhere.
-    async with httpx.AsyncClient(timeout=httpx.Timeout(300, read=660)) as client:
+    async with get_client() as client:
         resp = await client.post(url, data=data, headers=headers)
     try:
         resp.raise_for_status()
@@ -127,8 +155,7 @@ async def get_latest_ohsome_timestamp() -> datetime.datetime:
     """Get latest unix timestamp from the ohsome API."""
     url = get_config_value("ohsome_api").rstrip("/") + "/metadata"
     headers = {"user-agent": get_config_value("user_agent")}
-    # 660s timeout for reading, and a 300s timeout elsewhere.
-    async with httpx.AsyncClient(timeout=httpx.Timeout(300, read=660)) as client:
+    async with get_client() as client:
         resp = await client.get(url=url, headers=headers)
     strtime = resp.json()["extractRegion"]["temporalExtent"]["toTimestamp"]
     return datetime.datetime.strptime(strtime, "%Y-%m-%dT%H:%MZ")
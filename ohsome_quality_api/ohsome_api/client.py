@@ -1,9 +1,18 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from json import dumps
 from typing import Literal
 
 import httpx
 
 from ohsome_quality_api.config import get_config_value
 from ohsome_quality_api.utils.exceptions import OhsomeApiError
+from ohsome_quality_api.utils.helper_asyncio import OHSOME_API_SINGLE_FLIGHT
+from ohsome_quality_api.utils.helper_http import get_client
+
+logger = logging.getLogger(__name__)
 
 # TODO: extract to config
 BASE_URL = "https://staging-ohsome-api.heigitk8s.de"
@@ -16,17 +25,26 @@ async def request(
 ) -> dict:
     """Query the ohsome API.
 
+    Identical concurrent queries share one request (see `SingleFlight`).
+
     Raises:
         OhsomeApiError: In case of any response except 2xx status codes.
     """
+    key = (method, url, dumps(json, sort_keys=True))
+    return await OHSOME_API_SINGLE_FLIGHT.do(key, _request, url, method, json)
+
+
+async def _request(
+    url: str,
+    method: Literal["get", "post"],
+    json: dict | None = None,
+) -> dict:
     headers = {
         "user-agent": get_config_value("user_agent"),
         "authorization": get_config_value("heigit_api_key"),
     }
-    async with httpx.AsyncClient(
-        timeout=httpx.Timeout(300, read=660),
-        verify=False,  # TODO: remove to veriyf SSL certificate  # noqa: S501
-    ) as client:
+    # TODO: remove `unverified` to verify SSL certificate
+    async with get_client(unverified=(BASE_URL,)) as client:
         match method:
             case "get":
                 resp = await client.get(url, headers=headers)
@@ -40,9 +58,78 @@ async def request(
     return resp.json()
 
 
+class MetadataCache:
+    """Process-wide cache of the ohsome API metadata.
+
+    Concurrent callers await one in-flight request (single-flight). After the TTL has
+    expired the cached metadata is still returned while one refresh runs in the
+    background.
+    """
+
+    def __init__(self) -> None:
+        self.value: dict | None = None
+        self.fetched_at: float = 0.0
+        self.task: asyncio.Task | None = None
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+
+    async def get(self, ttl: float) -> dict:
+        if self.value is None:
+            self.misses += 1
+            # Shield shared request from cancellation of a single caller
+            return await asyncio.shield(self.refresh())
+        if time.monotonic() - self.fetched_at < ttl:
+            self.hits += 1
+        else:
+            self.stale += 1
+            self.refresh()
+        return self.value
+
+    def refresh(self) -> asyncio.Task:
+        """Start request of the metadata unless one is already in-flight."""
+        loop = asyncio.get_running_loop()
+        if self.task is None or self.task.done() or self.task.get_loop() is not loop:
+            self.task = loop.create_task(self._fetch())
+            self.task.add_done_callback(self._done)
+        return self.task
+
+    async def _fetch(self) -> dict:
+        self.value = await request(BASE_URL + "/metadata", method="get")
+        self.fetched_at = time.monotonic()
+        return self.value
+
+    def _done(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        if task.exception() is not None and self.value is not None:
+            logger.warning(
+                "Refreshing ohsome API metadata failed. Keep serving stale metadata."
+            )
+        total = self.hits + self.stale + self.misses
+        logger.info(
+            "ohsome API metadata cache hit rate: {0:.1%} "
+            "({1} hits, {2} stale hits, {3} misses)".format(
+                (self.hits + self.stale) / total if total else 0.0,
+                self.hits,
+                self.stale,
+                self.misses,
+            )
+        )
+
+
+METADATA_CACHE = MetadataCache()
+
+
 async def metadata() -> dict:
-    url = BASE_URL + "/metadata"
-    return await request(url, method="get")
+    """Get metadata of the ohsome API.
+
+    Metadata is cached for `ohsome_api_metadata_ttl` seconds (see `MetadataCache`).
+    """
+    ttl = get_config_value("ohsome_api_metadata_ttl")
+    if ttl <= 0:
+        return await request(BASE_URL + "/metadata", method="get")
+    return await METADATA_CACHE.get(ttl)
 
 
 async def features(
@@ -60,6 +147,30 @@ async def features(
     return response["result"]
 
 
+async def features_series_end(
+    aoi: dict,
+    measure: str,
+    ohsome_filter: str,
+) -> dict:
+    """Get aggregated value of features at the end of a time series.
+
+    This is not a snapshot query: requested is the time series from 2008 to the first
+    day of the month of the latest timestamp of the ohsome API. Only timestamp and
+    value of its end are returned.
+    """
+    raw = await metadata()
+    latest_timestamp = datetime.fromisoformat(raw["temporalExtent"]["latestTimestamp"])
+    end = latest_timestamp.strftime("%Y-%m-01")
+    start = "2008-" + latest_timestamp.strftime("%m-%d")
+    result = await features(
+        aoi=aoi,
+        measure=measure,
+        ohsome_filter=ohsome_filter,
+        time_series={"start": start, "end": end},
+    )
+    return {"timestamp": result["timestamp"][-1], "value": result["value"][-1]}
+
+
 async def currentness(
     aoi: dict,
     measure: str,
@@ -1,5 +1,17 @@
 from .requests import (
+    filter_ratio,
+    is_enabled,
+    latest_contribution_bins,
+    monthly_aggregation,
     single_snapshot_aggregation,
+    users_per_month,
 )
 
-__all__ = ("single_snapshot_aggregation",)
+__all__ = (
+    "filter_ratio",
+    "is_enabled",
+    "latest_contribution_bins",
+    "monthly_aggregation",
+    "single_snapshot_aggregation",
+    "users_per_month",
+)
@@ -1,3 +1,4 @@
+from datetime import date
 from pathlib import Path
 from typing import Literal
 
@@ -38,3 +39,153 @@ async def single_snapshot_aggregation(
         bpolys.model_dump_json(),
         database="ohsomedb",
     )
+
+
+@validate_call
+async def monthly_aggregation(
+    *,
+    aggregation: Literal["count", "length", "area"],
+    bpolys: Polygon | MultiPolygon,
+    filter_: OhsomeFilter,
+    start: date,
+    end: date,
+):
+    """Aggregate features valid at monthly timestamps from start to end.
+
+    Counterpart of the `/features` endpoint of the ohsome API with a time series.
+    """
+    sql_filter, sql_filter_args = ohsome_filter_to_sql(filter_)
+    template = ENV.get_template("monthly_aggregation.sql")
+    query = template.render(
+        **{
+            "aggregation": aggregation,
+            "contributions": get_config_value("ohsomedb_contributions_table"),
+            "geom": len(sql_filter_args) + 1,
+            "start": len(sql_filter_args) + 2,
+            "end": len(sql_filter_args) + 3,
+            "filter": sql_filter,
+        }
+    )
+    return await client.fetch(
+        query,
+        *sql_filter_args,
+        bpolys.model_dump_json(),
+        start,
+        end,
+        database="ohsomedb",
+    )
+
+
+@validate_call
+async def latest_contribution_bins(
+    *,
+    aggregation: Literal["count", "length", "area"],
+    bpolys: Polygon | MultiPolygon,
+    filter_: OhsomeFilter,
+    start: date,
+    end: date,
+):
+    """Aggregate current features in monthly bins of their latest contribution.
+
+    Counterpart of the `/currentness` endpoint of the ohsome API.
+    """
+    sql_filter, sql_filter_args = ohsome_filter_to_sql(filter_)
+    template = ENV.get_template("latest_contribution_bins.sql")
+    query = template.render(
+        **{
+            "aggregation": aggregation,
+            "contributions": get_config_value("ohsomedb_contributions_table"),
+            "geom": len(sql_filter_args) + 1,
+            "start": len(sql_filter_args) + 2,
+            "end": len(sql_filter_args) + 3,
+            "filter": sql_filter,
+        }
+    )
+    return await client.fetch(
+        query,
+        *sql_filter_args,
+        bpolys.model_dump_json(),
+        start,
+        end,
+        database="ohsomedb",
+    )
+
+
+@validate_call
+async def users_per_month(
+    *,
+    bpolys: Polygon | MultiPolygon,
+    filter_: OhsomeFilter,
+    start: date,
+    end: date,
+):
+    """Count distinct users contributing to features in monthly bins.
+
+    Counterpart of the `/activity/users` endpoint of the ohsome API.
+    """
+    sql_filter, sql_filter_args = ohsome_filter_to_sql(filter_)
+    template = ENV.get_template("users_per_month.sql")
+    query = template.render(
+        **{
+            "contributions": get_config_value("ohsomedb_contributions_table"),
+            "geom": len(sql_filter_args) + 1,
+            "start": len(sql_filter_args) + 2,
+            "end": len(sql_filter_args) + 3,
+            "filter": sql_filter,
+        }
+    )
+    return await client.fetch(
+        query,
+        *sql_filter_args,
+        bpolys.model_dump_json(),
+        start,
+        end,
+        database="ohsomedb",
+    )
+
+
+@validate_call
+async def filter_ratio(
+    *,
+    aggregation: Literal["count", "length", "area"],
+    bpolys: Polygon | MultiPolygon,
+    filter_: OhsomeFilter,
+    attribute_filter: OhsomeFilter,
+):
+    """Aggregate current features and the subset of them matching the attribute filter.
+
+    Both values are computed in a single scan of the features.
+    """
+    sql_filter, sql_filter_args = ohsome_filter_to_sql(filter_)
+    sql_attribute_filter, sql_attribute_filter_args = ohsome_filter_to_sql(
+        attribute_filter,
+        args_shift=len(sql_filter_args),
+    )
+    args = (*sql_filter_args, *sql_attribute_filter_args)
+    template = ENV.get_template("filter_ratio.sql")
+    query = template.render(
+        **{
+            "aggregation": aggregation,
+            "contributions": get_config_value("ohsomedb_contributions_table"),
+            "geom": len(args) + 1,
+            "filter": sql_filter,
+            "attribute_filter": sql_attribute_filter,
+        }
+    )
+    return await client.fetch(
+        query,
+        *args,
+        bpolys.model_dump_json(),
+        database="ohsomedb",
+    )
+
+
+def is_enabled(indicator: str) -> bool:
+    """Check if the indicator is computed with the ohsomeDB instead of the ohsome API.
+
+    Indicators are selected by their key in `ohsomedb_indicators`.
+    """
+    if not get_config_value("ohsomedb_enabled"):
+        return False
+    keys = get_config_value("ohsomedb_indicators").split(",")
+    return indicator in [key.strip() for key in keys]
@@ -0,0 +1,22 @@
+{% from 'macros.sql' import measure %}
+WITH poly AS (
+    SELECT ST_GeomFromGeoJSON(${{ geom }}) AS geom
+),
+features AS (
+    -- Measure of each feature is computed once for both aggregates
+    SELECT
+        {{ measure(aggregation) }} AS value,
+        ({{ attribute_filter }}) AS has_attribute
+    FROM {{ contributions }} c, poly AS p
+    WHERE 1=1
+        AND (status_geom_type).status IN ('latest')
+        AND valid_to >= NOW()::timestamp
+        AND valid_from < NOW()::timestamp  -- before last snapshot time
+        AND ({{ filter }})
+        AND ST_Intersects(c.geom, p.geom)
+)
+SELECT
+    NOW() AS snapshot_ts,
+    COALESCE(SUM(value), 0)::BIGINT AS value,
+    COALESCE(SUM(value) FILTER (WHERE has_attribute), 0)::BIGINT AS value_attribute
+FROM features;
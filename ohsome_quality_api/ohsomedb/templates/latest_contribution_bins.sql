@@ -0,0 +1,31 @@
+{% from 'macros.sql' import measure, monthly_bins %}
+WITH poly AS (
+    SELECT ST_GeomFromGeoJSON(${{ geom }}) AS geom
+),
+bins AS (
+    {{ monthly_bins(start, end) }}
+),
+features AS (
+    -- Latest versions of all current features. Their start of validity is the
+    -- timestamp of the latest contribution (creation, geometry or tag change).
+    SELECT
+        c.valid_from,
+        {{ measure(aggregation) }} AS value
+    FROM {{ contributions }} c, poly AS p
+    WHERE 1=1
+        AND (status_geom_type).status IN ('latest')
+        AND valid_to >= NOW()::timestamp
+        AND valid_from >= ${{ start }}::date::timestamp
+        AND valid_from < ${{ end }}::date::timestamp
+        AND ({{ filter }})
+        AND ST_Intersects(c.geom, p.geom)
+)
+SELECT
+    b.bin_start AT TIME ZONE 'UTC' AS start,
+    b.bin_end AT TIME ZONE 'UTC' AS "end",
+    COALESCE(SUM(f.value), 0)::BIGINT AS value
+FROM bins AS b
+LEFT JOIN features AS f
+    ON f.valid_from >= b.bin_start AND f.valid_from < b.bin_end
+GROUP BY b.bin_start, b.bin_end
+ORDER BY b.bin_start;
@@ -0,0 +1,31 @@
+{# Aggregated measure of a single contribution `c` clipped to the AoI `p` #}
+{% macro measure(aggregation) -%}
+    {% if aggregation == 'length' %}
+        CASE
+            WHEN ST_Within(c.geom, p.geom)
+            THEN c.length -- Use precomputed length from ohsome-planet
+            ELSE ST_Length(ST_Intersection(c.geom, p.geom))
+        END
+    {% elif aggregation == 'area' %}
+        CASE
+            WHEN ST_Within(c.geom, p.geom)
+            THEN c.area -- Use precomputed area from ohsome-planet
+            ELSE ST_Area(ST_Intersection(c.geom, p.geom))
+        END
+    {% else %}
+        1
+    {% endif %}
+{%- endmacro %}
+
+{# Monthly bins from start (inclusive) to end (exclusive) #}
+{% macro monthly_bins(start, end) -%}
+    SELECT
+        ts AS bin_start,
+        LEAD(ts, 1, ${{ end }}::date::timestamp) OVER (ORDER BY ts) AS bin_end
+    FROM generate_series(
+        ${{ start }}::date::timestamp,
+        ${{ end }}::date::timestamp,
+        INTERVAL '1 month'
+    ) AS ts
+    WHERE ts < ${{ end }}::date::timestamp
+{%- endmacro %}
@@ -0,0 +1,36 @@
+{% from 'macros.sql' import measure %}
+WITH poly AS (
+    SELECT ST_GeomFromGeoJSON(${{ geom }}) AS geom
+),
+series AS (
+    -- Monthly timestamps from start to end (both inclusive)
+    SELECT ts
+    FROM generate_series(
+        ${{ start }}::date::timestamp,
+        ${{ end }}::date::timestamp,
+        INTERVAL '1 month'
+    ) AS ts
+    UNION
+    SELECT ${{ end }}::date::timestamp
+),
+features AS (
+    -- Measure of each version is computed once for all timestamps it is valid at
+    SELECT
+        c.valid_from,
+        c.valid_to,
+        {{ measure(aggregation) }} AS value
+    FROM {{ contributions }} c, poly AS p
+    WHERE 1=1
+        AND (status_geom_type).status IN ('latest', 'history')
+        AND valid_to > ${{ start }}::date::timestamp
+        AND valid_from <= ${{ end }}::date::timestamp
+        AND ({{ filter }})
+        AND ST_Intersects(c.geom, p.geom)
+)
+SELECT
+    s.ts AT TIME ZONE 'UTC' AS "timestamp",
+    COALESCE(SUM(f.value), 0)::BIGINT AS value
+FROM series AS s
+LEFT JOIN features AS f ON f.valid_from <= s.ts AND f.valid_to > s.ts
+GROUP BY s.ts
+ORDER BY s.ts;
@@ -2,7 +2,7 @@ WITH poly AS (
     SELECT ST_GeomFromGeoJSON(${{ geom }}) AS geom
 )
 SELECT
-    NOW()::timestamp AS snapshot_ts,
+    NOW() AS snapshot_ts,
     {% if aggregation == 'length' %}
         SUM(
             CASE
@@ -0,0 +1,28 @@
+{% from 'macros.sql' import monthly_bins %}
+WITH poly AS (
+    SELECT ST_GeomFromGeoJSON(${{ geom }}) AS geom
+),
+bins AS (
+    {{ monthly_bins(start, end) }}
+),
+contribs AS (
+    -- Contributions of all kinds (creation, modification and deletion)
+    SELECT
+        c.valid_from,
+        c.user_id
+    FROM {{ contributions }} c, poly AS p
+    WHERE 1=1
+        AND valid_from >= ${{ start }}::date::timestamp
+        AND valid_from < ${{ end }}::date::timestamp
+        AND ({{ filter }})
+        AND ST_Intersects(c.geom, p.geom)
+)
+SELECT
+    b.bin_start AT TIME ZONE 'UTC' AS start,
+    b.bin_end AT TIME ZONE 'UTC' AS "end",
+    COUNT(DISTINCT c.user_id) AS value
+FROM bins AS b
+LEFT JOIN contribs AS c
+    ON c.valid_from >= b.bin_start AND c.valid_from < b.bin_end
+GROUP BY b.bin_start, b.bin_end
+ORDER BY b.bin_start;
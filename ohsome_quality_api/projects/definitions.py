@@ -1,43 +1,42 @@
 """Global Variables and Functions."""
 
-import os
 from enum import Enum
 
-import yaml
-
 from ohsome_quality_api.projects.models import Project
-from ohsome_quality_api.utils.helper import get_module_dir
+from ohsome_quality_api.utils.registry import load_yaml, registry, translate
 
 
 def get_project_keys() -> list[str]:
-    return [str(t) for t in load_projects()]
+    return [str(t) for t in _load_projects()]
 
 
-def load_projects() -> dict[str, Project]:
+@registry
+def _load_projects() -> dict[str, Project]:
     """Read definitions of projects.
 
     Returns:
         A dict with all projects included.
     """
-    directory = get_module_dir("ohsome_quality_api.projects")
-    file = os.path.join(directory, "projects.yaml")
-    with open(file, "r") as f:
-        raw = yaml.safe_load(f)
+    raw = load_yaml("ohsome_quality_api.projects", "projects.yaml")
     projects = {}
     for k, v in raw.items():
         projects[k] = Project(**v)
     return projects
 
 
+def load_projects() -> dict[str, Project]:
+    return {k: translate(v) for k, v in _load_projects().items()}
+
+
 def get_project_metadata() -> dict[str, Project]:
     projects = load_projects()
     return projects
 
 
 def get_project(project_key: str) -> Project:
-    projects = get_project_metadata()
+    projects = _load_projects()
     try:
-        return projects[project_key]
+        return translate(projects[project_key])
     except KeyError as error:
         raise KeyError(
             "Invalid project key. Valid project keys are: " + str(projects.keys())
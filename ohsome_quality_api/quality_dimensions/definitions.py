@@ -1,38 +1,37 @@
 """Global Variables and Functions."""
 
-import os
 from enum import Enum
 
-import yaml
-
 from ohsome_quality_api.quality_dimensions.models import QualityDimension
-from ohsome_quality_api.utils.helper import get_module_dir
+from ohsome_quality_api.utils.registry import load_yaml, registry, translate
 
 
-def load_quality_dimensions() -> dict[str, QualityDimension]:
+@registry
+def _load_quality_dimensions() -> dict[str, QualityDimension]:
     """Read definitions of quality dimensions.
 
     Returns:
         A dict with all quality dimensions included.
     """
-    directory = get_module_dir("ohsome_quality_api.quality_dimensions")
-    file = os.path.join(directory, "quality_dimensions.yaml")
-    with open(file, "r") as f:
-        raw = yaml.safe_load(f)
+    raw = load_yaml("ohsome_quality_api.quality_dimensions", "quality_dimensions.yaml")
     quality_dimensions = {}
     for k, v in raw.items():
         quality_dimensions[k] = QualityDimension(**v)
     return quality_dimensions
 
 
+def load_quality_dimensions() -> dict[str, QualityDimension]:
+    return {k: translate(v) for k, v in _load_quality_dimensions().items()}
+
+
 def get_quality_dimensions() -> dict[str, QualityDimension]:
     return load_quality_dimensions()
 
 
 def get_quality_dimension(qd_key: str) -> QualityDimension:
-    quality_dimensions = get_quality_dimensions()
+    quality_dimensions = _load_quality_dimensions()
     try:
-        return quality_dimensions[qd_key]
+        return translate(quality_dimensions[qd_key])
     except KeyError as error:
         raise KeyError(
             "Invalid quality dimension key. Valid quality dimension keys are: "
@@ -41,7 +40,7 @@ def get_quality_dimension(qd_key: str) -> QualityDimension:
 
 
 def get_quality_dimension_keys() -> list[str]:
-    return [str(t) for t in load_quality_dimensions()]
+    return [str(t) for t in _load_quality_dimensions()]
 
 
 QualityDimensionEnum = Enum(
@@ -1,19 +1,14 @@
-import os
 from enum import Enum
 
-import yaml
-
 from ohsome_quality_api.projects.definitions import ProjectEnum
 from ohsome_quality_api.topics.models import Topic
-from ohsome_quality_api.utils.helper import get_module_dir
+from ohsome_quality_api.utils.registry import load_yaml, registry, translate
 
 
-def load_topic_presets() -> dict[str, Topic]:
+@registry
+def _load_topic_presets() -> dict[str, Topic]:
     """Read ohsome API parameters of all topic from YAML file."""
-    directory = get_module_dir("ohsome_quality_api.topics")
-    file = os.path.join(directory, "presets.yaml")
-    with open(file, "r") as f:
-        raw = yaml.safe_load(f)
+    raw = load_yaml("ohsome_quality_api.topics", "presets.yaml")
     topics = {}
     for k, v in raw.items():
         v["filter"] = v.pop("filter")
@@ -22,8 +17,12 @@ def load_topic_presets() -> dict[str, Topic]:
     return topics
 
 
+def load_topic_presets() -> dict[str, Topic]:
+    return {k: translate(v) for k, v in _load_topic_presets().items()}
+
+
 def get_topic_keys() -> list[str]:
-    return [str(t) for t in load_topic_presets()]
+    return [str(t) for t in _load_topic_presets()]
 
 
 def get_topic_presets(project: ProjectEnum = None) -> dict[str, Topic]:
@@ -38,9 +37,9 @@ def get_topic_presets(project: ProjectEnum = None) -> dict[str, Topic]:
 
 def get_topic_preset(topic_key: str) -> Topic:
     """Get ohsome API parameters of a single topic based on topic key."""
-    topics = load_topic_presets()
+    topics = _load_topic_presets()
     try:
-        return topics[topic_key]
+        return translate(topics[topic_key])
     except KeyError as error:
         raise KeyError(
             "Invalid topic key. Valid topic keys are: " + str(topics.keys())
@@ -49,7 +48,7 @@ def get_topic_preset(topic_key: str) -> Topic:
 
 def get_valid_topics(indicator_name: str) -> tuple:
     """Get valid Indicator/Topic combination of an Indicator."""
-    td = load_topic_presets()
+    td = _load_topic_presets()
     return tuple(topic for topic in td if indicator_name in td[topic].indicators)
 
 
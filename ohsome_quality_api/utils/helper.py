@@ -13,8 +13,6 @@ import geojson
 import numpy as np
 from geojson import Feature, FeatureCollection
 
-from ohsome_quality_api.indicators.mapping_saturation.models import BaseStatModel
-
 logger = logging.getLogger(__name__)
 
 
@@ -87,6 +85,9 @@ def json_serialize(obj):
     It should return a JSON encodable version of the object or raise a TypeError.
     https://docs.python.org/3/library/json.html#basic-usage
     """
+    # Import here to avoid circular import (models -> config -> helper)
+    from ohsome_quality_api.indicators.mapping_saturation.models import BaseStatModel
+
     if isinstance(obj, date | datetime):
         return obj.isoformat()
     elif isinstance(obj, BaseStatModel):
@@ -1,13 +1,193 @@
 """Helper functions for `asyncio`."""
 
 import asyncio
-from typing import Coroutine
+import copy
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Hashable,
+    Iterator,
+)
+from weakref import WeakKeyDictionary
+
+from ohsome_quality_api.config import get_config_value
+
+logger = logging.getLogger(__name__)
+
+
+class Budget:
+    """Limit the number of concurrent operations on an upstream service or resource.
+
+    The limit is read from the configuration on first use in an event loop.
+    Current occupancy is tracked for monitoring.
+    """
+
+    def __init__(self, name: str, config_key: str) -> None:
+        self.name = name
+        self.config_key = config_key
+        self.in_use = 0
+        self.waiting = 0
+        # Semaphore is bound to the event loop it is used in
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    @property
+    def limit(self) -> int:
+        return get_config_value(self.config_key)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return self._semaphores[loop]
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        semaphore = self._get_semaphore()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.in_use += 1
+        try:
+            yield
+        finally:
+            self.in_use -= 1
+            semaphore.release()
+
+    def occupancy(self) -> dict:
+        return {"limit": self.limit, "inUse": self.in_use, "waiting": self.waiting}
+
+
+OHSOME_API_BUDGET = Budget("ohsome-api", "concurrency_ohsome_api")
+OHSOMEDB_BUDGET = Budget("ohsomedb", "concurrency_ohsomedb")
+OQAPIDB_BUDGET = Budget("oqapidb", "concurrency_oqapidb")
+CPU_BUDGET = Budget("cpu", "concurrency_cpu")
+
+BUDGETS = MappingProxyType(
+    {
+        budget.name: budget
+        for budget in (OHSOME_API_BUDGET, OHSOMEDB_BUDGET, OQAPIDB_BUDGET, CPU_BUDGET)
+    }
+)
+
+
+def get_occupancy() -> dict[str, dict]:
+    """Get current occupancy of all concurrency budgets."""
+    return {name: budget.occupancy() for name, budget in BUDGETS.items()}
+
+
+# Calls shared in the current scope (see `share_calls`)
+SHARED_CALLS: ContextVar[dict[Hashable, asyncio.Task] | None] = ContextVar(
+    "shared_calls",
+    default=None,
+)
+
+
+@contextmanager
+def share_calls() -> Iterator[None]:
+    """Share results of calls to upstream services within this scope.
+
+    Inside the scope identical calls are executed only once, even if they are not
+    concurrent (e.g. multiple indicators for the same AoI in one request). Results are
+    kept until the scope is left. Tasks created inside the scope share it as well.
+    """
+    token = SHARED_CALLS.set({})
+    try:
+        yield
+    finally:
+        SHARED_CALLS.reset(token)
+
+
+class SingleFlight:
+    """Coalesce identical concurrent calls to an upstream service.
+
+    Callers with the same key share one in-flight call instead of calling the upstream
+    service again. Inside of `share_calls` callers share completed calls as well.
+    If a call has been shared, each caller receives a copy of the result made by
+    `copy_result`. Number of calls and coalesced calls are tracked for monitoring.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        copy_result: Callable[[Any], Any] = copy.deepcopy,
+    ) -> None:
+        self.name = name
+        self.copy_result = copy_result
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: dict[Hashable, tuple[asyncio.Task, list[int]]] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[..., Awaitable],
+        *args,
+        **kwargs,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        key = (id(loop), key)
+        self.calls += 1
+        shared = SHARED_CALLS.get()
+        if shared is not None and (self.name, key) in shared:
+            self.coalesced += 1
+            logger.debug("Share call to {0}".format(self.name))
+            result = await asyncio.shield(shared[(self.name, key)])
+            return self.copy_result(result)
+        if key in self._in_flight:
+            self.coalesced += 1
+            task, waiters = self._in_flight[key]
+            logger.debug("Coalesce call to {0}".format(self.name))
+        else:
+            task = loop.create_task(func(*args, **kwargs))
+            waiters = [0]
+            self._in_flight[key] = (task, waiters)
+            # Remove call before any caller resumes to not share results of done calls
+            task.add_done_callback(lambda _: self._in_flight.pop(key))
+        waiters[0] += 1
+        if shared is not None:
+            shared[(self.name, key)] = task
+        # Shield shared call from cancellation of a single caller
+        result = await asyncio.shield(task)
+        if waiters[0] > 1 or shared is not None:
+            return self.copy_result(result)
+        return result
+
+    def counters(self) -> dict:
+        return {"calls": self.calls, "coalesced": self.coalesced}
+
+
+OHSOME_API_SINGLE_FLIGHT = SingleFlight("ohsome-api")
+# Records of asyncpg are immutable
+DATABASE_SINGLE_FLIGHT = SingleFlight("database", copy_result=list)
+
+SINGLE_FLIGHTS = MappingProxyType(
+    {
+        single_flight.name: single_flight
+        for single_flight in (OHSOME_API_SINGLE_FLIGHT, DATABASE_SINGLE_FLIGHT)
+    }
+)
+
+
+def get_coalescing() -> dict[str, dict]:
+    """Get number of calls and coalesced calls to upstream services."""
+    return {name: sf.counters() for name, sf in SINGLE_FLIGHTS.items()}
 
 
 async def gather_with_semaphore(tasks: list, *args, **kwargs) -> Coroutine:
     """A wrapper around `gather` to limit the number of tasks executed at a time."""
     # Semaphore needs to initiated inside of the event loop
-    semaphore = asyncio.Semaphore(4)
+    semaphore = asyncio.Semaphore(get_config_value("concurrent_computations"))
 
     async def sem_task(task):
         async with semaphore:
@@ -0,0 +1,103 @@
+"""Run CPU-bound functions outside of the event loop.
+
+CPU-bound stages of the indicator computation (calculation and figure creation) would
+block the event loop and with it every other request handled by the same worker.
+Those stages are executed in a thread or process pool instead. The kind of pool is
+configured by `executor` (`thread`, `process` or `inline`). The number of workers is
+given by `concurrency_cpu`.
+
+Functions and arguments passed to a process pool need to be picklable. The locale of
+the current request is handed over to the worker process.
+"""
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, TypeVar
+
+from fastapi import FastAPI
+from fastapi_i18n import get_locale
+from fastapi_i18n.main import Translator, translator
+
+from ohsome_quality_api.config import get_config_value
+
+T = TypeVar("T")
+
+EXECUTOR: Executor | None = None
+
+
+def build_executor() -> Executor | None:
+    mode = get_config_value("executor")
+    max_workers = get_config_value("concurrency_cpu")
+    match mode:
+        case "inline":
+            return None
+        case "thread":
+            return ThreadPoolExecutor(max_workers, thread_name_prefix="oqapi-cpu")
+        case "process":
+            # Fork is not safe with threads and an embedded R interpreter
+            context = multiprocessing.get_context("spawn")
+            return ProcessPoolExecutor(max_workers, mp_context=context)
+        case _:
+            raise ValueError(
+                "Invalid executor: {}. ".format(mode)
+                + "Valid executors are: inline, thread and process."
+            )
+
+
+def get_executor() -> Executor | None:
+    """Get executor. Create executor on first call."""
+    global EXECUTOR
+    if EXECUTOR is None:
+        EXECUTOR = build_executor()
+    return EXECUTOR
+
+
+def shutdown_executor() -> None:
+    global EXECUTOR
+    if EXECUTOR is not None:
+        EXECUTOR.shutdown()
+        EXECUTOR = None
+
+
+@asynccontextmanager
+async def create_executor_for_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    app.state.executor = get_executor()
+    try:
+        yield
+    finally:
+        shutdown_executor()
+
+
+def run_with_locale(locale: str, func: Callable[..., T], *args) -> T:
+    """Run function with translator for locale set. Used in worker processes."""
+    token = translator.set(Translator(locale=locale))
+    try:
+        return func(*args)
+    finally:
+        translator.reset(token)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args) -> T:
+    """Run CPU-bound function in executor without blocking the event loop."""
+    executor = get_executor()
+    if executor is None:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        return await loop.run_in_executor(
+            executor,
+            run_with_locale,
+            get_locale(),
+            func,
+            *args,
+        )
+    # Context variables (e.g. the translator) are not propagated to threads by default
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(context.run, func, *args),
+    )
@@ -1,3 +1,4 @@
+import numpy as np
 from geojson import Feature
 from geojson.utils import coords
 from pyproj import Geod
@@ -11,3 +12,63 @@ def calculate_area(feature: Feature) -> float:
     lats = tuple(c[1] for c in coordinates)
     area, _ = geod.polygon_area_perimeter(lons=lons, lats=lats)
     return area
+
+
+def simplify(geometry: dict, tolerance: float) -> dict:
+    """Simplify rings of a (Multi)Polygon using the Douglas-Peucker algorithm.
+
+    Rings which would collapse to less than four positions are not simplified.
+    Other geometry types are returned unchanged.
+    """
+    match geometry["type"]:
+        case "Polygon":
+            coordinates = _simplify_polygon(geometry["coordinates"], tolerance)
+        case "MultiPolygon":
+            coordinates = [
+                _simplify_polygon(polygon, tolerance)
+                for polygon in geometry["coordinates"]
+            ]
+        case _:
+            return geometry
+    return {"type": geometry["type"], "coordinates": coordinates}
+
+
+def _simplify_polygon(rings: list, tolerance: float) -> list:
+    simplified = []
+    for ring in rings:
+        points = np.asarray(ring, dtype=float)
+        if len(points) > 4:
+            result = douglas_peucker(points, tolerance)
+            if len(result) >= 4:
+                points = result
+        simplified.append(points.tolist())
+    return simplified
+
+
+def douglas_peucker(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Keep positions deviating more than tolerance from the simplified line."""
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        distances = _distances(points[start + 1 : end, :2], points[start], points[end])
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            index += start + 1
+            keep[index] = True
+            stack.extend(((start, index), (index, end)))
+    return points[keep]
+
+
+def _distances(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Distances of points to the line segment between a and b."""
+    a, b = a[:2], b[:2]
+    ab = b - a
+    length = ab @ ab
+    if length == 0:
+        return np.hypot(*(points - a).T)
+    t = np.clip((points - a) @ ab / length, 0, 1)
+    return np.hypot(*(points - (a + t[:, None] * ab)).T)
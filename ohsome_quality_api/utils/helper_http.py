@@ -0,0 +1,88 @@
+"""Shared HTTP client for requests to the ohsome API.
+
+One connection-pooled `httpx.AsyncClient` is created per process during the lifespan
+of the FastAPI app (see `create_client_for_lifespan`). Reusing pooled connections
+avoids a new TCP and TLS handshake for every request to the ohsome API.
+
+Outside of the app lifespan (e.g. scripts or tests) `get_client` falls back to a
+short-lived client with the same configuration.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+from fastapi import FastAPI
+
+from ohsome_quality_api.config import get_config_value
+from ohsome_quality_api.utils.helper_asyncio import OHSOME_API_BUDGET
+
+logger = logging.getLogger("ohsome_quality_api")
+
+# 660s timeout for reading, and a 300s timeout elsewhere.
+# The ohsome API can take a long time to send an answer (< 10 minutes).
+TIMEOUT = httpx.Timeout(300, read=660)
+
+CLIENT: httpx.AsyncClient | None = None
+
+
+def build_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=get_config_value("ohsome_api_max_connections"),
+        max_keepalive_connections=get_config_value(
+            "ohsome_api_max_keepalive_connections"
+        ),
+        keepalive_expiry=get_config_value("ohsome_api_keepalive_expiry"),
+    )
+
+
+def build_client(unverified: tuple[str, ...] = ()) -> httpx.AsyncClient:
+    """Build a connection-pooled HTTP client.
+
+    Args:
+        unverified: Base URLs for which the SSL certificate is not verified.
+    """
+    limits = build_limits()
+    http2 = get_config_value("ohsome_api_http2")
+    mounts = {
+        url: httpx.AsyncHTTPTransport(verify=False, limits=limits, http2=http2)
+        for url in unverified
+    }
+    return httpx.AsyncClient(
+        timeout=TIMEOUT,
+        limits=limits,
+        http2=http2,
+        mounts=mounts,
+    )
+
+
+@asynccontextmanager
+async def create_client_for_lifespan(
+    app: FastAPI,
+    unverified: tuple[str, ...] = (),
+) -> AsyncIterator[httpx.AsyncClient]:
+    global CLIENT
+    async with build_client(unverified) as client:
+        app.state.http_client = client
+        CLIENT = client
+        try:
+            yield client
+        finally:
+            CLIENT = None
+
+
+@asynccontextmanager
+async def get_client(
+    unverified: tuple[str, ...] = (),
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Get the shared HTTP client or a short-lived one outside of the app lifespan.
+
+    The number of concurrent requests is limited by the ohsome API budget.
+    """
+    async with OHSOME_API_BUDGET.acquire():
+        if CLIENT is not None:
+            yield CLIENT
+        else:
+            async with build_client(unverified) as client:
+                yield client
@@ -0,0 +1,88 @@
+"""In-memory registry of definitions read from YAML files.
+
+Definitions of topics, indicators, attributes, projects and quality dimensions as well
+as templates, thresholds and datasets of indicators are parsed only once into frozen
+objects. Translation is applied on every lookup according to the locale of the
+current request.
+
+SQL queries are read from files only once as well (see `load_sql`).
+"""
+
+import contextvars
+import os
+from functools import cache, wraps
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, TypeVar
+
+import yaml
+from fastapi_i18n import _
+from pydantic import BaseModel
+
+from ohsome_quality_api.utils.helper import get_module_dir
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def load_yaml(module_name: str, file_name: str) -> dict:
+    """Read YAML file located in the directory of a module."""
+    directory = get_module_dir(module_name)
+    file = os.path.join(directory, file_name)
+    with open(file, "r") as f:
+        return yaml.safe_load(f)
+
+
+@cache
+def load_sql(module_name: str, file_name: str, **identifiers: str) -> str:
+    """Read SQL file located in the directory of a module.
+
+    SQL identifiers (e.g. `table_name`) are substituted into the query using
+    `str.format`. Queries are cached per identifiers. The query text is therefore
+    identical across calls and asyncpg can reuse its prepared statement.
+    """
+    if identifiers:
+        return load_sql(module_name, file_name).format(**identifiers)
+    directory = get_module_dir(module_name)
+    file = os.path.join(directory, file_name)
+    with open(file, "r") as f:
+        return f.read()
+
+
+def load_all_sql(package_name: str = "ohsome_quality_api") -> None:
+    """Read all SQL files of a package into the registry (e.g. at startup)."""
+    root = Path(get_module_dir(package_name))
+    for file in root.rglob("*.sql"):
+        module_dir = file.parent
+        while not (module_dir / "__init__.py").exists():
+            module_dir = module_dir.parent
+        module_name = ".".join((package_name, *module_dir.relative_to(root).parts))
+        load_sql(module_name, file.relative_to(module_dir).as_posix())
+
+
+def registry(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Cache untranslated definitions returned by function per arguments.
+
+    Dictionaries are cached as read-only mapping.
+
+    The function is executed in an empty context. This prevents the translator of
+    the request, which triggered the first call, from leaking into the registry.
+    """
+
+    @cache
+    @wraps(func)
+    def wrapper(*args):
+        result = contextvars.Context().run(func, *args)
+        if isinstance(result, dict):
+            return MappingProxyType(result)
+        return result
+
+    return wrapper
+
+
+def translate(model: T, fields: tuple[str, ...] = ("name", "description")) -> T:
+    """Return a translated copy of a model from the registry.
+
+    The copy can be modified by the caller without affecting the registry.
+    """
+    update = {field: _(getattr(model, field)) for field in fields}
+    return model.model_copy(update=update, deep=True)
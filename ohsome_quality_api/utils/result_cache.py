@@ -0,0 +1,201 @@
+"""Cache of indicator results.
+
+Results are cached by indicator key, topic, parameters and geometry of the feature.
+Each entry is stored together with the version of the OSM data the result has been
+computed from. Once a new version of the OSM data is available all entries of previous
+versions are dropped.
+
+The cache has a size-bounded in-memory tier per process and an optional on-disk tier
+(SQLite database in the data directory), which is shared between processes and survives
+restarts.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from fastapi_i18n import get_locale
+from geojson import Feature
+
+from ohsome_quality_api.config import get_config_value
+from ohsome_quality_api.indicators.models import Result
+from ohsome_quality_api.ohsome_api import client as ohsome_api_client
+from ohsome_quality_api.topics.models import Topic
+from ohsome_quality_api.utils.helper import json_serialize
+
+logger = logging.getLogger(__name__)
+
+FILENAME = "result-cache.sqlite"
+
+RESULT_CACHE: "ResultCache | None" = None
+
+
+class ResultCache:
+    """Two-tier cache of serialized indicator results.
+
+    Args:
+        size: Maximal number of results kept in memory. Least recently used results
+            are evicted first.
+        path: Path to a SQLite database. If not given results are only cached in
+            memory.
+    """
+
+    def __init__(self, size: int, path: str | None = None) -> None:
+        self.size = size
+        self.path = path
+        self.version: str | None = None
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def db(self) -> sqlite3.Connection | None:
+        if self.path is not None and self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS result "
+                "(key TEXT PRIMARY KEY, version TEXT NOT NULL, result TEXT NOT NULL)"
+            )
+            self._db.commit()
+        return self._db
+
+    async def get(self, key: str, version: str) -> Result | None:
+        """Get cached result computed from given version of the OSM data."""
+        await self.advance(version)
+        raw = self._memory.get(key)
+        if raw is not None:
+            self._memory.move_to_end(key)
+        elif self.path is not None:
+            raw = await asyncio.to_thread(self._get_disk, key, version)
+            if raw is None:
+                return None
+            self._set_memory(key, raw)
+        else:
+            return None
+        return Result.model_validate(json.loads(raw))
+
+    async def set(self, key: str, version: str, result: Result) -> None:
+        """Cache result computed from given version of the OSM data."""
+        await self.advance(version)
+        if version != self.version:
+            # Result has been computed from outdated OSM data
+            return
+        raw = json.dumps(
+            result.model_dump(by_alias=True, exclude={"label"}),
+            default=json_serialize,
+        )
+        self._set_memory(key, raw)
+        if self.path is not None:
+            await asyncio.to_thread(self._set_disk, key, version, raw)
+
+    async def advance(self, version: str) -> None:
+        """Drop all entries of other versions if a new version of OSM data is seen."""
+        if self.version is None or version > self.version:
+            if self.version is not None:
+                logger.info("OSM data has been updated. Clear result cache.")
+            self.version = version
+            self._memory.clear()
+            if self.path is not None:
+                await asyncio.to_thread(self._advance_disk, version)
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self.db is not None:
+            with self._lock:
+                self.db.execute("DELETE FROM result")
+                self.db.commit()
+
+    # Queries of the SQLite database are blocking and run in a thread.
+    # The connection is shared by those threads, hence queries are serialized.
+
+    def _get_disk(self, key: str, version: str) -> str | None:
+        with self._lock:
+            row = self.db.execute(
+                "SELECT result FROM result WHERE key = ? AND version = ?",
+                (key, version),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def _set_disk(self, key: str, version: str, raw: str) -> None:
+        with self._lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO result (key, version, result) VALUES (?, ?, ?)",
+                (key, version, raw),
+            )
+            self.db.commit()
+
+    def _advance_disk(self, version: str) -> None:
+        with self._lock:
+            self.db.execute("DELETE FROM result WHERE version != ?", (version,))
+            self.db.commit()
+
+    def _set_memory(self, key: str, raw: str) -> None:
+        self._memory[key] = raw
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.size:
+            self._memory.popitem(last=False)
+
+
+def get_result_cache() -> ResultCache | None:
+    """Get result cache of this process. Return `None` if the cache is disabled."""
+    global RESULT_CACHE
+    if get_config_value("result_cache_size") <= 0:
+        return None
+    if RESULT_CACHE is None:
+        path = None
+        if get_config_value("result_cache_disk"):
+            path = os.path.join(get_config_value("data_dir"), FILENAME)
+        RESULT_CACHE = ResultCache(get_config_value("result_cache_size"), path)
+    return RESULT_CACHE
+
+
+async def get_data_version() -> str:
+    """Get version of the OSM data indicators are computed from.
+
+    The version is the latest timestamp of the ohsome API. If the ohsomeDB is enabled,
+    the snapshot in the search path of the ohsomeDB is appended.
+    """
+    raw = await ohsome_api_client.metadata()
+    version = raw["temporalExtent"]["latestTimestamp"]
+    if get_config_value("ohsomedb_enabled"):
+        version += " " + get_config_value("ohsomedb_search_path")
+    return version
+
+
+def hash_geometry(feature: Feature) -> str:
+    """Hash geometry of the feature independent of the key order of the GeoJSON."""
+    raw = json.dumps(feature["geometry"], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def build_key(
+    key: str,
+    topic: Topic,
+    feature: Feature,
+    include_figure: bool,
+    **kwargs,
+) -> str:
+    """Build cache key of an indicator.
+
+    Custom topic filters and additional parameters (e.g. attribute keys) are part of
+    the key. Results are localized, hence the locale is part of the key as well.
+    """
+    raw = json.dumps(
+        {
+            "key": key,
+            "topic": topic.model_dump(),
+            "geometry": hash_geometry(feature),
+            "include_figure": include_figure,
+            "locale": get_locale(),
+            "parameters": kwargs,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=json_serialize,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
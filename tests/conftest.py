@@ -11,14 +11,22 @@ from _pytest.monkeypatch import MonkeyPatch
 from fastapi_i18n.main import Translator, translator
 from geojson import Feature, FeatureCollection, Polygon
 
+from ohsome_quality_api import config, main
+from ohsome_quality_api.api import coverage_cache, jobs
+from ohsome_quality_api.api.coverage_cache import CoverageCache
+from ohsome_quality_api.api.jobs import JobQueue
 from ohsome_quality_api.attributes.models import Attribute
 from ohsome_quality_api.config import get_config_value
+from ohsome_quality_api.geodatabase import client as db_client
+from ohsome_quality_api.geodatabase.coverage import CoverageIndexCache
 from ohsome_quality_api.indicators.currentness.indicator import Bin
 from ohsome_quality_api.indicators.definitions import (
     get_indicator,
     get_indicator_metadata,
 )
 from ohsome_quality_api.indicators.models import IndicatorMetadata
+from ohsome_quality_api.ohsome_api import client as ohsome_api_client
+from ohsome_quality_api.ohsome_api.client import MetadataCache
 from ohsome_quality_api.projects.definitions import get_project, load_projects
 from ohsome_quality_api.projects.models import Project
 from ohsome_quality_api.quality_dimensions.definitions import (
@@ -41,6 +49,63 @@ logger = logging.getLogger("rpy2")
 logger.propagate = False
 
 
+@pytest.fixture(autouse=True)
+def reload_config():
+    """Invalidate cached configuration to pick up patched environment variables."""
+    config.reload_config()
+    yield
+    config.reload_config()
+
+
+@pytest.fixture(autouse=True)
+def disable_result_cache(monkeypatch):
+    """Compute indicators from scratch. Tests of the result cache enable it."""
+    monkeypatch.setattr(main, "get_result_cache", lambda: None)
+
+
+@pytest.fixture(autouse=True)
+def reset_metadata_cache(monkeypatch):
+    """Request metadata of the ohsome API again in each test."""
+    monkeypatch.setattr(ohsome_api_client, "METADATA_CACHE", MetadataCache())
+
+
+@pytest.fixture(autouse=True)
+def reset_coverage_index(monkeypatch):
+    """Load coverages of reference datasets again in each test."""
+    monkeypatch.setattr(
+        db_client,
+        "COVERAGE_INDEX_CACHE",
+        CoverageIndexCache(db_client.get_coverage_geometries),
+    )
+
+
+@pytest.fixture(autouse=True)
+def disable_coverage_index(monkeypatch):
+    """Relate AoIs to coverages in the database. Tests of the index enable it.
+
+    Otherwise the complete coverage of the reference dataset would be recorded in the
+    cassette of each test.
+    """
+    monkeypatch.setenv("OQAPI_COVERAGE_INDEX_TTL", "0")
+    config.reload_config()
+
+
+@pytest.fixture(autouse=True)
+def reset_coverage_cache(monkeypatch):
+    """Encode responses of the coverage endpoint again in each test."""
+    monkeypatch.setattr(coverage_cache, "COVERAGE_CACHE", CoverageCache())
+
+
+@pytest.fixture(autouse=True)
+def reset_job_queue(monkeypatch, tmp_path):
+    """Store results of jobs in a temporary directory."""
+    monkeypatch.setattr(
+        jobs,
+        "JOB_QUEUE",
+        JobQueue(size=10, workers=2, path=str(tmp_path / "jobs")),
+    )
+
+
 # TODO: remove once ohsomedb has been replaced by ohsome-api
 @pytest.fixture(autouse=True)
 def get_connection(monkeypatch):
@@ -68,6 +133,8 @@ def get_connection(monkeypatch):
             if database == "ohsomedb":
                 sql = 'set search_path to "global_2026-04-27",public'
                 await connection.execute(sql)
+            else:
+                await db_client.init_connection(connection)
             yield connection
         finally:
             await connection.close()
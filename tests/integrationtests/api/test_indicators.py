@@ -289,6 +289,7 @@ def test_minimal_fc(
     feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
     headers,
     schema,
+    query_group_by_boundary_per_feature,
 ):
     """Minimal viable request for multiple bpolys."""
     endpoint = ENDPOINT + "minimal"
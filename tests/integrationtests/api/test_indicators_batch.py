@@ -0,0 +1,106 @@
+"""Tests for requesting multiple indicators at once (`/indicators`)."""
+
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+from ohsome_quality_api.indicators.minimal.indicator import Minimal
+from ohsome_quality_api.ohsome_api import client as ohsome_api_client
+from ohsome_quality_api.utils.helper_asyncio import OHSOME_API_SINGLE_FLIGHT
+
+ENDPOINT = "/indicators"
+
+
+@pytest.fixture
+def preprocess_batch(monkeypatch):
+    async def preprocess_batch(indicators):
+        for indicator in indicators:
+            indicator.count = 1
+            indicator.result.timestamp_osm = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(Minimal, "preprocess_batch", preprocess_batch)
+
+
+def test_indicators(
+    client,
+    preprocess_batch,
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+):
+    parameters = {
+        "bpolys": feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+        "topic": "minimal",
+        "indicators": ["minimal", "minimal"],
+    }
+    response = client.post(
+        ENDPOINT,
+        json=parameters,
+        headers={"accept": "application/geo+json"},
+    )
+    assert response.status_code == 200
+    content = response.json()
+    # Duplicated indicators are computed once
+    assert len(content["features"]) == 3
+    assert content["attribution"]["text"] == Minimal.attribution()
+
+
+def test_indicators_invalid_combination(client, bpolys):
+    parameters = {
+        "bpolys": bpolys,
+        "topic": "minimal",
+        "indicators": ["minimal", "road-comparison"],
+    }
+    response = client.post(ENDPOINT, json=parameters)
+    assert response.status_code == 422
+    assert "road-comparison" in response.json()["detail"][0]["msg"]
+
+
+def test_indicators_empty(client, bpolys):
+    parameters = {"bpolys": bpolys, "topic": "minimal", "indicators": []}
+    response = client.post(ENDPOINT, json=parameters)
+    assert response.status_code == 422
+
+
+def test_indicators_shared_calls(client, monkeypatch, bpolys):
+    """Identical requests of different indicators to the ohsome API are shared."""
+    monkeypatch.setenv("OQAPI_OHSOME_API_METADATA_TTL", "0")
+    ends = [
+        f"{year}-{month:02}-01T00:00:00Z"
+        for year in range(2020, 2026)
+        for month in range(1, 13)
+    ]
+    bins = {"start": ends[:-1], "end": ends[1:], "value": [10] * (len(ends) - 1)}
+    responses = {
+        "/metadata": {"temporalExtent": {"latestTimestamp": "2025-12-15T00:00:00Z"}},
+        "/currentness/count.json": {"result": bins},
+        "/activity/users.json": {"result": bins},
+    }
+
+    async def request(url, *_):
+        return responses[url.removeprefix(ohsome_api_client.BASE_URL)]
+
+    request = mock.AsyncMock(side_effect=request)
+    monkeypatch.setattr(ohsome_api_client, "_request", request)
+    calls = OHSOME_API_SINGLE_FLIGHT.calls
+    coalesced = OHSOME_API_SINGLE_FLIGHT.coalesced
+    parameters = {
+        "bpolys": bpolys,
+        "topic": "building-count",
+        "indicators": ["currentness", "user-activity"],
+    }
+    response = client.post(
+        ENDPOINT,
+        json=parameters,
+        headers={"accept": "application/json"},
+    )
+    assert response.status_code == 200
+    assert len(response.json()["result"]) == 2
+    # Metadata is requested once for both indicators. Time series differ.
+    urls = [call.args[0] for call in request.call_args_list]
+    assert sorted(u.removeprefix(ohsome_api_client.BASE_URL) for u in urls) == [
+        "/activity/users.json",
+        "/currentness/count.json",
+        "/metadata",
+    ]
+    assert OHSOME_API_SINGLE_FLIGHT.calls - calls == 4
+    assert OHSOME_API_SINGLE_FLIGHT.coalesced - coalesced == 1
@@ -0,0 +1,108 @@
+"""Tests for streaming indicators as NDJSON or GeoJSON Text Sequence."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from ohsome_quality_api import main
+from ohsome_quality_api.indicators.minimal.indicator import Minimal
+from ohsome_quality_api.utils.exceptions import OhsomeApiError
+
+ENDPOINT = "/indicators/minimal"
+
+
+@pytest.fixture
+def parameters(feature_collection_heidelberg_bahnstadt_bergheim_weststadt):
+    return {
+        "bpolys": feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+        "topic": "minimal",
+    }
+
+
+@pytest.fixture
+def preprocess_batch(monkeypatch):
+    async def preprocess_batch(indicators):
+        for indicator in indicators:
+            indicator.count = 1
+            indicator.result.timestamp_osm = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(Minimal, "preprocess_batch", preprocess_batch)
+
+
+def test_ndjson(client, parameters, preprocess_batch):
+    response = client.post(
+        ENDPOINT,
+        json=parameters,
+        headers={"accept": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(record["id"] for record in records) == [0, 1, 2]
+    for record in records:
+        assert record["result"]["value"] == 1.0
+
+
+def test_geojson_seq(client, parameters, preprocess_batch):
+    response = client.post(
+        ENDPOINT,
+        json=parameters,
+        headers={"accept": "application/geo+json-seq"},
+    )
+    assert response.status_code == 200
+    records = response.text.split("\x1e")
+    assert records[0] == ""
+    features = [json.loads(record) for record in records[1:]]
+    assert sorted(feature["id"] for feature in features) == [0, 1, 2]
+    for feature in features:
+        assert feature["type"] == "Feature"
+        assert feature["properties"]["result"]["value"] == 1.0
+
+
+def test_ndjson_error(client, parameters, monkeypatch):
+    async def preprocess_batch(_):
+        raise OhsomeApiError("Timeout")
+
+    monkeypatch.setattr(Minimal, "preprocess_batch", preprocess_batch)
+    response = client.post(
+        ENDPOINT,
+        json=parameters,
+        headers={"accept": "application/x-ndjson"},
+    )
+    assert response.status_code == 422
+    assert response.json()["type"] == "OhsomeApiError"
+
+
+@pytest.mark.parametrize(
+    "media_type,separator",
+    [("application/x-ndjson", ""), ("application/geo+json-seq", "\x1e")],
+)
+def test_error_after_first_record(
+    client,
+    parameters,
+    preprocess_batch,
+    monkeypatch,
+    media_type,
+    separator,
+):
+    create_indicator_stream = main.create_indicator_stream
+
+    async def create_indicator_stream_failing(*args, **kwargs):
+        async for indicator in create_indicator_stream(*args, **kwargs):
+            yield indicator
+            raise OhsomeApiError("Timeout")
+
+    monkeypatch.setattr(
+        main, "create_indicator_stream", create_indicator_stream_failing
+    )
+    response = client.post(ENDPOINT, json=parameters, headers={"accept": media_type})
+    assert response.status_code == 200
+    # Record separator of GeoJSON Text Sequences is a line boundary of `splitlines`
+    records = response.text.rstrip("\n").split("\n")
+    assert len(records) == 2
+    assert all(record.startswith(separator) for record in records)
+    assert "id" in json.loads(records[0].removeprefix(separator))
+    error = json.loads(records[1].removeprefix(separator))
+    assert error["type"] == "OhsomeApiError"
+    assert error["detail"] == [{"msg": "Timeout"}]
@@ -0,0 +1,99 @@
+"""Tests for computing indicators asynchronously as jobs."""
+
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from ohsome_quality_api.api.api import app
+from ohsome_quality_api.indicators.minimal.indicator import Minimal
+
+ENDPOINT = "/jobs/"
+
+
+@pytest.fixture
+def job_client(client, monkeypatch):
+    """Client keeping one event loop for all requests to run jobs in the background.
+
+    Database pools and HTTP client of the lifespan are not needed.
+    """
+
+    @asynccontextmanager
+    async def lifespan(_):
+        yield
+
+    monkeypatch.setattr(app.router, "lifespan_context", lifespan)
+    with client as client_:
+        yield client_
+
+
+@pytest.fixture
+def preprocess_batch(monkeypatch):
+    async def preprocess_batch(indicators):
+        for indicator in indicators:
+            indicator.count = 1
+            indicator.result.timestamp_osm = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(Minimal, "preprocess_batch", preprocess_batch)
+
+
+def wait_for(client, url: str) -> dict:
+    for _ in range(100):
+        content = client.get(url).json()
+        if content["result"]["status"] not in ("queued", "running"):
+            return content
+        time.sleep(0.05)
+    raise AssertionError("Job did not finish.")
+
+
+def test_job(
+    job_client,
+    preprocess_batch,
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+):
+    parameters = {
+        "bpolys": feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+        "topic": "minimal",
+    }
+    response = job_client.post(
+        ENDPOINT + "indicators/minimal",
+        json=parameters,
+        headers={"accept": "application/json"},
+    )
+    assert response.status_code == 202
+    job = response.json()["result"]
+    assert job["key"] == "minimal"
+    assert job["progress"]["total"] == 3
+    assert response.headers["location"].endswith(ENDPOINT + job["id"])
+
+    content = wait_for(job_client, ENDPOINT + job["id"])
+    assert content["result"]["status"] == "succeeded"
+    assert content["result"]["progress"] == {"done": 3, "total": 3}
+
+    response = job_client.get(ENDPOINT + job["id"] + "/result")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    result = response.json()["result"]
+    assert [r["result"]["value"] for r in result] == [1.0, 1.0, 1.0]
+
+    response = job_client.delete(ENDPOINT + job["id"])
+    assert response.status_code == 200
+    assert job_client.get(ENDPOINT + job["id"]).status_code == 404
+
+
+def test_job_unsupported_media_type(job_client, bpolys):
+    parameters = {"bpolys": bpolys, "topic": "minimal"}
+    response = job_client.post(
+        ENDPOINT + "indicators/minimal",
+        json=parameters,
+        headers={"accept": "text/csv"},
+    )
+    assert response.status_code == 415
+
+
+def test_job_not_found(client):
+    response = client.get(ENDPOINT + "00000000-0000-0000-0000-000000000000")
+    assert response.status_code == 404
+    response = client.get(ENDPOINT + "foo")
+    assert response.status_code == 422
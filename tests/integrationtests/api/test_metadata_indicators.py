@@ -101,3 +101,31 @@ def test_coverage_land_cover_thematic_accuracy(client):
     result = geojson.loads(json.dumps(response.json()))
     assert result.is_valid
     assert isinstance(result, geojson.FeatureCollection)
+
+
+def test_coverage_etag(client):
+    url = "metadata/indicators/mapping-saturation/coverage"
+    response = client.get(url)
+    etag = response.headers["etag"]
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    response = client.get(url + "?inverse=true", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_coverage_gzip(client):
+    url = "metadata/indicators/mapping-saturation/coverage"
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == client.get(url, headers={"Accept-Encoding": ""}).json()
+
+
+def test_coverage_simplify(client):
+    response = client.get("metadata/indicators/mapping-saturation/coverage?simplify=3")
+    assert response.status_code == 200
+    assert response.json()["features"][0]["geometry"]["type"] == "Polygon"
+    response = client.get("metadata/indicators/mapping-saturation/coverage?simplify=4")
+    assert response.status_code == 422
@@ -1,8 +1,42 @@
+import asyncio
+
 import pytest
 
+from ohsome_quality_api import config
+from ohsome_quality_api.ohsome import client as ohsome_client
 from tests.integrationtests.utils import get_geojson_fixture
 
 
 @pytest.fixture
 def europe():
     return get_geojson_fixture("europe.geojson")
+
+
+@pytest.fixture
+def enable_ohsomedb(monkeypatch):
+    """Compute the indicator of the given key with the ohsomeDB."""
+
+    def enable_ohsomedb_(key: str) -> None:
+        monkeypatch.setenv("OQAPI_OHSOMEDB_ENABLED", "true")
+        monkeypatch.setenv("OQAPI_OHSOMEDB_INDICATORS", key)
+        config.reload_config()
+
+    return enable_ohsomedb_
+
+
+@pytest.fixture
+def query_group_by_boundary_per_feature(monkeypatch):
+    """Query features of a "group by boundary" request one by one.
+
+    Cassettes contain responses recorded for each feature. Parsing of the grouped
+    response is tested in `tests/unittests/test_ohsome_client.py`.
+    """
+
+    async def query_group_by_boundary(topic, features, **kwargs):
+        return await asyncio.gather(
+            *[ohsome_client.query(topic, feature, **kwargs) for feature in features]
+        )
+
+    monkeypatch.setattr(
+        ohsome_client, "query_group_by_boundary", query_group_by_boundary
+    )
@@ -0,0 +1,71 @@
+-- Minimal contributions table of the ohsomeDB for tests against a local PostGIS.
+--
+-- AoI: POLYGON((8.67 49.40, 8.69 49.40, 8.69 49.42, 8.67 49.42, 8.67 49.40))
+--
+-- way/1: building created 2020-01-15 (user 1), height added 2021-03-10 (user 2)
+-- way/2: building created 2020-06-05 (user 1)
+-- way/3: building created 2020-02-10 (user 3), deleted 2020-05-20 (user 3)
+-- way/4: building outside of the AoI (user 4)
+-- way/5: highway (user 5)
+-- way/6: building created 2020-06-20 (user 1)
+CREATE EXTENSION IF NOT EXISTS postgis;
+
+DROP SCHEMA IF EXISTS ohsomedb_fixture CASCADE;
+CREATE SCHEMA ohsomedb_fixture;
+
+CREATE TYPE ohsomedb_fixture.status_geom_type AS (
+    status TEXT,
+    geom_type TEXT
+);
+
+CREATE TABLE ohsomedb_fixture.contributions (
+    osm_type TEXT NOT NULL,
+    osm_id BIGINT NOT NULL,
+    version INTEGER NOT NULL,
+    changeset_id BIGINT NOT NULL,
+    user_id BIGINT NOT NULL,
+    valid_from TIMESTAMP NOT NULL,
+    valid_to TIMESTAMP NOT NULL,
+    tags JSONB NOT NULL,
+    status_geom_type ohsomedb_fixture.status_geom_type NOT NULL,
+    geom GEOMETRY(Geometry, 4326) NOT NULL,
+    length DOUBLE PRECISION NOT NULL,
+    area DOUBLE PRECISION NOT NULL
+);
+
+INSERT INTO ohsomedb_fixture.contributions
+    (osm_type, osm_id, version, changeset_id, user_id, valid_from, valid_to, tags,
+     status_geom_type, geom, length, area)
+VALUES
+    ('way', 1, 1, 1, 1, '2020-01-15', '2021-03-10',
+     '{"building": "yes"}', ROW('history', 'Polygon'),
+     ST_GeomFromText('POLYGON((8.671 49.401, 8.672 49.401, 8.672 49.402, 8.671 49.402, 8.671 49.401))', 4326),
+     0, 8000),
+    ('way', 1, 2, 5, 2, '2021-03-10', 'infinity',
+     '{"building": "yes", "height": "10"}', ROW('latest', 'Polygon'),
+     ST_GeomFromText('POLYGON((8.671 49.401, 8.672 49.401, 8.672 49.402, 8.671 49.402, 8.671 49.401))', 4326),
+     0, 8000),
+    ('way', 2, 1, 3, 1, '2020-06-05', 'infinity',
+     '{"building": "house"}', ROW('latest', 'Polygon'),
+     ST_GeomFromText('POLYGON((8.681 49.411, 8.682 49.411, 8.682 49.412, 8.681 49.412, 8.681 49.411))', 4326),
+     0, 8000),
+    ('way', 3, 1, 2, 3, '2020-02-10', '2020-05-20',
+     '{"building": "yes"}', ROW('history', 'Polygon'),
+     ST_GeomFromText('POLYGON((8.675 49.405, 8.676 49.405, 8.676 49.406, 8.675 49.406, 8.675 49.405))', 4326),
+     0, 8000),
+    ('way', 3, 2, 4, 3, '2020-05-20', 'infinity',
+     '{"building": "yes"}', ROW('deleted', 'Polygon'),
+     ST_GeomFromText('POLYGON((8.675 49.405, 8.676 49.405, 8.676 49.406, 8.675 49.406, 8.675 49.405))', 4326),
+     0, 8000),
+    ('way', 4, 1, 6, 4, '2020-03-01', 'infinity',
+     '{"building": "yes"}', ROW('latest', 'Polygon'),
+     ST_GeomFromText('POLYGON((8.701 49.401, 8.702 49.401, 8.702 49.402, 8.701 49.402, 8.701 49.401))', 4326),
+     0, 8000),
+    ('way', 5, 1, 7, 5, '2020-03-01', 'infinity',
+     '{"highway": "residential"}', ROW('latest', 'LineString'),
+     ST_GeomFromText('LINESTRING(8.671 49.415, 8.689 49.415)', 4326),
+     1300, 0),
+    ('way', 6, 1, 8, 1, '2020-06-20', 'infinity',
+     '{"building": "yes"}', ROW('latest', 'Polygon'),
+     ST_GeomFromText('POLYGON((8.685 49.415, 8.686 49.415, 8.686 49.416, 8.685 49.416, 8.685 49.415))', 4326),
+     0, 8000);
@@ -1,5 +1,5 @@
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 import geojson
 import pytest
@@ -93,6 +93,36 @@ class TestPreprocess:
         assert isinstance(indicator.result.timestamp, datetime)
         assert isinstance(indicator.result.timestamp_osm, datetime)
 
+    @pytest.mark.asyncio
+    async def test_preprocess_ohsomedb(
+        self,
+        topic_building_count,
+        feature_germany_heidelberg,
+        attribute_key,
+        enable_ohsomedb,
+        monkeypatch,
+    ):
+        async def filter_ratio(**_):
+            return [
+                {
+                    "snapshot_ts": datetime.now(timezone.utc),
+                    "value": 20,
+                    "value_attribute": 10,
+                }
+            ]
+
+        enable_ohsomedb("attribute-completeness")
+        monkeypatch.setattr("ohsome_quality_api.ohsomedb.filter_ratio", filter_ratio)
+        indicator = AttributeCompleteness(
+            topic_building_count,
+            feature_germany_heidelberg,
+            attribute_keys=attribute_key,
+        )
+        await indicator.preprocess()
+        assert indicator.absolute_value_1 == 20
+        assert indicator.absolute_value_2 == 10
+        assert isinstance(indicator.result.timestamp_osm, datetime)
+
 
 class TestCalculation:
     @pytest.mark.asyncio
@@ -1,8 +1,10 @@
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock
 
 import asyncpg_recorder
 import pytest
+from geojson import Feature, MultiPolygon
 from pytest_approval.main import verify, verify_plotly
 
 from ohsome_quality_api.config import get_config_value
@@ -75,43 +77,34 @@ def mock_get_building_area_empty(class_mocker):
 
 
 @pytest.fixture
-def mock_get_intersection_geom(class_mocker, feature_germany_heidelberg):
-    async_mock = AsyncMock(return_value=feature_germany_heidelberg)
+def mock_get_intersection_area(class_mocker, feature_germany_heidelberg):
+    async_mock = AsyncMock(return_value=(1.0, feature_germany_heidelberg))
     class_mocker.patch(
-        "ohsome_quality_api.indicators.building_comparison.indicator.db_client.get_intersection_geom",
-        side_effect=async_mock,
-    )
-
-
-@pytest.fixture
-def mock_get_intersection_area(class_mocker):
-    async_mock = AsyncMock(return_value=1.0)
-    class_mocker.patch(
-        "ohsome_quality_api.indicators.building_comparison.indicator.db_client.get_intersection_area",
+        "ohsome_quality_api.indicators.building_comparison.indicator.db_client.get_intersection",
         side_effect=async_mock,
     )
 
 
 @pytest.fixture
 def mock_get_intersection_area_none(class_mocker):
-    async_mock = AsyncMock(return_value=0)
+    async_mock = AsyncMock(return_value=(0, Feature(geometry=MultiPolygon([]))))
     class_mocker.patch(
-        "ohsome_quality_api.indicators.building_comparison.indicator.db_client.get_intersection_area",
+        "ohsome_quality_api.indicators.building_comparison.indicator.db_client.get_intersection",
         side_effect=async_mock,
     )
 
 
 @pytest.fixture
-def mock_get_intersection_area_some(class_mocker):
+def mock_get_intersection_area_some(class_mocker, feature_germany_heidelberg):
     async def side_effect(*args, **kwargs):
         if "eubucco" in args[1]:
-            return 0.0  # 0 %
+            return 0.0, Feature(geometry=MultiPolygon([]))  # 0 %
         else:
-            return 1.0  # 100 %
+            return 1.0, feature_germany_heidelberg  # 100 %
 
     async_mock = AsyncMock(side_effect=side_effect)
     class_mocker.patch(
-        "ohsome_quality_api.indicators.building_comparison.indicator.db_client.get_intersection_area",
+        "ohsome_quality_api.indicators.building_comparison.indicator.db_client.get_intersection",
         side_effect=async_mock,
     )
 
@@ -140,7 +133,6 @@ class TestPreprocess:
     @pytest.mark.usefixtures(
         "mock_get_building_area",
         "mock_get_intersection_area",
-        "mock_get_intersection_geom",
     )
     @asyncpg_recorder.use_cassette
     @oqapi_vcr.use_cassette
@@ -181,7 +173,6 @@ class TestPreprocess:
     @pytest.mark.asyncio
     @pytest.mark.usefixtures(
         "mock_get_building_area",
-        "mock_get_intersection_geom",
         "mock_get_intersection_area_some",
     )
     @asyncpg_recorder.use_cassette
@@ -199,13 +190,57 @@ class TestPreprocess:
         assert isinstance(indicator.result.timestamp, datetime)
         assert isinstance(indicator.result.timestamp_osm, datetime)
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("mock_get_intersection_area")
+    async def test_preprocess_concurrent(
+        self,
+        monkeypatch,
+        topic_building_area,
+        feature_germany_heidelberg,
+    ):
+        """Datasets as well as reference and OSM building area are queried at once."""
+        running = []
+        max_running = []
+
+        async def query(value):
+            running.append(value)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+            return value
+
+        async def get_reference_building_area(*_):
+            return await query(1000000)
+
+        async def ohsome_query(*_):
+            return await query(
+                {"result": [{"value": 1000000, "timestamp": "2024-01-01T00:00:00Z"}]}
+            )
+
+        async def single_snapshot_aggregation(**_):
+            return await query([{"value": 1000000, "snapshot_ts": datetime.now()}])
+
+        module = "ohsome_quality_api.indicators.building_comparison.indicator"
+        monkeypatch.setattr(
+            module + ".get_reference_building_area", get_reference_building_area
+        )
+        monkeypatch.setattr(module + ".ohsome_client.query", ohsome_query)
+        monkeypatch.setattr(
+            module + ".ohsomedb.single_snapshot_aggregation",
+            single_snapshot_aggregation,
+        )
+        indicator = BuildingComparison(topic_building_area, feature_germany_heidelberg)
+        await indicator.preprocess()
+        assert max(max_running) == 2 * len(indicator.data_ref)
+        assert set(indicator.area_ref.values()) == {1.0}
+        assert set(indicator.area_osm.values()) == {1.0}
+
 
 class TestCalculate:
     @pytest.mark.asyncio
     @pytest.mark.usefixtures(
         "mock_get_building_area",
         "mock_get_intersection_area",
-        "mock_get_intersection_geom",
     )
     @asyncpg_recorder.use_cassette
     @oqapi_vcr.use_cassette
@@ -229,7 +264,6 @@ class TestCalculate:
     @pytest.mark.usefixtures(
         "mock_get_building_area_empty",
         "mock_get_intersection_area",
-        "mock_get_intersection_geom",
     )
     @asyncpg_recorder.use_cassette
     @oqapi_vcr.use_cassette
@@ -246,7 +280,6 @@ class TestCalculate:
     @pytest.mark.asyncio
     @pytest.mark.usefixtures(
         "mock_get_intersection_area",
-        "mock_get_intersection_geom",
         "mock_get_building_area_low",
     )
     @asyncpg_recorder.use_cassette
@@ -288,7 +321,6 @@ class TestCalculate:
     @pytest.mark.asyncio
     @pytest.mark.usefixtures(
         "mock_get_building_area",
-        "mock_get_intersection_geom",
         "mock_get_intersection_area_some",
     )
     @asyncpg_recorder.use_cassette
@@ -309,7 +341,6 @@ class TestCalculate:
     @pytest.mark.asyncio
     @pytest.mark.usefixtures(
         "mock_get_building_area",
-        "mock_get_intersection_geom",
         "mock_get_intersection_area",
         "mock_get_building_area_low_some",
     )
@@ -335,7 +366,6 @@ class TestFigure:
     @pytest.mark.asyncio
     @pytest.mark.usefixtures(
         "mock_get_building_area",
-        "mock_get_intersection_geom",
         "mock_get_intersection_area",
     )
     @asyncpg_recorder.use_cassette
@@ -351,7 +381,6 @@ class TestFigure:
     @pytest.mark.asyncio
     @pytest.mark.usefixtures(
         "mock_get_building_area",
-        "mock_get_intersection_geom",
         "mock_get_intersection_area",
     )
     @asyncpg_recorder.use_cassette
@@ -372,7 +401,6 @@ class TestFigure:
     @pytest.mark.asyncio
     @pytest.mark.usefixtures(
         "mock_get_building_area_empty",
-        "mock_get_intersection_geom",
         "mock_get_intersection_area",
     )
     @asyncpg_recorder.use_cassette
@@ -1,6 +1,6 @@
 import json
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import patch
 
 import geojson
@@ -79,6 +79,33 @@ class TestPreprocess:
         assert isinstance(indicator.result.timestamp, datetime)
         assert isinstance(indicator.result.timestamp_osm, datetime)
 
+    async def test_preprocess_ohsomedb(
+        self,
+        topic_building_count,
+        feature_germany_heidelberg,
+        enable_ohsomedb,
+        monkeypatch,
+    ):
+        async def latest_contribution_bins(**_):
+            ends = [datetime(2024, m, 1, tzinfo=timezone.utc) for m in (2, 3, 4)]
+            return [
+                {"end": e, "value": v} for e, v in zip(ends, [1, 0, 3], strict=True)
+            ]
+
+        enable_ohsomedb("currentness")
+        monkeypatch.setattr(
+            "ohsome_quality_api.ohsomedb.latest_contribution_bins",
+            latest_contribution_bins,
+        )
+        indicator = Currentness(topic_building_count, feature_germany_heidelberg)
+        await indicator.preprocess()
+        # latest contributions first
+        assert indicator.bin_total.contrib_abs == [3, 0, 1]
+        assert indicator.contrib_sum == 4
+        assert indicator.result.timestamp_osm == datetime(
+            2024, 4, 1, tzinfo=timezone.utc
+        )
+
 
 @pytest.mark.asyncio
 class TestCalculation:
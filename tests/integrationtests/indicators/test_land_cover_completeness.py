@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 import asyncpg_recorder
 import pytest
 from pytest_approval.main import verify, verify_plotly
@@ -25,6 +27,35 @@ async def test_create_land_cover_completeness_preprocess(
     assert indicator.result.timestamp_osm.strftime("%Y-%m-%d")
 
 
+@pytest.mark.asyncio
+async def test_create_land_cover_completeness_preprocess_ohsomedb(
+    topic_land_cover,
+    feature_germany_heidelberg,
+    enable_ohsomedb,
+    monkeypatch,
+):
+    async def area(_):
+        return 108.0
+
+    async def single_snapshot_aggregation(**_):
+        return [{"snapshot_ts": datetime.now(timezone.utc), "value": 104_000_000}]
+
+    enable_ohsomedb("land-cover-completeness")
+    module = "ohsome_quality_api.indicators.land_cover_completeness.indicator"
+    monkeypatch.setattr(module + ".geodatabase_client.area", area)
+    monkeypatch.setattr(
+        module + ".ohsomedb.single_snapshot_aggregation",
+        single_snapshot_aggregation,
+    )
+    indicator = LandCoverCompleteness(
+        topic=topic_land_cover,
+        feature=feature_germany_heidelberg,
+    )
+    await indicator.preprocess()
+    assert indicator.area_feature == 108
+    assert indicator.area_osm == pytest.approx(104)
+
+
 @pytest.mark.asyncio
 @asyncpg_recorder.use_cassette
 @oqapi_vcr.use_cassette
@@ -1,5 +1,5 @@
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 import numpy as np
 import pytest
@@ -60,6 +60,29 @@ class TestPreprocess:
         for t in indicator.timestamps:
             assert isinstance(t, datetime)
 
+    async def test_preprocess_ohsomedb(
+        self,
+        topic_building_count,
+        feature_germany_heidelberg,
+        enable_ohsomedb,
+        monkeypatch,
+    ):
+        async def monthly_aggregation(**_):
+            timestamps = [datetime(2024, m, 1, tzinfo=timezone.utc) for m in (1, 2)]
+            return [
+                {"timestamp": t, "value": v}
+                for t, v in zip(timestamps, [1, 2], strict=True)
+            ]
+
+        enable_ohsomedb("mapping-saturation")
+        monkeypatch.setattr(
+            "ohsome_quality_api.ohsomedb.monthly_aggregation", monthly_aggregation
+        )
+        indicator = MappingSaturation(topic_building_count, feature_germany_heidelberg)
+        await indicator.preprocess()
+        assert indicator.values == [1, 2]
+        assert indicator.timestamps[-1] == datetime(2024, 2, 1, tzinfo=timezone.utc)
+
 
 @pytest.mark.asyncio
 class TestCalculation:
@@ -268,3 +291,43 @@ async def test_calculate_no_elements(topic_building_count, feature_germany_heide
 
     assert indicator.result.label == "undefined"
     assert indicator.result.class_ is None
+
+
+def test_calculate_batch(
+    topic_building_count,
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Calculation in batch gives the same results as calculation one by one."""
+    monkeypatch.setenv("OQAPI_MAPPING_SATURATION_BACKEND", "numpy")
+    x = np.arange(120)
+    values = [
+        1000 / (1 + np.exp((60 - x) / 10)) + np.sin(x) * 10,
+        2000 / (1 + np.exp((40 - x) / 8)) + np.cos(x) * 20,
+        np.zeros(120),  # Edge case
+    ]
+
+    def create_indicators():
+        indicators = []
+        features = feature_collection_heidelberg_bahnstadt_bergheim_weststadt.features
+        for feature, v in zip(features, values, strict=True):
+            indicator = MappingSaturation(topic_building_count, feature)
+            indicator.values = list(v)
+            indicator.timestamps = [datetime(2020, 1, 1) for _ in v]
+            indicators.append(indicator)
+        return indicators
+
+    indicators = create_indicators()
+    MappingSaturation.calculate_batch(indicators)
+    expected = create_indicators()
+    for indicator in expected:
+        indicator.calculate()
+
+    for indicator, e in zip(indicators, expected, strict=True):
+        assert indicator.result.label == e.result.label
+        assert indicator.result.description == e.result.description
+        if e.best_fit is None:
+            assert indicator.best_fit is None
+            continue
+        assert indicator.best_fit.name == e.best_fit.name
+        assert indicator.result.value == pytest.approx(e.result.value, rel=1e-3)
@@ -1,10 +1,12 @@
 import asyncio
+from unittest import mock
 
 import plotly.graph_objects as pgo
 import plotly.io as pio
 import pytest
 
 from ohsome_quality_api.indicators.minimal.indicator import Minimal
+from ohsome_quality_api.ohsome import client as ohsome_client
 from tests.integrationtests.utils import oqapi_vcr
 
 
@@ -23,6 +25,29 @@ class TestPreprocess:
         asyncio.run(indicator.preprocess())
         assert indicator.count is not None
 
+    def test_preprocess_batch(
+        self,
+        topic_minimal,
+        feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+    ):
+        features = feature_collection_heidelberg_bahnstadt_bergheim_weststadt.features
+        indicators = [Minimal(topic_minimal, feature) for feature in features]
+        results = [
+            {"result": [{"value": i, "timestamp": "2024-01-01T00:00:00Z"}]}
+            for i in range(len(features))
+        ]
+        with mock.patch.object(
+            ohsome_client,
+            "query_group_by_boundary",
+            new_callable=mock.AsyncMock,
+            return_value=results,
+        ) as query:
+            asyncio.run(Minimal.preprocess_batch(indicators))
+        query.assert_awaited_once_with(topic_minimal, features)
+        assert [i.count for i in indicators] == [0, 1, 2]
+        for indicator in indicators:
+            assert indicator.result.timestamp_osm is not None
+
 
 class TestCalculate:
     @pytest.fixture(scope="class")
@@ -17,10 +17,10 @@ from tests.integrationtests.utils import oqapi_vcr
 @pytest.fixture
 def mock_get_matched_roadlengths(class_mocker):
     async def side_effect_function(*args, **kwargs):
-        if args[1] == "oqapi.microsoft_roads_europe_2022_06_08":
-            return 364284, 368139
+        if args[2] == "oqapi.microsoft_roads_europe_2022_06_08":
+            return 1.0, 364284, 368139
         else:
-            return 20, 25  # matched, total
+            return 1.0, 20, 25  # coverage, matched, total
 
     async_mock = AsyncMock(side_effect=side_effect_function)
     class_mocker.patch(
@@ -32,7 +32,7 @@ def mock_get_matched_roadlengths(class_mocker):
 
 @pytest.fixture
 def mock_get_matched_roadlengths_empty(class_mocker):
-    async_mock = AsyncMock(return_value=(None, None))
+    async_mock = AsyncMock(return_value=(1.0, None, None))
     class_mocker.patch(
         "ohsome_quality_api.indicators.road_comparison.indicator."
         "get_matched_roadlengths",
@@ -40,32 +40,12 @@ def mock_get_matched_roadlengths_empty(class_mocker):
     )
 
 
-@pytest.fixture
-def mock_get_intersection_geom(class_mocker, feature_malta):
-    async_mock = AsyncMock(return_value=feature_malta)
-    class_mocker.patch(
-        "ohsome_quality_api.indicators.road_comparison.indicator."
-        "db_client.get_intersection_geom",
-        side_effect=async_mock,
-    )
-
-
-@pytest.fixture
-def mock_get_intersection_area(class_mocker):
-    async_mock = AsyncMock(return_value=1.0)
-    class_mocker.patch(
-        "ohsome_quality_api.indicators.road_comparison.indicator."
-        "db_client.get_intersection_area",
-        side_effect=async_mock,
-    )
-
-
 @pytest.fixture
 def mock_get_intersection_area_none(class_mocker):
-    async_mock = AsyncMock(return_value=0)
+    async_mock = AsyncMock(return_value=(0.0, None, None))
     class_mocker.patch(
         "ohsome_quality_api.indicators.road_comparison.indicator."
-        "db_client.get_intersection_area",
+        "get_matched_roadlengths",
         side_effect=async_mock,
     )
 
@@ -93,11 +73,7 @@ class TestInit:
 
 class TestPreprocess:
     @oqapi_vcr.use_cassette
-    @pytest.mark.usefixtures(
-        "mock_get_matched_roadlengths",
-        "mock_get_intersection_area",
-        "mock_get_intersection_geom",
-    )
+    @pytest.mark.usefixtures("mock_get_matched_roadlengths")
     def test_preprocess(self, topic_major_roads_length, feature_malta):
         indicator = RoadComparison(topic_major_roads_length, feature_malta)
         asyncio.run(indicator.preprocess())
@@ -124,11 +100,7 @@ class TestPreprocess:
 
 class TestCalculate:
     @oqapi_vcr.use_cassette
-    @pytest.mark.usefixtures(
-        "mock_get_matched_roadlengths",
-        "mock_get_intersection_area",
-        "mock_get_intersection_geom",
-    )
+    @pytest.mark.usefixtures("mock_get_matched_roadlengths")
     def test_calculate(
         self,
         topic_major_roads_length,
@@ -144,11 +116,7 @@ class TestCalculate:
         assert verify(indicator.result.description)
 
     @oqapi_vcr.use_cassette
-    @pytest.mark.usefixtures(
-        "mock_get_matched_roadlengths_empty",
-        "mock_get_intersection_area",
-        "mock_get_intersection_geom",
-    )
+    @pytest.mark.usefixtures("mock_get_matched_roadlengths_empty")
     def test_calculate_reference_lenght_0(
         self,
         topic_major_roads_length,
@@ -180,11 +148,7 @@ class TestCalculate:
 
 class TestFigure:
     @oqapi_vcr.use_cassette
-    @pytest.mark.usefixtures(
-        "mock_get_matched_roadlengths",
-        "mock_get_intersection_geom",
-        "mock_get_intersection_area",
-    )
+    @pytest.mark.usefixtures("mock_get_matched_roadlengths")
     def test_create_figure(self, topic_major_roads_length, feature_malta):
         indicator = RoadComparison(topic_major_roads_length, feature_malta)
         asyncio.run(indicator.preprocess())
@@ -194,11 +158,7 @@ class TestFigure:
         assert verify_plotly(indicator.result.figure)
 
     @oqapi_vcr.use_cassette
-    @pytest.mark.usefixtures(
-        "mock_get_matched_roadlengths_empty",
-        "mock_get_intersection_geom",
-        "mock_get_intersection_area",
-    )
+    @pytest.mark.usefixtures("mock_get_matched_roadlengths_empty")
     def test_create_figure_building_area_zero(
         self,
         topic_major_roads_length,
@@ -226,5 +186,9 @@ def test_get_matched_roadlengths():
     )
     # expetced values retrieved by running SQL query without ST_DUMPS
     assert asyncio.run(
-        get_matched_roadlengths(json.dumps(polygon), "microsoft_roads_midpoint")
-    ) == (1502620657, 1969546917)
+        get_matched_roadlengths(
+            json.dumps(polygon),
+            "microsoft_roads_coverage_simple",
+            "microsoft_roads_midpoint",
+        )
+    )[1:] == (1502620657, 1969546917)
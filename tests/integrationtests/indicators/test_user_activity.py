@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 from pytest_approval.main import verify_plotly
@@ -21,6 +21,25 @@ async def test_preprocess(
     assert isinstance(indicator.result.timestamp_osm, datetime)
 
 
+async def test_preprocess_ohsomedb(
+    topic_building_count,
+    feature_germany_heidelberg,
+    enable_ohsomedb,
+    monkeypatch,
+):
+    async def users_per_month(**_):
+        ends = [datetime(2024, m, 1, tzinfo=timezone.utc) for m in (2, 3)]
+        return [{"end": e, "value": v} for e, v in zip(ends, [5, 7], strict=True)]
+
+    enable_ohsomedb("user-activity")
+    monkeypatch.setattr("ohsome_quality_api.ohsomedb.users_per_month", users_per_month)
+    indicator = UserActivity(topic_building_count, feature_germany_heidelberg)
+    await indicator.preprocess()
+    # latest month first
+    assert indicator.bin_total.users_abs == [7, 5]
+    assert indicator.result.timestamp_osm == datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+
 @oqapi_vcr.use_cassette
 async def test_create_figure(topic_building_count, feature_germany_heidelberg):
     indicator = UserActivity(topic_building_count, feature_germany_heidelberg)
@@ -5,6 +5,10 @@ import pytest
 from geojson import Feature
 from pytest_approval.main import verify
 
+from ohsome_quality_api.indicators.building_comparison.indicator import (
+    BuildingComparison,
+)
+from ohsome_quality_api.indicators.currentness.indicator import Currentness
 from ohsome_quality_api.indicators.minimal.indicator import Minimal
 from ohsome_quality_api.indicators.models import (
     IndicatorTemplates,
@@ -101,6 +105,23 @@ class TestBaseIndicator:
         assert isinstance(indicator.result, Result)
         assert verify(indicator.templates.model_dump_json(indent=2))
 
+    def test_get_template_cached(self, feature, topic, monkeypatch):
+        Minimal(feature=feature, topic=topic)
+
+        def load_yaml(*_):
+            raise AssertionError("Templates should not be read again.")
+
+        monkeypatch.setattr("ohsome_quality_api.indicators.base.load_yaml", load_yaml)
+        indicator = Minimal(feature=feature, topic=topic)
+        assert isinstance(indicator.templates, IndicatorTemplates)
+
+    def test_has_preprocess_batch(self, enable_ohsomedb):
+        assert Minimal.has_preprocess_batch()
+        assert not Currentness.has_preprocess_batch()
+        assert BuildingComparison.has_preprocess_batch()
+        enable_ohsomedb("building-comparison")
+        assert not BuildingComparison.has_preprocess_batch()
+
 
 class TestBaseResult:
     def test_label(self):
@@ -1,15 +1,45 @@
 import asyncio
 
+import asyncpg
 import geojson
 import pytest
+import pytest_asyncio
 from geojson import Feature
 from pytest_approval import verify
 
 import ohsome_quality_api.geodatabase.client as db_client
+from ohsome_quality_api.config import get_config_value
 
 pytestmark = pytest.mark.skip("dependency on database setup.")
 
 
+@pytest_asyncio.fixture
+async def pool(monkeypatch):
+    dsn = "postgres://{user}:{password}@{host}:{port}/{database}".format(
+        host=get_config_value("postgres_host"),
+        port=get_config_value("postgres_port"),
+        database=get_config_value("postgres_db"),
+        user=get_config_value("postgres_user"),
+        password=get_config_value("postgres_password"),
+    )
+    kwargs = db_client.get_pool_kwargs("oqapidb") | {"min_size": 1, "max_size": 1}
+    async with asyncpg.create_pool(
+        dsn, init=db_client.init_connection, **kwargs
+    ) as pool:
+        monkeypatch.setattr(db_client, "OQAPIDB_POOL", pool, raising=False)
+        yield pool
+
+
+@pytest.mark.asyncio
+async def test_get_connection_reused(pool):
+    """The same database backend serves consecutive connections of the pool."""
+    pids = []
+    for _ in range(3):
+        async with db_client.get_connection() as conn:
+            pids.append(await conn.fetchval("SELECT pg_backend_pid()"))
+    assert len(set(pids)) == 1
+
+
 def test_get_connection():
     async def _test_get_connection():
         async with db_client.get_connection() as conn:
@@ -115,6 +145,17 @@ def test_get_coverage_intersection(feature_germany_heidelberg):
     assert isinstance(result, geojson.feature.Feature)
 
 
+def test_get_intersection(feature_germany_heidelberg):
+    area_ratio, feature = asyncio.run(
+        db_client.get_intersection(
+            feature_germany_heidelberg,
+            "eubucco_coverage_simple",
+        )
+    )
+    assert pytest.approx(1.0, 0.1) == area_ratio
+    assert feature["geometry"].is_valid
+
+
 @pytest.mark.asyncio
 async def test_area(feature_germany_heidelberg):
     result = await db_client.area(feature_germany_heidelberg)
@@ -1,11 +1,17 @@
 import asyncio
+import math
 from unittest import mock
 
 import asyncpg_recorder
 import pytest
 
 from ohsome_quality_api import main
+from ohsome_quality_api.indicators.mapping_saturation.indicator import (
+    MappingSaturation,
+)
+from ohsome_quality_api.indicators.minimal.indicator import Minimal
 from ohsome_quality_api.topics.models import TopicData
+from ohsome_quality_api.utils import result_cache
 from tests.integrationtests.utils import oqapi_vcr
 
 # TODO: add user-activity and land-cover-... indicators (ohsomedb)
@@ -77,6 +83,7 @@ async def test_create_indicator_public_feature_collection_single(
 def test_create_indicator_public_feature_collection_multi(
     feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
     topic_minimal,
+    query_group_by_boundary_per_feature,
 ):
     """Test create indicators for a feature collection with multiple features."""
     indicators = asyncio.run(
@@ -164,3 +171,193 @@ def test_create_indicator_size_limit_bpolys_data(bpolys):
         },
     )
     asyncio.run(main.create_indicator("mapping-saturation", bpolys, topic))
+
+
+@mock.patch.dict("os.environ", {"OQAPI_MAPPING_SATURATION_BACKEND": "numpy"})
+def test_create_indicator_mapping_saturation_batch(
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+):
+    """Mapping Saturation of multiple features is calculated in batch."""
+    topic = TopicData(
+        key="key",
+        name="name",
+        description="description",
+        data={
+            "result": [
+                {
+                    "value": 1000 / (1 + math.exp((60 - i) / 10)),
+                    "timestamp": "2020-03-20T01:30:08.180856",
+                }
+                for i in range(120)
+            ]
+        },
+    )
+    with mock.patch.object(
+        MappingSaturation,
+        "calculate_batch",
+        autospec=True,
+        side_effect=MappingSaturation.calculate_batch,
+    ) as calculate_batch:
+        indicators = asyncio.run(
+            main.create_indicator(
+                "mapping-saturation",
+                feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+                topic,
+            )
+        )
+    calculate_batch.assert_called_once()
+    assert len(indicators) == 3
+    for indicator in indicators:
+        assert indicator.result.value is not None
+        assert indicator.result.figure is not None
+
+
+def test_create_indicator_result_cache(
+    monkeypatch,
+    topic_minimal,
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+):
+    """Results are only computed once for each feature and version of OSM data."""
+    monkeypatch.setenv("OQAPI_RESULT_CACHE_SIZE", "10")
+    monkeypatch.setattr(result_cache, "RESULT_CACHE", None)
+    monkeypatch.setattr(main, "get_result_cache", result_cache.get_result_cache)
+    version = mock.AsyncMock(return_value="2024-01-01T00:00:00Z")
+    monkeypatch.setattr(main, "get_data_version", version)
+
+    preprocessed = []
+
+    async def preprocess_batch(indicators):
+        for indicator in indicators:
+            indicator.count = 1
+        preprocessed.extend(indicators)
+
+    monkeypatch.setattr(Minimal, "preprocess_batch", preprocess_batch)
+    for _ in range(2):
+        indicators = asyncio.run(
+            main.create_indicator(
+                "minimal",
+                feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+                topic_minimal,
+            )
+        )
+        assert len(indicators) == 3
+        assert [i.result.value for i in indicators] == [1.0, 1.0, 1.0]
+    assert len(preprocessed) == 3
+    # New version of OSM data invalidates cached results
+    version.return_value = "2024-01-02T00:00:00Z"
+    asyncio.run(
+        main.create_indicator(
+            "minimal",
+            feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+            topic_minimal,
+        )
+    )
+    assert len(preprocessed) == 6
+
+
+def test_create_indicator_result_cache_reference_data(
+    monkeypatch,
+    topic_roads,
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+):
+    """Results computed only from reference data do not need the OSM data version."""
+    monkeypatch.setenv("OQAPI_RESULT_CACHE_SIZE", "10")
+    monkeypatch.setattr(result_cache, "RESULT_CACHE", None)
+    monkeypatch.setattr(main, "get_result_cache", result_cache.get_result_cache)
+    version = mock.AsyncMock(side_effect=AssertionError)
+    monkeypatch.setattr(main, "get_data_version", version)
+    create_indicators = mock.AsyncMock(return_value=[])
+    monkeypatch.setattr(main, "_create_indicators", create_indicators)
+    asyncio.run(
+        main.create_indicator(
+            "roads-thematic-accuracy",
+            feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+            topic_roads,
+        )
+    )
+    create_indicators.assert_awaited_once()
+    version.assert_not_called()
+
+
+def test_create_indicator_progress(
+    monkeypatch,
+    topic_minimal,
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+):
+    """Progress is reported for each computed feature."""
+
+    async def preprocess_batch(indicators):
+        for indicator in indicators:
+            indicator.count = 1
+
+    monkeypatch.setattr(Minimal, "preprocess_batch", preprocess_batch)
+    progress = []
+    asyncio.run(
+        main.create_indicator(
+            "minimal",
+            feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+            topic_minimal,
+            progress=lambda indicators: progress.append(len(indicators)),
+        )
+    )
+    assert progress == [1, 1, 1]
+
+
+def test_create_indicator_stream(
+    monkeypatch,
+    topic_minimal,
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+):
+    async def preprocess_batch(indicators):
+        for indicator in indicators:
+            indicator.count = 1
+
+    async def collect():
+        return [
+            indicator
+            async for indicator in main.create_indicator_stream(
+                "minimal",
+                feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+                topic_minimal,
+            )
+        ]
+
+    monkeypatch.setattr(Minimal, "preprocess_batch", preprocess_batch)
+    indicators = asyncio.run(collect())
+    assert sorted(i.feature["id"] for i in indicators) == [0, 1, 2]
+
+    async def raise_error(_):
+        raise ValueError()
+
+    monkeypatch.setattr(Minimal, "preprocess_batch", raise_error)
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+
+
+def test_create_indicator_stream_completion_order(
+    monkeypatch,
+    topic_minimal,
+    feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+):
+    """Indicators are yielded as soon as the feature is computed."""
+
+    async def preprocess(self):
+        # The first feature takes longest to preprocess
+        await asyncio.sleep(0.1 * (2 - self.feature["id"]))
+        self.count = 1
+
+    async def collect():
+        return [
+            indicator
+            async for indicator in main.create_indicator_stream(
+                "minimal",
+                feature_collection_heidelberg_bahnstadt_bergheim_weststadt,
+                topic_minimal,
+            )
+        ]
+
+    # Preprocess each feature on its own
+    monkeypatch.setattr(Minimal, "has_preprocess_batch", classmethod(lambda _: False))
+    monkeypatch.setattr(Minimal, "preprocess", preprocess)
+    indicators = asyncio.run(collect())
+    assert [i.feature["id"] for i in indicators] == [2, 1, 0]
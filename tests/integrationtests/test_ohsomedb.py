@@ -0,0 +1,113 @@
+"""Tests of ohsomeDB queries against a local PostGIS.
+
+The contributions table is created from a fixture. Tests are skipped if no database is
+running (see `ohsomedb_*` configuration).
+"""
+
+import os
+from datetime import date, datetime, timezone
+
+import asyncpg
+import pytest
+import pytest_asyncio
+from geojson_pydantic import Polygon
+
+from ohsome_quality_api import ohsomedb
+from ohsome_quality_api.config import get_config_value, reload_config
+from tests.integrationtests.utils import FIXTURE_DIR
+
+AOI = Polygon(
+    type="Polygon",
+    coordinates=[
+        [(8.67, 49.40), (8.69, 49.40), (8.69, 49.42), (8.67, 49.42), (8.67, 49.40)]
+    ],
+)
+
+
+@pytest_asyncio.fixture
+async def contributions(monkeypatch):
+    dsn = "postgres://{user}:{password}@{host}:{port}/{database}".format(
+        host=get_config_value("ohsomedb_host"),
+        port=get_config_value("ohsomedb_port"),
+        database=get_config_value("ohsomedb_db"),
+        user=get_config_value("ohsomedb_user"),
+        password=get_config_value("ohsomedb_password"),
+    )
+    try:
+        connection = await asyncpg.connect(dsn)
+    except OSError:
+        pytest.skip("dependency on database setup.")
+    with open(os.path.join(FIXTURE_DIR, "ohsomedb", "contributions.sql")) as file:
+        await connection.execute(file.read())
+    monkeypatch.setenv("OHSOMEDB_CONTRIBUTIONS_TABLE", "ohsomedb_fixture.contributions")
+    reload_config()
+    try:
+        yield
+    finally:
+        await connection.execute("DROP SCHEMA ohsomedb_fixture CASCADE")
+        await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_monthly_aggregation(contributions):
+    result = await ohsomedb.monthly_aggregation(
+        aggregation="count",
+        bpolys=AOI,
+        filter_="building=*",
+        start="2020-01-01",
+        end="2021-06-01",
+    )
+    assert len(result) == 18
+    assert result[0]["timestamp"] == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert result[-1]["timestamp"] == datetime(2021, 6, 1, tzinfo=timezone.utc)
+    # Deleted and outside features are not counted
+    assert [r["value"] for r in result[:8]] == [0, 1, 2, 2, 2, 1, 3, 3]
+    assert result[-1]["value"] == 3
+
+
+@pytest.mark.asyncio
+async def test_latest_contribution_bins(contributions):
+    result = await ohsomedb.latest_contribution_bins(
+        aggregation="count",
+        bpolys=AOI,
+        filter_="building=*",
+        start=date(2020, 1, 1),
+        end=date(2021, 6, 1),
+    )
+    assert len(result) == 17
+    assert result[-1]["end"] == datetime(2021, 6, 1, tzinfo=timezone.utc)
+    values = {r["start"].strftime("%Y-%m"): r["value"] for r in result}
+    assert values.pop("2020-06") == 2
+    assert values.pop("2021-03") == 1
+    assert set(values.values()) == {0}
+
+
+@pytest.mark.asyncio
+async def test_users_per_month(contributions):
+    result = await ohsomedb.users_per_month(
+        bpolys=AOI,
+        filter_="building=*",
+        start=date(2020, 1, 1),
+        end=date(2021, 6, 1),
+    )
+    assert len(result) == 17
+    values = {r["start"].strftime("%Y-%m"): r["value"] for r in result}
+    # Deletions count as contributions. Users are counted once per month.
+    assert values.pop("2020-01") == 1
+    assert values.pop("2020-02") == 1
+    assert values.pop("2020-05") == 1
+    assert values.pop("2020-06") == 1
+    assert values.pop("2021-03") == 1
+    assert set(values.values()) == {0}
+
+
+@pytest.mark.asyncio
+async def test_filter_ratio(contributions):
+    result = await ohsomedb.filter_ratio(
+        aggregation="count",
+        bpolys=AOI,
+        filter_="building=*",
+        attribute_filter="height=*",
+    )
+    assert result[0]["value"] == 3
+    assert result[0]["value_attribute"] == 1
@@ -0,0 +1,65 @@
+import asyncio
+
+from geojson import Feature, FeatureCollection, Polygon
+
+from ohsome_quality_api.api import coverage_cache
+from ohsome_quality_api.api.coverage_cache import (
+    CoverageCache,
+    SimplifyLevel,
+    encode,
+    etag_matches,
+)
+
+
+def test_encode():
+    feature_collection = FeatureCollection(
+        features=[
+            Feature(
+                geometry=Polygon(
+                    [[(0, 0), (1, 0.0001), (2, 0), (2, 2), (0, 2), (0, 0)]]
+                )
+            )
+        ]
+    )
+    encoded = encode(feature_collection)
+    assert encoded.etag.startswith('"')
+    simplified = encode(feature_collection, tolerance=0.001)
+    assert len(simplified.body) < len(encoded.body)
+    assert simplified.etag != encoded.etag
+
+
+def test_etag_matches():
+    assert etag_matches('"a"', '"a"')
+    assert etag_matches('"b", W/"a"', '"a"')
+    assert etag_matches("*", '"a"')
+    assert not etag_matches('"b"', '"a"')
+    assert not etag_matches(None, '"a"')
+
+
+def test_coverage_cache(monkeypatch):
+    calls = []
+
+    async def build_response(key, inverse, level):
+        calls.append((key, inverse, level))
+        await asyncio.sleep(0)
+        return encode(FeatureCollection(features=[]))
+
+    monkeypatch.setattr(coverage_cache, "build_response", build_response)
+
+    async def _test():
+        cache = CoverageCache()
+        first, second = await asyncio.gather(
+            cache.get("minimal", False, SimplifyLevel.none, ttl=60),
+            cache.get("minimal", False, SimplifyLevel.none, ttl=60),
+        )
+        assert first is second
+        await cache.get("minimal", False, SimplifyLevel.none, ttl=60)
+        assert len(calls) == 1
+        await cache.get("minimal", False, SimplifyLevel.high, ttl=60)
+        assert len(calls) == 2
+        # Disabled cache
+        await cache.get("minimal", True, SimplifyLevel.none, ttl=0)
+        await cache.get("minimal", True, SimplifyLevel.none, ttl=0)
+        assert len(calls) == 4
+
+    asyncio.run(_test())
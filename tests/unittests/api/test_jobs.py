@@ -0,0 +1,128 @@
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+
+from ohsome_quality_api.api.jobs import Job, JobQueue
+from ohsome_quality_api.utils.exceptions import OhsomeApiError
+
+
+@pytest.fixture
+def queue(tmp_path) -> JobQueue:
+    return JobQueue(size=2, workers=1, path=str(tmp_path))
+
+
+async def wait_for(queue: JobQueue, job: Job) -> Job:
+    while not job.is_finished:
+        await asyncio.sleep(0)
+    return queue.get(job.id)
+
+
+async def wait_until_running(job: Job) -> None:
+    while job.status != "running":
+        await asyncio.sleep(0)
+
+
+def test_submit(queue):
+    async def run(job: Job) -> bytes:
+        for _ in range(job.total):
+            job.progress(1)
+            await asyncio.sleep(0)
+        return b'{"result": []}'
+
+    async def main():
+        job = queue.submit("minimal", 3, run, "application/json")
+        assert job.status == "queued"
+        assert queue.get(job.id) is job
+        return await wait_for(queue, job)
+
+    job = asyncio.run(main())
+    assert job.status == "succeeded"
+    assert (job.done, job.total) == (3, 3)
+    assert job.finished is not None
+    # Finished jobs and results are read from disk
+    queue = JobQueue(size=2, workers=1, path=queue.path)
+    assert queue.get(job.id) == job
+    assert queue.result(job.id) == b'{"result": []}'
+
+
+def test_submit_failed(queue):
+    async def run(_: Job) -> bytes:
+        raise OhsomeApiError("Timeout")
+
+    async def main():
+        return await wait_for(queue, queue.submit("minimal", 1, run, "a"))
+
+    job = asyncio.run(main())
+    assert job.status == "failed"
+    assert job.error == {"type": "OhsomeApiError", "detail": [{"msg": "Timeout"}]}
+    assert queue.result(job.id) is None
+
+
+def test_submit_queue_full(queue):
+    async def run(_: Job) -> bytes:
+        await asyncio.Event().wait()
+
+    async def main():
+        # One job is running, two are queued
+        await wait_until_running(queue.submit("minimal", 1, run, "a"))
+        for _ in range(2):
+            queue.submit("minimal", 1, run, "a")
+        with pytest.raises(asyncio.QueueFull):
+            queue.submit("minimal", 1, run, "a")
+        await queue.close()
+
+    asyncio.run(main())
+
+
+def test_cancel(queue):
+    async def run(_: Job) -> bytes:
+        await asyncio.Event().wait()
+
+    async def main():
+        running = queue.submit("minimal", 1, run, "a")
+        queued = queue.submit("minimal", 1, run, "a")
+        await wait_until_running(running)
+        assert queued.status == "queued"
+        await queue.cancel(queued.id)
+        await queue.cancel(running.id)
+        return running, queued
+
+    running, queued = asyncio.run(main())
+    assert queue.get(running.id).status == "cancelled"
+    assert queue.get(queued.id).status == "cancelled"
+    # Cancelling a finished job deletes it
+    asyncio.run(queue.cancel(running.id))
+    assert queue.get(running.id) is None
+
+
+def test_get_unknown(queue):
+    assert queue.get("00000000-0000-0000-0000-000000000000") is None
+    with pytest.raises(ValueError):
+        queue.get("../result-cache")
+
+
+@pytest.mark.parametrize("ttl,kept", [(60, ["recent"]), (0, ["expired", "recent"])])
+def test_clean_up(tmp_path, ttl, kept):
+    queue = JobQueue(size=2, workers=1, path=str(tmp_path), ttl=ttl)
+    ids = {"expired": str(uuid.uuid4()), "recent": str(uuid.uuid4())}
+    for name, id_ in ids.items():
+        for suffix in ("json", "result"):
+            path = tmp_path / "{0}.{1}".format(id_, suffix)
+            path.write_text("{}")
+            if name == "expired":
+                finished = time.time() - 120
+                os.utime(path, (finished, finished))
+    asyncio.run(queue.clean_up())
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        "{0}.{1}".format(ids[name], suffix)
+        for name in kept
+        for suffix in ("json", "result")
+    )
+
+
+def test_clean_up_missing_directory(tmp_path):
+    queue = JobQueue(size=2, workers=1, path=str(tmp_path / "jobs"), ttl=60)
+    asyncio.run(queue.clean_up())
@@ -9,6 +9,7 @@ from ohsome_quality_api.api.request_models import (
     AttributeCompletenessKeyRequest,
     BaseBpolys,
     IndicatorRequest,
+    IndicatorsRequest,
     LandCoverThematicAccuracyRequest,
     RoadsThematicAccuracyRequest,
 )
@@ -59,6 +60,24 @@ def test_indicator_request_minimal(bpolys, topic_key_minimal):
     IndicatorRequest(bpolys=bpolys, topic=topic_key_minimal)
 
 
+def test_indicators_request(bpolys):
+    request = IndicatorsRequest(
+        bpolys=bpolys,
+        topic="building-count",
+        indicators=["mapping-saturation", "currentness", "mapping-saturation"],
+    )
+    assert request.indicator_keys == ["mapping-saturation", "currentness"]
+
+
+def test_indicators_request_invalid_combination(bpolys):
+    with pytest.raises(ValidationError):
+        IndicatorsRequest(
+            bpolys=bpolys,
+            topic="building-count",
+            indicators=["mapping-saturation", "road-comparison"],
+        )
+
+
 @pytest.mark.usefixtures("mock_request_context_minimal")
 def test_indicator_request_invalid_indicator_topic_combination(
     bpolys, topic_key_building_count
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from ohsome_quality_api.indicators.mapping_saturation import batch, models
+
+from . import fixtures
+
+MODELS = (
+    models.Sigmoid,
+    models.SSlogis,
+    models.SSdoubleS,
+    models.SSfpl,
+    models.SSasymp,
+    models.SSmicmen,
+)
+
+
+@pytest.fixture
+def ydata():
+    return np.array([fixtures.VALUES_1, fixtures.VALUES_1 * 2])
+
+
+@pytest.fixture
+def xdata(ydata):
+    return np.arange(ydata.shape[1])
+
+
+def test_fit(xdata, ydata):
+    fitted_models = batch.fit(xdata, ydata)
+    assert len(fitted_models) == 2
+    # SSdoubleS can not be fitted to the first time series (R fails as well)
+    assert [type(m) for m in fitted_models[0]] == [
+        models.Sigmoid,
+        models.SSlogis,
+        models.SSfpl,
+        models.SSasymp,
+        models.SSmicmen,
+    ]
+    for fm in fitted_models:
+        for model in fm:
+            assert model.fitted_values.shape == xdata.shape
+            assert np.all(np.isfinite(model.fitted_values))
+            assert model.asym_conf_int[0] <= model.asymptote
+            assert model.asymptote <= model.asym_conf_int[1]
+            assert model.mae >= 0
+
+
+def test_fit_scaled_series(xdata, ydata):
+    first, second = batch.fit(xdata, ydata)
+    # Models without shift of the data by 1 (see `models.SSmicmen`) are scale-invariant
+    first = [m for m in first if type(m) not in (models.SSdoubleS, models.SSmicmen)]
+    second = [m for m in second if type(m) not in (models.SSdoubleS, models.SSmicmen)]
+    for a, b in zip(first, second, strict=True):
+        np.testing.assert_allclose(b.asymptote, a.asymptote * 2, rtol=1e-3)
+        np.testing.assert_allclose(b.mae, a.mae * 2, rtol=1e-3)
+
+
+@pytest.mark.parametrize("values", [fixtures.VALUES_1, fixtures.VALUES_2])
+def test_fit_equivalence_with_native(monkeypatch, values):
+    """Batch fit and single fit by the native backend find the same solutions."""
+    monkeypatch.setenv("OQAPI_MAPPING_SATURATION_BACKEND", "numpy")
+    xdata = np.arange(len(values))
+    (fitted_models,) = batch.fit(xdata, np.array([values]))
+    batch_models = {type(m): m for m in fitted_models}
+    for model in MODELS[1:]:
+        try:
+            expected = model(xdata, values)
+        except RuntimeError:
+            assert model not in batch_models
+            continue
+        np.testing.assert_allclose(
+            batch_models[model].asymptote, expected.asymptote, rtol=1e-3
+        )
+        np.testing.assert_allclose(
+            batch_models[model].fitted_values, expected.fitted_values, rtol=1e-2
+        )
+
+
+def test_fit_as_dict(xdata, ydata):
+    model = batch.fit(xdata, ydata)[0][0]
+    assert list(model.as_dict().keys()) == [
+        "name",
+        "function_formula",
+        "asymptote",
+        "mae",
+        "xdata",
+        "ydata",
+        "coefficients",
+        "fitted_values",
+    ]
+    assert list(model.coefficients.keys()) == ["x_0", "k", "L"]
+
+
+def test_fit_constant_series(xdata):
+    fitted_models = batch.fit(xdata, np.full((1, len(xdata)), 100))
+    for model in fitted_models[0]:
+        assert type(model) is models.Sigmoid
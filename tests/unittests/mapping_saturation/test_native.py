@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from rpy2.rinterface_lib.embedded import RRuntimeError
+
+from ohsome_quality_api.indicators.mapping_saturation import models, native
+
+from . import fixtures
+
+XDATA_1 = np.array(range(len(fixtures.VALUES_1)))
+XDATA_2 = np.array(range(len(fixtures.VALUES_2)))
+
+# Native implementation, R formula and name of the asymptote
+MODELS = {
+    "sslogis": (native.sslogis, "y ~ SSlogis(x, Asym, xmid, scal)", "Asym"),
+    "ssdoubles": (native.ssdoubles, "y ~ SSdoubleS(x, e, f, k, b, Z, c)", "Z"),
+    "ssfpl": (native.ssfpl, "y ~ SSfpl(x, A, B, xmid, scal)", "B"),
+    "ssasymp": (native.ssasymp, "y ~ SSasymp(x, asym, R0, lrc)", "asym"),
+    "ssmicmen": (native.ssmicmen, "y ~ SSmicmen(x, Vm, K)", "Vm"),
+}
+
+# Position of the asymptote in the coefficients
+ASYMPTOTE = {"sslogis": 0, "ssdoubles": 4, "ssfpl": 1, "ssasymp": 0, "ssmicmen": 0}
+
+# Time series which can not be modeled (R raises an `RRuntimeError`)
+FAILING = {("ssdoubles", 1), ("ssfpl", 2)}
+
+SERIES = {1: (XDATA_1, fixtures.VALUES_1), 2: (XDATA_2, fixtures.VALUES_2)}
+
+
+def get_series(model: str, series: int) -> tuple[np.ndarray, np.ndarray]:
+    xdata, ydata = SERIES[series]
+    if model in ("ssdoubles", "ssmicmen"):
+        # Model classes add 1 because those models fail on zeros
+        return xdata + 1, ydata + 1
+    return xdata, ydata
+
+
+CASES = [(m, s) for m in MODELS for s in SERIES if (m, s) not in FAILING]
+
+
+@pytest.mark.parametrize("model,series", CASES)
+def test_fit(model, series):
+    fit, _, _ = MODELS[model]
+    xdata, ydata = get_series(model, series)
+    coef, asym_conf_int, fitted_values = fit(xdata, ydata)
+    assert np.all(np.isfinite(coef))
+    assert fitted_values.shape == ydata.shape
+    assert np.all(np.isfinite(fitted_values))
+    lower, upper = asym_conf_int
+    assert lower <= coef[ASYMPTOTE[model]] <= upper
+
+
+@pytest.mark.parametrize("model,series", sorted(FAILING))
+def test_fit_singular(model, series):
+    fit, _, _ = MODELS[model]
+    with pytest.raises(native.NativeFitError):
+        fit(*get_series(model, series))
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_fit_too_few_data_points(model):
+    fit, _, _ = MODELS[model]
+    with pytest.raises(native.NativeFitError):
+        fit(np.array([1, 2]), np.array([1, 2]))
+    with pytest.raises(native.NativeFitError):
+        fit(np.array([1, 2, 3, 4]), np.array([5, 5, 5, 5]))
+
+
+@pytest.mark.parametrize("model,series", CASES)
+def test_equivalence_with_r(model, series):
+    fit, formula, asym = MODELS[model]
+    xdata, ydata = get_series(model, series)
+    coef, asym_conf_int, fitted_values = fit(xdata, ydata)
+    coef_r, asym_conf_int_r, fitted_values_r = models.fit_nls(
+        formula, asym, xdata, ydata
+    )
+    position = ASYMPTOTE[model]
+    np.testing.assert_allclose(coef[position], coef_r[position], rtol=1e-3)
+    np.testing.assert_allclose(fitted_values, fitted_values_r, rtol=1e-2)
+    # Wald and profile likelihood intervals differ but overlap
+    assert asym_conf_int[0] <= asym_conf_int_r[1]
+    assert asym_conf_int_r[0] <= asym_conf_int[1]
+
+
+@pytest.mark.parametrize("model,series", sorted(FAILING))
+def test_equivalence_with_r_singular(model, series):
+    _, formula, asym = MODELS[model]
+    with pytest.raises(RRuntimeError):
+        models.fit_nls(formula, asym, *get_series(model, series))
+
+
+def test_backend_numpy(monkeypatch):
+    monkeypatch.setenv("OQAPI_MAPPING_SATURATION_BACKEND", "numpy")
+    model = models.SSlogis(XDATA_1, fixtures.VALUES_1)
+    assert set(model.coefficients) == {"Asym", "xmid", "scal"}
+    assert model.asym_conf_int[0] <= model.asymptote <= model.asym_conf_int[1]
+    with pytest.raises(native.NativeFitError):
+        models.SSdoubleS(XDATA_1, fixtures.VALUES_1)
+
+
+def test_backend_invalid(monkeypatch):
+    monkeypatch.setenv("OQAPI_MAPPING_SATURATION_BACKEND", "foo")
+    with pytest.raises(ValueError):
+        models.SSlogis(XDATA_1, fixtures.VALUES_1)
@@ -0,0 +1,62 @@
+import time
+
+import numpy as np
+import pytest
+from rpy2.rinterface_lib.embedded import RRuntimeError
+
+from ohsome_quality_api.indicators.mapping_saturation import r_worker
+
+
+def fit(formula, asym, xdata, ydata):
+    match formula:
+        case "sleep":
+            time.sleep(10)
+        case "r-error":
+            raise RRuntimeError("singular gradient")
+        case "error":
+            raise ValueError("foo")
+    return np.array([ydata.max(), 1.0]), np.array([0.0, 1.0]), xdata + ydata
+
+
+@pytest.fixture
+def pool():
+    pool = r_worker.RWorkerPool(size=1, timeout=5, max_fits=2, fit=fit)
+    yield pool
+    pool.shutdown()
+
+
+def test_fit(pool):
+    coef, asym_conf_int, fitted_values = pool.fit(
+        "y ~ x", "asym", np.array([0, 1, 2]), np.array([1.5, 2.5, 3.5])
+    )
+    np.testing.assert_array_equal(coef, [3.5, 1.0])
+    np.testing.assert_array_equal(asym_conf_int, [0.0, 1.0])
+    np.testing.assert_array_equal(fitted_values, [1.5, 3.5, 5.5])
+
+
+def test_fit_error(pool):
+    with pytest.raises(RRuntimeError):
+        pool.fit("r-error", "asym", np.array([0]), np.array([0]))
+    with pytest.raises(r_worker.RWorkerError):
+        pool.fit("error", "asym", np.array([0]), np.array([0]))
+
+
+def test_fit_timeout(pool):
+    pool.timeout = 0.5
+    worker = pool.idle.queue[0]
+    with pytest.raises(r_worker.RWorkerTimeoutError):
+        pool.fit("sleep", "asym", np.array([0]), np.array([0]))
+    assert not worker.process.is_alive()
+    # Killed worker has been replaced
+    pool.timeout = 5
+    coef, _, _ = pool.fit("y ~ x", "asym", np.array([0]), np.array([1]))
+    assert coef[0] == 1
+
+
+def test_worker_recycling(pool):
+    worker = pool.idle.queue[0]
+    for _ in range(3):
+        pool.fit("y ~ x", "asym", np.array([0]), np.array([1]))
+    assert not worker.process.is_alive()
+    assert pool.idle.queue[0] is not worker
+    assert pool.idle.queue[0].fits == 1
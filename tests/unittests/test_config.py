@@ -9,6 +9,7 @@ from ohsome_quality_api import config
 class TestConfig(unittest.TestCase):
     def setUp(self):
         self.keys = {
+            "ohsomedb_indicators",
             "ohsomedb_host",
             "ohsomedb_port",
             "ohsomedb_db",
@@ -16,16 +17,43 @@ class TestConfig(unittest.TestCase):
             "ohsomedb_password",
             "ohsomedb_contributions_table",
             "ohsomedb_search_path",
+            "ohsomedb_pool_min_size",
+            "ohsomedb_pool_max_size",
             "postgres_host",
             "postgres_port",
             "postgres_db",
             "postgres_user",
             "postgres_password",
+            "postgres_pool_min_size",
+            "postgres_pool_max_size",
+            "pool_max_inactive_connection_lifetime",
+            "pool_statement_cache_size",
+            "coverage_index_ttl",
+            "coverage_cache_ttl",
             "data_dir",
             "geom_size_limit",
             "log_level",
             "ohsome_api",
+            "ohsome_api_max_connections",
+            "ohsome_api_max_keepalive_connections",
+            "ohsome_api_keepalive_expiry",
+            "ohsome_api_http2",
+            "ohsome_api_metadata_ttl",
             "concurrent_computations",
+            "concurrency_ohsome_api",
+            "concurrency_ohsomedb",
+            "concurrency_oqapidb",
+            "concurrency_cpu",
+            "executor",
+            "r_workers",
+            "r_fit_timeout",
+            "r_worker_max_fits",
+            "mapping_saturation_backend",
+            "result_cache_size",
+            "result_cache_disk",
+            "job_workers",
+            "job_queue_size",
+            "job_ttl",
             "user_agent",
             "datasets",
         }
@@ -102,7 +130,34 @@ class TestConfig(unittest.TestCase):
     def test_get_config_value(self):
         for key in self.keys:
             val = config.get_config_value(key)
-            assert isinstance(val, (int, str, dict))
+            assert isinstance(val, (int, float, str, dict))
+
+    @mock.patch.dict("os.environ", {}, clear=True)
+    def test_get_config_cached(self):
+        self.assertIs(config.get_config(), config.get_config())
+
+    @mock.patch.dict(
+        "os.environ",
+        {
+            "OQAPI_GEOM_SIZE_LIMIT": "200",
+            "OQAPI_OHSOMEDB_ENABLED": "true",
+            "POSTGRES_PORT": "5432",
+        },
+        clear=True,
+    )
+    def test_get_config_coerced(self):
+        self.assertEqual(config.get_config_value("geom_size_limit"), 200.0)
+        self.assertIs(config.get_config_value("ohsomedb_enabled"), True)
+        self.assertEqual(config.get_config_value("postgres_port"), 5432)
+
+    @mock.patch.dict("os.environ", {}, clear=True)
+    def test_reload_config(self):
+        self.assertEqual(config.get_config_value("geom_size_limit"), 1000)
+        with mock.patch.dict("os.environ", {"OQAPI_GEOM_SIZE_LIMIT": "200"}):
+            # Cached snapshot is still in use
+            self.assertEqual(config.get_config_value("geom_size_limit"), 1000)
+            config.reload_config()
+            self.assertEqual(config.get_config_value("geom_size_limit"), 200)
 
     @mock.patch.dict(
         "os.environ",
@@ -0,0 +1,226 @@
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+
+import pytest
+from geojson import Feature, Point
+
+from ohsome_quality_api.geodatabase import client as db_client
+from ohsome_quality_api.geodatabase import wkb
+from ohsome_quality_api.geodatabase.coverage import (
+    CoverageIndex,
+    CoverageIndexCache,
+    bounds,
+)
+
+# Keep reference to original function.
+# The function is monkeypatched by an autouse fixture (see `tests/conftest.py`).
+get_connection = db_client.get_connection
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+    @contextmanager
+    def query_logger(self, callback):
+        yield
+
+
+class FakePool:
+    def __init__(self):
+        self.connection = FakeConnection()
+        self.acquired = 0
+        self.released = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquired += 1
+        try:
+            yield self.connection
+        finally:
+            self.released += 1
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(db_client, "OQAPIDB_POOL", pool, raising=False)
+    return pool
+
+
+def test_get_connection_reuse(pool):
+    async def _test():
+        connections = []
+        for _ in range(3):
+            async with get_connection() as conn:
+                connections.append(conn)
+        return connections
+
+    connections = asyncio.run(_test())
+    assert all(c is pool.connection for c in connections)
+    assert not pool.connection.closed
+    assert pool.acquired == 3
+    assert pool.released == 3
+
+
+def test_get_pool_kwargs():
+    kwargs = db_client.get_pool_kwargs("oqapidb")
+    assert kwargs["min_size"] == 10
+    assert kwargs["max_size"] == 10
+    assert kwargs["max_inactive_connection_lifetime"] == 300
+    assert "setup" not in kwargs
+    assert kwargs["statement_cache_size"] == 100
+
+    kwargs = db_client.get_pool_kwargs("ohsomedb")
+    assert kwargs["min_size"] == 5
+    assert kwargs["max_size"] == 30
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        {"type": "Point", "coordinates": [8.67, 49.41]},
+        {"type": "Point", "coordinates": []},
+        {"type": "LineString", "coordinates": [[0.0, 0.0, 1.0], [1.0, 1.0, 2.0]]},
+        {
+            "type": "Polygon",
+            "coordinates": [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]],
+        },
+        {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]],
+                [
+                    [[2.0, 2.0], [3.0, 2.0], [3.0, 3.0], [2.0, 2.0]],
+                    [[2.1, 2.1], [2.2, 2.1], [2.2, 2.2], [2.1, 2.1]],
+                ],
+            ],
+        },
+        {"type": "MultiPolygon", "coordinates": []},
+        {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "Point", "coordinates": [1.0, 2.0]},
+                {"type": "MultiLineString", "coordinates": [[[0.0, 0.0], [1.0, 1.0]]]},
+            ],
+        },
+    ],
+)
+def test_wkb_round_trip(geometry):
+    assert wkb.decode(wkb.encode(geometry)) == geometry
+
+
+def test_wkb_encode():
+    # EWKB of `SRID=4326;POINT(1 2)` as returned by PostGIS `ST_AsEWKB`
+    expected = "0101000020e6100000000000000000f03f0000000000000040"
+    assert wkb.encode(Point(coordinates=(1, 2))).hex() == expected
+
+
+def test_wkb_decode_big_endian_iso():
+    # ISO WKB of `POINT Z(1 2 3)` in big-endian byte order
+    data = bytes.fromhex("00000003e93ff000000000000040000000000000004008000000000000")
+    assert wkb.decode(data) == {"type": "Point", "coordinates": [1.0, 2.0, 3.0]}
+
+
+@pytest.fixture
+def coverage_index() -> CoverageIndex:
+    # Square with a square hole
+    return CoverageIndex(
+        [
+            {
+                "type": "Polygon",
+                "coordinates": [
+                    [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]],
+                    [[4, 4], [6, 4], [6, 6], [4, 6], [4, 4]],
+                ],
+            }
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "bbox,relation",
+    [
+        ((20, 20, 30, 30), "disjoint"),
+        ((4.5, 4.5, 5.5, 5.5), "disjoint"),  # within hole
+        ((1, 1, 2, 2), "within"),
+        ((1, 1, 9, 3), "within"),
+        ((-1, -1, 1, 1), "overlaps"),
+        ((3, 3, 7, 7), "overlaps"),  # contains hole
+        ((-1, -1, 11, 11), "overlaps"),  # contains coverage
+        ((-1, 1, 1, 11), "overlaps"),  # no vertex of coverage within bbox
+    ],
+)
+def test_coverage_index_relate(coverage_index, bbox, relation):
+    assert coverage_index.relate(bbox) == relation
+
+
+def test_coverage_bounds():
+    geometry = {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+            [[[2, -1], [3, 2], [3, 3], [2, -1]]],
+        ],
+    }
+    assert bounds(geometry) == (0, -1, 3, 3)
+    assert bounds({"type": "Point", "coordinates": [0, 0]}) is None
+
+
+def test_coverage_index_cache():
+    calls = []
+
+    async def load(table_name, column):
+        calls.append((table_name, column))
+        await asyncio.sleep(0)
+        return [{"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}]
+
+    async def _test():
+        cache = CoverageIndexCache(load)
+        first, second = await asyncio.gather(
+            cache.get("foo", "geom", ttl=60),
+            cache.get("foo", "geom", ttl=60),
+        )
+        assert first is second
+        assert len(calls) == 1
+        # Expired index is still returned while it is refreshed in the background
+        assert await cache.get("foo", "geom", ttl=0) is first
+        await cache.tasks[("foo", "geom")]
+        assert len(calls) == 2
+        assert cache.indices[("foo", "geom")] is not first
+
+    asyncio.run(_test())
+
+
+@pytest.mark.parametrize(
+    "coordinates,relation",
+    [
+        ([[[1, 1], [2, 1], [2, 2], [1, 1]]], "within"),
+        ([[[20, 20], [30, 20], [30, 30], [20, 20]]], "disjoint"),
+        ([[[-1, -1], [1, -1], [1, 1], [-1, -1]]], "overlaps"),
+    ],
+)
+def test_relate_to_coverage(monkeypatch, coordinates, relation):
+    async def load(table_name, column):
+        return [
+            {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]],
+            }
+        ]
+
+    monkeypatch.setenv("OQAPI_COVERAGE_INDEX_TTL", "60")
+    monkeypatch.setattr(db_client, "COVERAGE_INDEX_CACHE", CoverageIndexCache(load))
+    feature = Feature(geometry={"type": "Polygon", "coordinates": coordinates})
+    assert asyncio.run(db_client.relate_to_coverage(feature, "foo")) == relation
+
+
+def test_relate_to_coverage_disabled(monkeypatch, feature_germany_heidelberg):
+    monkeypatch.setenv("OQAPI_COVERAGE_INDEX_TTL", "0")
+    relation = asyncio.run(
+        db_client.relate_to_coverage(feature_germany_heidelberg, "foo")
+    )
+    assert relation == "overlaps"
@@ -1,6 +1,8 @@
 import asyncio
 import unittest
+from unittest import mock
 
+from ohsome_quality_api import config
 from ohsome_quality_api.utils import helper_asyncio
 
 
@@ -46,3 +48,117 @@ class TestHelper(unittest.TestCase):
         exceptions = helper_asyncio.filter_exceptions(results)
         assert len(exceptions) == 1
         assert isinstance(exceptions[0], ValueError)
+
+    @mock.patch.dict("os.environ", {"OQAPI_CONCURRENT_COMPUTATIONS": "2"})
+    def test_gather_with_semaphore_concurrent_computations(self):
+        config.reload_config()
+        running = 0
+        max_running = 0
+
+        async def task():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(running, max_running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        tasks = [*self.tasks, *(task() for _ in range(6))]
+        asyncio.run(helper_asyncio.gather_with_semaphore(tasks))
+        assert max_running == 2
+
+
+class TestBudget(unittest.TestCase):
+    @mock.patch.dict("os.environ", {"OQAPI_CONCURRENCY_OHSOME_API": "2"})
+    def test_acquire(self):
+        config.reload_config()
+        budget = helper_asyncio.Budget("ohsome-api", "concurrency_ohsome_api")
+        occupancies = []
+
+        async def task():
+            async with budget.acquire():
+                occupancies.append(budget.occupancy())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*(task() for _ in range(4)))
+
+        asyncio.run(main())
+        assert max(o["inUse"] for o in occupancies) == 2
+        assert occupancies[0]["limit"] == 2
+        assert budget.occupancy() == {"limit": 2, "inUse": 0, "waiting": 0}
+        # Budget can be used in another event loop
+        asyncio.run(main())
+
+    def test_get_occupancy(self):
+        occupancy = helper_asyncio.get_occupancy()
+        assert set(occupancy) == {"ohsome-api", "ohsomedb", "oqapidb", "cpu"}
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_do(self):
+        single_flight = helper_asyncio.SingleFlight("test")
+        calls = []
+
+        async def func(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return {"value": value}
+
+        async def main():
+            return await asyncio.gather(
+                *(single_flight.do(("key", 1), func, 1) for _ in range(3)),
+                single_flight.do(("key", 2), func, 2),
+            )
+
+        results = asyncio.run(main())
+        assert calls == [1, 2]
+        assert results == [{"value": 1}] * 3 + [{"value": 2}]
+        # Each caller receives its own copy of a shared result
+        assert results[0] is not results[1]
+        assert single_flight.counters() == {"calls": 4, "coalesced": 2}
+        # Calls which are not in-flight anymore are not shared
+        asyncio.run(main())
+        assert calls == [1, 2, 1, 2]
+
+    def test_do_exception(self):
+        single_flight = helper_asyncio.SingleFlight("test")
+
+        async def func():
+            await asyncio.sleep(0.01)
+            raise ValueError()
+
+        async def main():
+            return await asyncio.gather(
+                *(single_flight.do("key", func) for _ in range(2)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, ValueError) for r in results)
+        assert single_flight.counters() == {"calls": 2, "coalesced": 1}
+
+    def test_do_share_calls(self):
+        single_flight = helper_asyncio.SingleFlight("test")
+        calls = []
+
+        async def func(value):
+            calls.append(value)
+            return {"value": value}
+
+        async def main():
+            with helper_asyncio.share_calls():
+                first = await single_flight.do("key", func, 1)
+                first["value"] = 2
+                # Completed calls are shared inside of the scope
+                second = await single_flight.do("key", func, 1)
+            third = await single_flight.do("key", func, 1)
+            return second, third
+
+        second, third = asyncio.run(main())
+        assert calls == [1, 1]
+        assert second == third == {"value": 1}
+        assert single_flight.counters() == {"calls": 3, "coalesced": 1}
+
+    def test_get_coalescing(self):
+        coalescing = helper_asyncio.get_coalescing()
+        assert set(coalescing) == {"ohsome-api", "database"}
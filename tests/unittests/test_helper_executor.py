@@ -0,0 +1,66 @@
+import asyncio
+import operator
+import pickle
+import threading
+from unittest import mock
+
+import pytest
+from fastapi_i18n import _
+from geojson import Feature, Polygon
+
+from ohsome_quality_api import config
+from ohsome_quality_api.indicators.minimal.indicator import Minimal
+from ohsome_quality_api.topics.definitions import get_topic_preset
+from ohsome_quality_api.utils import helper_executor
+
+
+@pytest.fixture(autouse=True)
+def shutdown_executor():
+    helper_executor.shutdown_executor()
+    yield
+    helper_executor.shutdown_executor()
+
+
+def test_run_cpu_bound_thread():
+    result, thread = asyncio.run(
+        helper_executor.run_cpu_bound(
+            lambda: (operator.add(1, 2), threading.current_thread())
+        )
+    )
+    assert result == 3
+    assert thread is not threading.main_thread()
+
+
+def test_run_cpu_bound_thread_translated(locale_de):
+    result = asyncio.run(helper_executor.run_cpu_bound(_, "Height of Buildings"))
+    assert result == "Gebäudehöhe"
+
+
+@mock.patch.dict("os.environ", {"OQAPI_EXECUTOR": "inline"})
+def test_run_cpu_bound_inline():
+    config.reload_config()
+    thread = asyncio.run(helper_executor.run_cpu_bound(threading.current_thread))
+    assert thread is threading.main_thread()
+
+
+@mock.patch.dict("os.environ", {"OQAPI_EXECUTOR": "process"})
+def test_run_cpu_bound_process():
+    config.reload_config()
+    result = asyncio.run(helper_executor.run_cpu_bound(operator.add, 1, 2))
+    assert result == 3
+
+
+@mock.patch.dict("os.environ", {"OQAPI_EXECUTOR": "foo"})
+def test_get_executor_invalid():
+    config.reload_config()
+    with pytest.raises(ValueError):
+        helper_executor.get_executor()
+
+
+def test_indicator_picklable():
+    feature = Feature(
+        geometry=Polygon([[(8.67, 49.41), (8.68, 49.41), (8.68, 49.42), (8.67, 49.41)]])
+    )
+    indicator = Minimal(topic=get_topic_preset("minimal"), feature=feature)
+    copy = pickle.loads(pickle.dumps(indicator))  # noqa: S301
+    assert copy.as_dict() == indicator.as_dict()
@@ -1,9 +1,41 @@
+import numpy as np
 import pytest
 
-from ohsome_quality_api.utils.helper_geo import calculate_area
+from ohsome_quality_api.utils.helper_geo import (
+    calculate_area,
+    douglas_peucker,
+    simplify,
+)
 
 
 def test_calculate_area(feature_germany_heidelberg):
     expected = 108852960.62891776  # derived from PostGIS ST_AREA
     result = calculate_area(feature_germany_heidelberg)
     assert result == pytest.approx(expected, abs=1e-3)
+
+
+def test_douglas_peucker():
+    points = np.array(
+        [[0, 0], [1, 0.05], [2, -0.05], [3, 5], [4, 6], [5, 7.01], [6, 8]]
+    )
+    result = douglas_peucker(points, tolerance=0.1)
+    assert result.tolist() == [[0, 0], [2, -0.05], [3, 5], [6, 8]]
+    assert douglas_peucker(points, tolerance=0).tolist() == points.tolist()
+
+
+def test_simplify_polygon():
+    ring = [[0, 0], [1, 0.001], [2, 0], [2, 2], [1, 2.001], [0, 2], [0, 0]]
+    hole = [[0.5, 0.5], [0.6, 0.5], [0.55, 0.6], [0.5, 0.5]]
+    geometry = {"type": "Polygon", "coordinates": [ring, hole]}
+    result = simplify(geometry, tolerance=0.01)
+    assert result == {
+        "type": "Polygon",
+        "coordinates": [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]], hole],
+    }
+
+
+def test_simplify_collapsed_ring():
+    # Ring would collapse to less than four positions
+    ring = [[0, 0], [1, 0], [1, 0.001], [0.5, 0.001], [0, 0]]
+    geometry = {"type": "MultiPolygon", "coordinates": [[ring]]}
+    assert simplify(geometry, tolerance=0.01) == geometry
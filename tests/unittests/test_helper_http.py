@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from ohsome_quality_api.utils import helper_http
+
+
+def test_get_client_outside_of_lifespan():
+    async def _test():
+        async with helper_http.get_client() as client_1:
+            assert isinstance(client_1, httpx.AsyncClient)
+        async with helper_http.get_client() as client_2:
+            assert isinstance(client_2, httpx.AsyncClient)
+        assert client_1.is_closed
+        assert client_2.is_closed
+        assert client_1 is not client_2
+
+    asyncio.run(_test())
+
+
+def test_get_client_during_lifespan():
+    async def _test():
+        app = FastAPI()
+        async with helper_http.create_client_for_lifespan(app) as shared:
+            async with helper_http.get_client() as client_1:
+                assert client_1 is shared
+            async with helper_http.get_client() as client_2:
+                assert client_2 is shared
+            assert not shared.is_closed
+            assert app.state.http_client is shared
+        assert shared.is_closed
+        assert helper_http.CLIENT is None
+
+    asyncio.run(_test())
+
+
+def test_build_limits():
+    limits = helper_http.build_limits()
+    assert limits.max_connections == 100
+    assert limits.max_keepalive_connections == 20
+    assert limits.keepalive_expiry == 5
+
+
+def test_build_client_http2(monkeypatch):
+    monkeypatch.setenv("OQAPI_OHSOME_API_HTTP2", "true")
+
+    async def _test():
+        async with helper_http.build_client(("https://example.org",)) as client:
+            assert isinstance(client, httpx.AsyncClient)
+
+    asyncio.run(_test())
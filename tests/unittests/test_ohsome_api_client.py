@@ -0,0 +1,89 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from ohsome_quality_api.ohsome_api import client
+from ohsome_quality_api.utils.exceptions import OhsomeApiError
+
+pytestmark = pytest.mark.asyncio
+
+METADATA = {"temporalExtent": {"latestTimestamp": "2024-01-01T00:00:00Z"}}
+METADATA_NEW = {"temporalExtent": {"latestTimestamp": "2024-01-02T00:00:00Z"}}
+
+
+@pytest.fixture
+def request_(monkeypatch):
+    async def request(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return METADATA
+
+    mock_ = mock.AsyncMock(side_effect=request)
+    monkeypatch.setattr(client, "request", mock_)
+    return mock_
+
+
+async def test_metadata_single_flight(request_):
+    results = await asyncio.gather(*[client.metadata() for _ in range(10)])
+    assert results == [METADATA] * 10
+    request_.assert_awaited_once()
+    assert await client.metadata() == METADATA
+    request_.assert_awaited_once()
+    assert client.METADATA_CACHE.misses == 10
+    assert client.METADATA_CACHE.hits == 1
+
+
+async def test_metadata_stale_while_refresh(request_):
+    await client.metadata()
+    client.METADATA_CACHE.fetched_at -= 301
+    request_.side_effect = None
+    request_.return_value = METADATA_NEW
+    # Stale metadata is returned while a refresh runs in the background
+    assert await client.metadata() == METADATA
+    await client.METADATA_CACHE.task
+    assert await client.metadata() == METADATA_NEW
+    assert request_.await_count == 2
+    assert client.METADATA_CACHE.stale == 1
+
+
+async def test_metadata_refresh_failed(request_):
+    await client.metadata()
+    client.METADATA_CACHE.fetched_at -= 301
+    request_.side_effect = OhsomeApiError("Querying the ohsome API failed!")
+    assert await client.metadata() == METADATA
+    await asyncio.sleep(0)
+    assert await client.metadata() == METADATA
+
+
+async def test_metadata_failed(request_):
+    request_.side_effect = OhsomeApiError("Querying the ohsome API failed!")
+    with pytest.raises(OhsomeApiError):
+        await client.metadata()
+    request_.side_effect = None
+    request_.return_value = METADATA
+    assert await client.metadata() == METADATA
+
+
+async def test_metadata_disabled(monkeypatch, request_):
+    monkeypatch.setenv("OQAPI_OHSOME_API_METADATA_TTL", "0")
+    await client.metadata()
+    await client.metadata()
+    assert request_.await_count == 2
+
+
+async def test_features_series_end(monkeypatch):
+    metadata = mock.AsyncMock(return_value=METADATA)
+    features = mock.AsyncMock(
+        return_value={
+            "timestamp": ["2008-01-01T00:00:00Z", "2024-01-01T00:00:00Z"],
+            "value": [1, 10],
+        }
+    )
+    monkeypatch.setattr(client, "metadata", metadata)
+    monkeypatch.setattr(client, "features", features)
+    result = await client.features_series_end({}, "count", "building=*")
+    assert result == {"timestamp": "2024-01-01T00:00:00Z", "value": 10}
+    assert features.await_args.kwargs["time_series"] == {
+        "start": "2008-01-01",
+        "end": "2024-01-01",
+    }
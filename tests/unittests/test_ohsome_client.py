@@ -191,6 +191,40 @@ class TestOhsomeClientQuery(TestCase):
             )
 
 
+class TestOhsomeClientQueryGroupByBoundary(TestCase):
+    def setUp(self) -> None:
+        self.topic = get_topic_fixture("building-count")
+        feature = get_geojson_fixture("heidelberg-altstadt-feature.geojson")
+        self.features = [feature, feature, feature]
+
+    def test_query_group_by_boundary(self) -> None:
+        response = {
+            "groupByResult": [
+                {
+                    "result": [{"timestamp": "2018-01-01T00:00:00Z", "value": i}],
+                    "groupByObject": str(i),
+                }
+                # Order of groups is not guaranteed
+                for i in (2, 0, 1)
+            ]
+        }
+        with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = httpx.Response(
+                200,
+                json=response,
+                request=httpx.Request("POST", "https://www.example.org/"),
+            )
+            results = asyncio.run(
+                ohsome_client.query_group_by_boundary(self.topic, self.features)
+            )
+        mock_request.assert_called_once()
+        url = mock_request.call_args.args[0]
+        self.assertTrue(url.endswith("/elements/count/groupBy/boundary"))
+        bpolys = geojson.loads(mock_request.call_args.kwargs["data"]["bpolys"])
+        self.assertEqual([f["id"] for f in bpolys["features"]], ["0", "1", "2"])
+        self.assertEqual([r["result"][0]["value"] for r in results], [0, 1, 2])
+
+
 class TestOhsomeClientBuildUrl(TestCase):
     def setUp(self) -> None:
         self.ohsome_api = "https://api.ohsome.org/v1"
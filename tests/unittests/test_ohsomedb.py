@@ -0,0 +1,103 @@
+import asyncio
+import functools
+from datetime import date
+from unittest import mock
+
+import pytest
+
+from ohsome_quality_api import ohsomedb
+from ohsome_quality_api.ohsomedb import requests
+
+BPOLYS = {
+    "type": "Polygon",
+    "coordinates": [[[8.67, 49.40], [8.69, 49.40], [8.69, 49.42], [8.67, 49.40]]],
+}
+
+
+@pytest.fixture
+def fetch(monkeypatch):
+    fetch = mock.AsyncMock(return_value=[])
+    monkeypatch.setattr(requests.client, "fetch", fetch)
+    return fetch
+
+
+@mock.patch.dict(
+    "os.environ",
+    {
+        "OQAPI_OHSOMEDB_ENABLED": "true",
+        "OQAPI_OHSOMEDB_INDICATORS": "currentness, user-activity",
+    },
+)
+def test_is_enabled():
+    assert ohsomedb.is_enabled("currentness")
+    assert ohsomedb.is_enabled("user-activity")
+    assert not ohsomedb.is_enabled("mapping-saturation")
+
+
+@mock.patch.dict("os.environ", {"OQAPI_OHSOMEDB_INDICATORS": "currentness"})
+def test_is_enabled_ohsomedb_disabled():
+    assert not ohsomedb.is_enabled("currentness")
+
+
+def test_monthly_aggregation(fetch):
+    asyncio.run(
+        ohsomedb.monthly_aggregation(
+            aggregation="area",
+            bpolys=BPOLYS,
+            filter_="building=*",
+            start="2008-06-29",
+            end="2026-06-01",
+        )
+    )
+    query, *args = fetch.call_args.args
+    # Filter arguments are followed by geometry, start and end
+    assert args[0] == "building"
+    assert args[2:] == [date(2008, 6, 29), date(2026, 6, 1)]
+    assert "ST_GeomFromGeoJSON($2)" in query
+    assert "c.area" in query
+    assert fetch.call_args.kwargs == {"database": "ohsomedb"}
+
+
+def test_users_per_month(fetch):
+    asyncio.run(
+        ohsomedb.users_per_month(
+            bpolys=BPOLYS,
+            filter_="type:way and highway=residential",
+            start=date(2008, 6, 29),
+            end=date(2026, 6, 1),
+        )
+    )
+    query, *args = fetch.call_args.args
+    assert len(args) == 5
+    assert "$5::date" in query
+    assert "COUNT(DISTINCT c.user_id)" in query
+
+
+def test_filter_ratio(fetch):
+    asyncio.run(
+        ohsomedb.filter_ratio(
+            aggregation="count",
+            bpolys=BPOLYS,
+            filter_="building=*",
+            attribute_filter="height=* or building:levels=*",
+        )
+    )
+    query, *args = fetch.call_args.args
+    # Arguments of the attribute filter are shifted by the arguments of the filter
+    assert args[:3] == ["building", "height", "building:levels"]
+    assert "tags ? $2" in query
+    assert "ST_GeomFromGeoJSON($4)" in query
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        requests.single_snapshot_aggregation,
+        functools.partial(requests.filter_ratio, attribute_filter="height=*"),
+    ],
+)
+def test_snapshot_ts(fetch, request_):
+    # Snapshot time is timezone-aware like timestamps of the ohsome API
+    asyncio.run(request_(aggregation="count", bpolys=BPOLYS, filter_="building=*"))
+    query = fetch.call_args.args[0]
+    assert "NOW() AS snapshot_ts" in query
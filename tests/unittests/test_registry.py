@@ -0,0 +1,73 @@
+from fastapi_i18n.main import Translator, translator
+
+from ohsome_quality_api.attributes.models import Attribute
+from ohsome_quality_api.projects.models import Project
+from ohsome_quality_api.utils import registry as registry_module
+from ohsome_quality_api.utils.registry import load_sql, registry, translate
+
+
+def test_registry_parsed_once():
+    calls = []
+
+    @registry
+    def load():
+        calls.append(None)
+        return {"foo": Project(name="Foo", description="Bar")}
+
+    assert load() is load()
+    assert len(calls) == 1
+
+
+def test_registry_untranslated(locale_de):
+    # Translator set for the current request should not leak into the registry
+    @registry
+    def load():
+        return {
+            "height": Attribute(
+                filter="height=*",
+                name="Height of Buildings",
+                description="TODO",
+            )
+        }
+
+    assert translator.get()
+    attribute = load()["height"]
+    assert attribute.name == "Height of Buildings"
+    assert translate(attribute).name == "Gebäudehöhe"
+
+
+def test_translate_copy():
+    token = translator.set(Translator(locale="en"))
+    project = Project(name="Core", description="Core topics")
+    translated = translate(project)
+    assert translated == project
+    assert translated is not project
+    translator.reset(token)
+
+
+def test_load_sql():
+    query = load_sql("ohsome_quality_api.geodatabase", "select_coverage.sql")
+    assert "{table_name}" in query
+    assert query is load_sql("ohsome_quality_api.geodatabase", "select_coverage.sql")
+
+
+def test_load_sql_identifiers():
+    query = load_sql(
+        "ohsome_quality_api.geodatabase", "select_coverage.sql", table_name="foo"
+    )
+    assert "{table_name}" not in query
+    assert "foo" in query
+    assert query is load_sql(
+        "ohsome_quality_api.geodatabase", "select_coverage.sql", table_name="foo"
+    )
+
+
+def test_load_all_sql(monkeypatch):
+    loaded = []
+    monkeypatch.setattr(registry_module, "load_sql", lambda *args: loaded.append(args))
+    registry_module.load_all_sql()
+    assert ("ohsome_quality_api.geodatabase", "select_area.sql") in loaded
+    assert (
+        "ohsome_quality_api.indicators.roads_thematic_accuracy",
+        "queries/lanes.sql",
+    ) in loaded
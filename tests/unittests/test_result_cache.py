@@ -0,0 +1,148 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+from geojson import Feature
+
+from ohsome_quality_api.indicators.models import Result
+from ohsome_quality_api.topics.definitions import get_topic_preset
+from ohsome_quality_api.utils import result_cache
+from ohsome_quality_api.utils.result_cache import ResultCache, build_key
+
+VERSION = "2024-01-01T00:00:00Z"
+VERSION_NEW = "2024-01-02T00:00:00Z"
+
+
+@pytest.fixture
+def result() -> Result:
+    return Result(
+        description="description",
+        timestamp_osm=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        value=0.5,
+        class_=3,
+        figure={"data": [{"x": [1, 2]}]},
+    )
+
+
+@pytest.fixture
+def feature() -> Feature:
+    return Feature(
+        geometry={"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]}
+    )
+
+
+@pytest.fixture
+def topic():
+    return get_topic_preset("building-count")
+
+
+@pytest.mark.asyncio
+async def test_get_set(result):
+    cache = ResultCache(size=10)
+    assert await cache.get("a", VERSION) is None
+    await cache.set("a", VERSION, result)
+    cached = await cache.get("a", VERSION)
+    assert cached == result
+    assert cached is not result
+    assert cached.label == "yellow"
+
+
+@pytest.mark.asyncio
+async def test_size(result):
+    cache = ResultCache(size=2)
+    await cache.set("a", VERSION, result)
+    await cache.set("b", VERSION, result)
+    await cache.get("a", VERSION)
+    await cache.set("c", VERSION, result)
+    assert await cache.get("a", VERSION) is not None
+    assert await cache.get("b", VERSION) is None
+    assert await cache.get("c", VERSION) is not None
+
+
+@pytest.mark.asyncio
+async def test_new_version(result):
+    cache = ResultCache(size=10)
+    await cache.set("a", VERSION, result)
+    assert await cache.get("a", VERSION_NEW) is None
+    # Results computed from outdated data are not cached
+    await cache.set("a", VERSION, result)
+    assert await cache.get("a", VERSION) is None
+    assert await cache.get("a", VERSION_NEW) is None
+
+
+@pytest.mark.asyncio
+async def test_disk(tmpdir, result):
+    path = os.path.join(tmpdir, "cache.sqlite")
+    await ResultCache(size=10, path=path).set("a", VERSION, result)
+    cache = ResultCache(size=10, path=path)
+    assert await cache.get("a", VERSION) == result
+    assert await ResultCache(size=10, path=path).get("a", VERSION_NEW) is None
+    assert await ResultCache(size=10, path=path).get("a", VERSION) is None
+
+
+def test_get_result_cache_disabled(monkeypatch):
+    monkeypatch.setattr(result_cache, "RESULT_CACHE", None)
+    monkeypatch.setenv("OQAPI_RESULT_CACHE_SIZE", "0")
+    assert result_cache.get_result_cache() is None
+
+
+def test_get_result_cache_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(result_cache, "RESULT_CACHE", None)
+    monkeypatch.delenv("OQAPI_RESULT_CACHE_SIZE", raising=False)
+    assert result_cache.get_result_cache() is None
+
+
+def test_get_result_cache_disk(monkeypatch, tmpdir):
+    monkeypatch.setattr(result_cache, "RESULT_CACHE", None)
+    monkeypatch.setenv("OQAPI_RESULT_CACHE_SIZE", "10")
+    monkeypatch.setenv("OQAPI_RESULT_CACHE_DISK", "true")
+    monkeypatch.setenv("OQAPI_DATA_DIR", str(tmpdir))
+    cache = result_cache.get_result_cache()
+    assert cache.size == 10
+    assert cache.path == os.path.join(tmpdir, result_cache.FILENAME)
+    assert result_cache.get_result_cache() is cache
+
+
+def test_build_key(topic, feature):
+    key = build_key("mapping-saturation", topic, feature, True)
+    assert key == build_key("mapping-saturation", topic, feature, True)
+    assert key != build_key("currentness", topic, feature, True)
+    assert key != build_key("mapping-saturation", topic, feature, False)
+    assert key != build_key(
+        "mapping-saturation", get_topic_preset("roads"), feature, True
+    )
+
+
+def test_build_key_geometry(topic, feature):
+    key = build_key("minimal", topic, feature, True)
+    # Order of keys of the GeoJSON does not matter
+    reordered = Feature(
+        geometry={
+            "coordinates": feature["geometry"]["coordinates"],
+            "type": "Polygon",
+        }
+    )
+    assert key == build_key("minimal", topic, reordered, True)
+    moved = Feature(
+        geometry={"type": "Polygon", "coordinates": [[[0, 0], [2, 0], [2, 2], [0, 0]]]}
+    )
+    assert key != build_key("minimal", topic, moved, True)
+
+
+def test_build_key_parameters(topic, feature):
+    key = build_key("attribute-completeness", topic, feature, True)
+    key_height = build_key(
+        "attribute-completeness", topic, feature, True, attribute_keys=["height"]
+    )
+    assert key != key_height
+    assert key_height != build_key(
+        "attribute-completeness", topic, feature, True, attribute_keys=["roof-shape"]
+    )
+
+
+def test_build_key_custom_filter(feature):
+    topic = get_topic_preset("custom-topic")
+    topic.filter = "building=yes and geometry:polygon"
+    key = build_key("minimal", topic, feature, True)
+    topic.filter = "building=house and geometry:polygon"
+    assert key != build_key("minimal", topic, feature, True)
@@ -50,3 +50,13 @@ def test_get_topic_definitions_with_project():
 def test_get_topic_preset_translated(locale_de):
     topic = definitions.get_topic_preset("minimal")
     assert verify(topic.model_dump_json(indent=2))
+
+
+def test_load_topic_presets_parsed_once():
+    assert definitions._load_topic_presets() is definitions._load_topic_presets()
+
+
+def test_get_topic_preset_copy():
+    topic = definitions.get_topic_preset("custom-topic")
+    topic.name = "Fountains"
+    assert definitions.get_topic_preset("custom-topic").name != "Fountains"